@@ -1,3 +1,4 @@
+import asyncio
 import os
 import json
 import shlex
@@ -5,6 +6,8 @@ import logging
 import subprocess
 import socket
 import shutil
+import threading
+import time
 from collections import deque
 from io import StringIO
 from functools import lru_cache
@@ -48,6 +51,11 @@ try:  # pragma: no cover - exercised when optional dependencies are installed
     from proxmoxer.core import ResourceException
 except ModuleNotFoundError:  # pragma: no cover - unit tests use lightweight fallback
     from ._proxmoxer_fallback import ProxmoxAPI, ResourceException  # type: ignore
+try:  # pragma: no cover - exercised when optional dependencies are installed
+    import orjson  # noqa: F401 - presence check for the faster JSON encoder
+    from fastapi.responses import ORJSONResponse
+except (ModuleNotFoundError, ImportError):  # pragma: no cover - optional dependency
+    ORJSONResponse = None  # type: ignore[assignment, misc]
 try:  # pragma: no cover - exercised when optional dependencies are installed
     import paramiko
 except ModuleNotFoundError:  # pragma: no cover - unit tests use lightweight fallback
@@ -174,7 +182,13 @@ def _lxc_password_min_length() -> int:
 # ─────────────────────────────────────────────
 # FastAPI
 # ─────────────────────────────────────────────
-app = FastAPI(title="Universal LLM Controller", version="2.1.0")
+# Ендпойнти на кшталт /ssh/run чи /lxc/exec повертають багатомегабайтні
+# stdout/stderr; orjson серіалізує такі відповіді в рази швидше за stdlib json.
+_APP_KWARGS: Dict[str, Any] = {"title": "Universal LLM Controller", "version": "2.1.0"}
+if ORJSONResponse is not None:
+    _APP_KWARGS["default_response_class"] = ORJSONResponse
+
+app = FastAPI(**_APP_KWARGS)
 
 BLISS_OPENAPI_ENV = os.getenv("BLISS_OPENAPI_PATH")
 _BLISS_OPENAPI_CANDIDATES: Tuple[Path, ...] = (
@@ -1037,6 +1051,72 @@ def _ssh_pct_list() -> List[Dict[str, Any]]:
         )
 
 
+_CAPTURE_CAP_BYTES = 16 * 1024 * 1024
+_TRUNCATION_MARKER = "\n...[truncated]\n"
+
+
+def _read_capped(stream, cap: int) -> Tuple[bytes, bool]:
+    """Read *stream* to EOF keeping at most *cap* bytes.
+
+    The stream is always drained so the child never blocks on a full pipe;
+    bytes past the cap are discarded and the truncation flag is set.
+    """
+
+    buf = bytearray()
+    truncated = False
+    while True:
+        chunk = stream.read(65536)
+        if not chunk:
+            break
+        if truncated:
+            continue
+        remaining = cap - len(buf)
+        if len(chunk) > remaining:
+            buf += chunk[:remaining]
+            truncated = True
+        else:
+            buf += chunk
+    return bytes(buf), truncated
+
+
+def _run_capped(cmd: List[str], *, timeout: int, cap: int = _CAPTURE_CAP_BYTES) -> subprocess.CompletedProcess:
+    """Run *cmd* like ``subprocess.run(capture_output=True)`` with bounded buffers.
+
+    A runaway remote command (e.g. a chatty ``pct exec`` step) can otherwise
+    buffer gigabytes into the controller; each stream is capped at *cap*
+    bytes and marked with a truncation suffix instead.
+    """
+
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    results: Dict[str, Tuple[bytes, bool]] = {}
+
+    def reader(name: str, stream) -> None:
+        results[name] = _read_capped(stream, cap)
+
+    threads = [
+        threading.Thread(target=reader, args=("stdout", proc.stdout), daemon=True),
+        threading.Thread(target=reader, args=("stderr", proc.stderr), daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        for thread in threads:
+            thread.join()
+
+    def decode(name: str) -> str:
+        data, truncated = results.get(name, (b"", False))
+        text = data.decode("utf-8", errors="ignore")
+        return text + _TRUNCATION_MARKER if truncated else text
+
+    return subprocess.CompletedProcess(cmd, returncode, decode("stdout"), decode("stderr"))
+
+
 def _first_non_empty(*values: Any) -> Optional[Any]:
     for value in values:
         if value is None:
@@ -1255,12 +1335,9 @@ def _run_adb(args: List[str], timeout: int = 60) -> Tuple[int, str, str]:
 
 def _normalize_shell_commands(spec: BlissADBShellSpec) -> List[str]:
     items = spec.commands if spec.commands is not None else [spec.cmd]
-    commands: List[str] = []
-    for item in items:
-        command = (item or "").strip()
-        if not command:
-            raise HTTPException(400, "ADB shell command cannot be empty")
-        commands.append(command)
+    commands = [(item or "").strip() for item in items]
+    if not all(commands):
+        raise HTTPException(400, "ADB shell command cannot be empty")
     return commands
 
 
@@ -1279,28 +1356,28 @@ def _normalize_adb_args(spec: BlissADBCommandSpec) -> List[str]:
     return parts
 
 
+# Один C-рівневий прохід по всьому виводу ``adb devices -l`` замість
+# splitlines() + потокенного розбору в Python.
+_ADB_DEVICE_RE = re.compile(r"^[ \t]*(\S+)(?:[ \t]+(\S+))?(?:[ \t]+(.*?))?[ \t\r]*$", re.MULTILINE)
+
+
 def _parse_adb_devices(output: str) -> List[Dict[str, Any]]:
+    if output.lstrip().lower().startswith("list of devices attached"):
+        output = output.partition("\n")[2]
     devices: List[Dict[str, Any]] = []
-    for line in output.splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.lower().startswith("list of devices attached"):
-            continue
-        parts = stripped.split()
-        if not parts:
-            continue
-        serial = parts[0]
-        state = parts[1] if len(parts) > 1 else "unknown"
+    for match in _ADB_DEVICE_RE.finditer(output):
+        serial, state, tail = match.groups()
         extras: Dict[str, Any] = {}
         descriptors: List[str] = []
-        for token in parts[2:]:
-            if "=" in token:
-                key, value = token.split("=", 1)
+        for token in (tail or "").split():
+            key, sep, value = token.partition("=")
+            if sep:
                 extras[key] = value
             else:
                 descriptors.append(token)
         if descriptors:
             extras["descriptors"] = descriptors
-        devices.append({"serial": serial, "state": state, "extras": extras or None})
+        devices.append({"serial": serial, "state": state or "unknown", "extras": extras or None})
     return devices
 
 
@@ -1459,7 +1536,9 @@ class SSHRunner:
             return self._load_pkey_from_data(text)
         return None
 
-    def run(self, cmd: str, timeout: int = 900, env: Optional[Dict[str, str]] = None, cwd: Optional[str] = None) -> Tuple[int, str, str]:
+    def _connect(self) -> paramiko.SSHClient:
+        """Open an authenticated ``SSHClient``; the caller must close it."""
+
         client = paramiko.SSHClient()
         client.set_missing_host_key_policy(
             paramiko.RejectPolicy() if self.strict_host_key else paramiko.AutoAddPolicy()
@@ -1471,6 +1550,50 @@ class SSHRunner:
                 pkey=pkey, password=self.password if not pkey else None,
                 timeout=self.timeout, banner_timeout=self.timeout, auth_timeout=self.timeout
             )
+        except socket.gaierror as e:
+            client.close()
+            raise SSHError(f"Unable to resolve SSH host '{self.host}': {e}") from e
+        except paramiko.ssh_exception.NoValidConnectionsError as e:
+            client.close()
+            raise SSHError(f"Unable to connect to {self.host}:{self.port}: {e}") from e
+        except SSHError:
+            client.close()
+            raise
+        except Exception as e:
+            client.close()
+            raise SSHError(str(e))
+        return client
+
+    @staticmethod
+    def _run_transport(transport: "paramiko.Transport", cmd: str, timeout: int = 30) -> Tuple[int, str, str]:
+        """Execute *cmd* over an already authenticated transport.
+
+        For short commands (e.g. the ``command -v`` probes in ``/browser/open``)
+        a full ``SSHClient`` lifecycle per call is wasted work; reusing the
+        transport reduces each call to a single channel open.
+        """
+
+        try:
+            channel = transport.open_session(timeout=timeout)
+        except Exception as e:
+            raise SSHError(f"Unable to open SSH channel: {e}") from e
+        try:
+            channel.settimeout(timeout)
+            channel.exec_command(cmd)
+            out = channel.makefile("rb").read().decode("utf-8", errors="ignore")
+            err = channel.makefile_stderr("rb").read().decode("utf-8", errors="ignore")
+            rc = channel.recv_exit_status()
+            return rc, out, err
+        except SSHError:
+            raise
+        except Exception as e:
+            raise SSHError(str(e))
+        finally:
+            channel.close()
+
+    def run(self, cmd: str, timeout: int = 900, env: Optional[Dict[str, str]] = None, cwd: Optional[str] = None) -> Tuple[int, str, str]:
+        client = self._connect()
+        try:
             full_cmd = cmd
             if env:
                 exports = " ".join(f'{k}={shlex.quote(v)}' for k, v in env.items())
@@ -1482,10 +1605,8 @@ class SSHRunner:
             err = stderr.read().decode("utf-8", errors="ignore")
             rc = stdout.channel.recv_exit_status()
             return rc, out, err
-        except socket.gaierror as e:
-            raise SSHError(f"Unable to resolve SSH host '{self.host}': {e}") from e
-        except paramiko.ssh_exception.NoValidConnectionsError as e:
-            raise SSHError(f"Unable to connect to {self.host}:{self.port}: {e}") from e
+        except SSHError:
+            raise
         except Exception as e:
             raise SSHError(str(e))
         finally:
@@ -1632,14 +1753,17 @@ def create_lxc(req: CreateLXCReq) -> Dict[str, Any]:
 
 
 @app.post("/lxc/exec")
-def lxc_exec(spec: LXCExecSpec) -> Dict[str, Any]:
+async def lxc_exec(spec: LXCExecSpec) -> Dict[str, Any]:
     host, user, key = _require_pve_ssh()
 
     command = spec.cmd if spec.cmd is not None else " && ".join(spec.commands or [])
     cmd = f"pct exec {spec.vmid} -- bash -lc {shlex.quote(command)}"
     try:
-        res = subprocess.run(["ssh", "-i", key, f"{user}@{host}", cmd],
-                             capture_output=True, text=True, timeout=3600)
+        res = await asyncio.to_thread(
+            _run_capped,
+            ["ssh", "-i", key, f"{user}@{host}", cmd],
+            timeout=3600,
+        )
         return {"rc": res.returncode, "stdout": res.stdout, "stderr": res.stderr}
     except Exception as e:
         raise _http_500(f"/lxc/exec failed: {e}")
@@ -1649,7 +1773,7 @@ def lxc_exec(spec: LXCExecSpec) -> Dict[str, Any]:
 # Deploy у LXC (через pct exec по SSH)
 # ─────────────────────────────────────────────
 @app.post("/deploy")
-def deploy(spec: DeploySpec) -> Dict[str, Any]:
+async def deploy(spec: DeploySpec) -> Dict[str, Any]:
     host, user, key = _require_pve_ssh()
 
     ctx = {"repo_url": spec.repo_url, "workdir": spec.workdir}
@@ -1662,13 +1786,18 @@ def deploy(spec: DeploySpec) -> Dict[str, Any]:
 
     steps: List[Dict[str, Any]] = []
     commands = [*spec.setup, *spec.commands]
+    # Кроки залежать один від одного (setup → команди), тому виконуються
+    # послідовно; asyncio.to_thread лише звільняє event loop на час блокування.
     for c in commands:
         inner = render(c)
         vmid = shlex.quote(str(spec.target_vmid))
         pct_cmd = f"pct exec {vmid} -- bash -lc {shlex.quote(inner)}"
         try:
-            res = subprocess.run(["ssh", "-i", key, f"{user}@{host}", pct_cmd],
-                                 capture_output=True, text=True, timeout=3600)
+            res = await asyncio.to_thread(
+                _run_capped,
+                ["ssh", "-i", key, f"{user}@{host}", pct_cmd],
+                timeout=3600,
+            )
             steps.append({"cmd": inner, "rc": res.returncode, "stdout": res.stdout, "stderr": res.stderr})
             if res.returncode != 0:
                 return {"ok": False, "steps": steps}
@@ -1682,22 +1811,24 @@ def deploy(spec: DeploySpec) -> Dict[str, Any]:
 # BlissOS: ADB control
 # ─────────────────────────────────────────────
 @app.get("/bliss/adb/devices")
-def bliss_adb_devices() -> Dict[str, Any]:
+async def bliss_adb_devices() -> Dict[str, Any]:
     try:
-        rc, out, err = _run_adb(["devices", "-l"], timeout=15)
+        rc, out, err = await asyncio.to_thread(_run_adb, ["devices", "-l"], timeout=15)
     except ADBError as exc:
         raise HTTPException(status_code=exc.status_code, detail=f"/bliss/adb/devices failed: {exc}") from exc
     return {"rc": rc, "stdout": out, "stderr": err, "devices": _parse_adb_devices(out)}
 
 
 @app.post("/bliss/adb/connect")
-def bliss_adb_connect(spec: BlissADBConnectSpec) -> Dict[str, Any]:
+async def bliss_adb_connect(spec: BlissADBConnectSpec) -> Dict[str, Any]:
     address = _resolve_bliss_address(spec)
     steps: List[Dict[str, Any]] = []
 
     try:
         if spec.force_disconnect:
-            rc_disc, out_disc, err_disc = _run_adb(["disconnect", address], timeout=spec.timeout)
+            rc_disc, out_disc, err_disc = await asyncio.to_thread(
+                _run_adb, ["disconnect", address], timeout=spec.timeout
+            )
             steps.append({
                 "action": "disconnect",
                 "rc": rc_disc,
@@ -1705,7 +1836,9 @@ def bliss_adb_connect(spec: BlissADBConnectSpec) -> Dict[str, Any]:
                 "stderr": err_disc,
             })
 
-        rc_conn, out_conn, err_conn = _run_adb(["connect", address], timeout=spec.timeout)
+        rc_conn, out_conn, err_conn = await asyncio.to_thread(
+            _run_adb, ["connect", address], timeout=spec.timeout
+        )
         steps.append({
             "action": "connect",
             "rc": rc_conn,
@@ -1719,7 +1852,9 @@ def bliss_adb_connect(spec: BlissADBConnectSpec) -> Dict[str, Any]:
     connect_ok = steps[-1]["rc"] == 0 if steps else False
     if spec.wait_for_device and connect_ok:
         try:
-            rc_wait, out_wait, err_wait = _run_adb(["-s", address, "wait-for-device"], timeout=spec.timeout)
+            rc_wait, out_wait, err_wait = await asyncio.to_thread(
+                _run_adb, ["-s", address, "wait-for-device"], timeout=spec.timeout
+            )
             wait_step = {
                 "action": "wait-for-device",
                 "rc": rc_wait,
@@ -1749,7 +1884,7 @@ def bliss_adb_connect(spec: BlissADBConnectSpec) -> Dict[str, Any]:
 
 
 @app.post("/bliss/adb/disconnect")
-def bliss_adb_disconnect(spec: BlissADBDisconnectSpec) -> Dict[str, Any]:
+async def bliss_adb_disconnect(spec: BlissADBDisconnectSpec) -> Dict[str, Any]:
     if spec.all:
         target_desc = "all"
         args = ["disconnect", "--all"]
@@ -1759,7 +1894,7 @@ def bliss_adb_disconnect(spec: BlissADBDisconnectSpec) -> Dict[str, Any]:
         args = ["disconnect", address]
 
     try:
-        rc, out, err = _run_adb(args, timeout=15)
+        rc, out, err = await asyncio.to_thread(_run_adb, args, timeout=15)
     except ADBError as exc:
         raise HTTPException(status_code=exc.status_code, detail=f"/bliss/adb/disconnect failed: {exc}") from exc
 
@@ -1772,7 +1907,7 @@ def bliss_adb_disconnect(spec: BlissADBDisconnectSpec) -> Dict[str, Any]:
 
 
 @app.post("/bliss/adb/shell")
-def bliss_adb_shell(spec: BlissADBShellSpec) -> Dict[str, Any]:
+async def bliss_adb_shell(spec: BlissADBShellSpec) -> Dict[str, Any]:
     serial = _resolve_bliss_serial(spec)
     commands = _normalize_shell_commands(spec)
     steps: List[Dict[str, Any]] = []
@@ -1784,7 +1919,7 @@ def bliss_adb_shell(spec: BlissADBShellSpec) -> Dict[str, Any]:
         else:
             args.append(command)
         try:
-            rc, out, err = _run_adb(args, timeout=spec.timeout)
+            rc, out, err = await asyncio.to_thread(_run_adb, args, timeout=spec.timeout)
         except ADBError as exc:
             raise HTTPException(status_code=exc.status_code, detail=f"/bliss/adb/shell failed: {exc}") from exc
         step = {
@@ -1803,12 +1938,12 @@ def bliss_adb_shell(spec: BlissADBShellSpec) -> Dict[str, Any]:
 
 
 @app.post("/bliss/adb/command")
-def bliss_adb_command(spec: BlissADBCommandSpec) -> Dict[str, Any]:
+async def bliss_adb_command(spec: BlissADBCommandSpec) -> Dict[str, Any]:
     serial = _resolve_bliss_serial(spec)
     adb_args = _normalize_adb_args(spec)
     full_args = ["-s", serial, *adb_args]
     try:
-        rc, out, err = _run_adb(full_args, timeout=spec.timeout)
+        rc, out, err = await asyncio.to_thread(_run_adb, full_args, timeout=spec.timeout)
     except ADBError as exc:
         raise HTTPException(status_code=exc.status_code, detail=f"/bliss/adb/command failed: {exc}") from exc
 
@@ -1825,10 +1960,12 @@ def bliss_adb_command(spec: BlissADBCommandSpec) -> Dict[str, Any]:
 # Універсальний SSH: виконання команд на будь-якому сервері
 # ─────────────────────────────────────────────
 @app.post("/ssh/run")
-def ssh_run(spec: SSHSpec) -> Dict[str, Any]:
+async def ssh_run(spec: SSHSpec) -> Dict[str, Any]:
     runner = SSHRunner(**_resolve_ssh_connection(spec))
     try:
-        rc, out, err = runner.run(spec.cmd, env=spec.env, cwd=spec.cwd, timeout=1800)
+        rc, out, err = await asyncio.to_thread(
+            runner.run, spec.cmd, env=spec.env, cwd=spec.cwd, timeout=1800
+        )
         return {"rc": rc, "stdout": out, "stderr": err}
     except SSHError as e:
         raise HTTPException(status_code=400, detail=f"/ssh/run failed: {e}") from e
@@ -1840,7 +1977,7 @@ def ssh_run(spec: SSHSpec) -> Dict[str, Any]:
 # Запуск програм на віддаленому сервері
 # ─────────────────────────────────────────────
 @app.post("/apps/launch")
-def apps_launch(spec: AppLaunchSpec) -> Dict[str, Any]:
+async def apps_launch(spec: AppLaunchSpec) -> Dict[str, Any]:
     runner = SSHRunner(**_resolve_ssh_connection(spec))
     env = dict(spec.env or {})
     if spec.display:
@@ -1857,7 +1994,9 @@ def apps_launch(spec: AppLaunchSpec) -> Dict[str, Any]:
         cmd = base_cmd
 
     try:
-        rc, out, err = runner.run(cmd, env=env, cwd=spec.cwd, timeout=120)
+        rc, out, err = await asyncio.to_thread(
+            runner.run, cmd, env=env, cwd=spec.cwd, timeout=120
+        )
         return {"rc": rc, "stdout": out, "stderr": err}
     except SSHError as e:
         raise HTTPException(status_code=400, detail=f"/apps/launch failed: {e}") from e
@@ -1868,84 +2007,117 @@ def apps_launch(spec: AppLaunchSpec) -> Dict[str, Any]:
 # ─────────────────────────────────────────────
 # Віддалений браузер (headless або GUI)
 # ─────────────────────────────────────────────
-@app.post("/browser/open")
-def browser_open(spec: BrowserSpec) -> Dict[str, Any]:
-    runner = SSHRunner(**_resolve_ssh_connection(spec))
+_WHICH_CACHE_TTL = 300.0
+_WHICH_CACHE: Dict[Tuple[str, str], Tuple[float, str]] = {}
 
-    try:
-        def build_headless_cmd(bin_name: str) -> str:
-            flags = [
-                "--no-first-run",
-                "--no-default-browser-check",
-                "--disable-gpu",
-                "--disable-software-rasterizer",
-                "--disable-dev-shm-usage",
-                f"--window-size={spec.window_size}",
-            ]
-            if spec.user_data_dir:
-                flags.append(f"--user-data-dir={shlex.quote(spec.user_data_dir)}")
-            flags += spec.extra_args
-
-            if spec.action == "open":
-                return " ".join([shlex.quote(bin_name), "--headless=new", *flags, shlex.quote(spec.url)])
-            if spec.action == "screenshot":
-                outp = spec.output_path or "/tmp/screenshot.png"
-                return " ".join([
-                    shlex.quote(bin_name),
-                    "--headless=new",
-                    *flags,
-                    f"--screenshot={shlex.quote(outp)}",
-                    shlex.quote(spec.url),
-                ])
-            if spec.action == "pdf":
-                outp = spec.output_path or "/tmp/page.pdf"
-                return " ".join([
-                    shlex.quote(bin_name),
-                    "--headless=new",
-                    *flags,
-                    f"--print-to-pdf={shlex.quote(outp)}",
-                    shlex.quote(spec.url),
-                ])
-            raise HTTPException(400, f"Unsupported action: {spec.action}")
-
-        # headless
-        if spec.headless:
+
+def _command_available(host: str, candidate: str, probe) -> bool:
+    """Return whether *candidate* is installed on *host*.
+
+    The answer rarely changes per host, so positive and negative results are
+    cached for ``_WHICH_CACHE_TTL`` seconds; *probe* is only invoked on a
+    cache miss and must return the remote exit code of ``command -v``.
+    """
+
+    now = time.monotonic()
+    cached = _WHICH_CACHE.get((host, candidate))
+    if cached is not None and cached[0] > now:
+        return cached[1] == "ok"
+    result = "ok" if probe() == 0 else "missing"
+    _WHICH_CACHE[(host, candidate)] = (now + _WHICH_CACHE_TTL, result)
+    return result == "ok"
+
+
+def _browser_open_blocking(spec: BrowserSpec, runner: SSHRunner) -> Dict[str, Any]:
+    """Blocking body of ``/browser/open``; executed via ``asyncio.to_thread``."""
+
+    def build_headless_cmd(bin_name: str) -> str:
+        flags = [
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--disable-gpu",
+            "--disable-software-rasterizer",
+            "--disable-dev-shm-usage",
+            f"--window-size={spec.window_size}",
+        ]
+        if spec.user_data_dir:
+            flags.append(f"--user-data-dir={shlex.quote(spec.user_data_dir)}")
+        flags += spec.extra_args
+
+        if spec.action == "open":
+            return " ".join([shlex.quote(bin_name), "--headless=new", *flags, shlex.quote(spec.url)])
+        if spec.action == "screenshot":
+            outp = spec.output_path or "/tmp/screenshot.png"
+            return " ".join([
+                shlex.quote(bin_name),
+                "--headless=new",
+                *flags,
+                f"--screenshot={shlex.quote(outp)}",
+                shlex.quote(spec.url),
+            ])
+        if spec.action == "pdf":
+            outp = spec.output_path or "/tmp/page.pdf"
+            return " ".join([
+                shlex.quote(bin_name),
+                "--headless=new",
+                *flags,
+                f"--print-to-pdf={shlex.quote(outp)}",
+                shlex.quote(spec.url),
+            ])
+        raise HTTPException(400, f"Unsupported action: {spec.action}")
+
+    # headless: один SSHClient на всі проби, кожна проба — лише новий канал
+    if spec.headless:
+        client = runner._connect()
+        try:
+            transport = client.get_transport()
             for candidate in spec.browser_cmds:
                 check = f"command -v {shlex.quote(candidate)} >/dev/null 2>&1"
-                rc, _, _ = runner.run(check, timeout=10)
-                if rc == 0:
+                if _command_available(
+                    runner.host,
+                    candidate,
+                    lambda: SSHRunner._run_transport(transport, check, timeout=10)[0],
+                ):
                     cmd = build_headless_cmd(candidate)
-                    rc2, out2, err2 = runner.run(cmd, timeout=180)
+                    rc2, out2, err2 = SSHRunner._run_transport(transport, cmd, timeout=180)
                     return {"rc": rc2, "stdout": out2, "stderr": err2, "used": candidate}
-            raise _http_500(f"No browser found from list: {spec.browser_cmds}")
-
-        # GUI (DISPLAY має бути налаштований на віддаленій машині)
-        env = {}
-        if os.getenv("DEFAULT_GUI_DISPLAY"):
-            env["DISPLAY"] = os.getenv("DEFAULT_GUI_DISPLAY")
-
-        # xdg-open спроба
-        rc, out, err = runner.run(
-            f"xdg-open {shlex.quote(spec.url)} >/dev/null 2>&1 & echo $!",
-            timeout=10,
-            env=env,
-        )
-        if rc == 0:
-            return {"rc": rc, "stdout": out, "stderr": err, "used": "xdg-open"}
-
-        # fallback: firefox/chrome без headless
-        for candidate in ["firefox"] + spec.browser_cmds:
-            check = f"command -v {shlex.quote(candidate)} >/dev/null 2>&1"
-            rc2, _, _ = runner.run(check, timeout=10, env=env)
-            if rc2 == 0:
-                cmd = f"{shlex.quote(candidate)} {shlex.quote(spec.url)}"
-                rc3, out3, err3 = runner.run(cmd, timeout=30, env=env)
-                return {"rc": rc3, "stdout": out3, "stderr": err3, "used": candidate}
-        raise _http_500("No GUI browser found (tried xdg-open, firefox, chrome/chromium).")
+        finally:
+            client.close()
+        raise _http_500(f"No browser found from list: {spec.browser_cmds}")
+
+    # GUI (DISPLAY має бути налаштований на віддаленій машині)
+    env = {}
+    if os.getenv("DEFAULT_GUI_DISPLAY"):
+        env["DISPLAY"] = os.getenv("DEFAULT_GUI_DISPLAY")
+
+    # xdg-open спроба
+    rc, out, err = runner.run(
+        f"xdg-open {shlex.quote(spec.url)} >/dev/null 2>&1 & echo $!",
+        timeout=10,
+        env=env,
+    )
+    if rc == 0:
+        return {"rc": rc, "stdout": out, "stderr": err, "used": "xdg-open"}
+
+    # fallback: firefox/chrome без headless
+    for candidate in ["firefox"] + spec.browser_cmds:
+        check = f"command -v {shlex.quote(candidate)} >/dev/null 2>&1"
+        if _command_available(
+            runner.host, candidate, lambda: runner.run(check, timeout=10, env=env)[0]
+        ):
+            cmd = f"{shlex.quote(candidate)} {shlex.quote(spec.url)}"
+            rc3, out3, err3 = runner.run(cmd, timeout=30, env=env)
+            return {"rc": rc3, "stdout": out3, "stderr": err3, "used": candidate}
+    raise _http_500("No GUI browser found (tried xdg-open, firefox, chrome/chromium).")
+
+@app.post("/browser/open")
+async def browser_open(spec: BrowserSpec) -> Dict[str, Any]:
+    runner = SSHRunner(**_resolve_ssh_connection(spec))
+    try:
+        return await asyncio.to_thread(_browser_open_blocking, spec, runner)
     except SSHError as e:
         raise HTTPException(status_code=400, detail=f"/browser/open failed: {e}") from e
 
-
 # ─────────────────────────────────────────────
 # Uvicorn launcher (локальний запуск/дебаг)
 # ─────────────────────────────────────────────
@@ -17,23 +17,35 @@ so it can be run unattended inside CI/CD pipelines or scheduled tasks.
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import logging
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, Mapping, MutableMapping, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Tuple
+
+try:  # Faster JSON decoder when available (see controller/requirements.txt)
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
 
 from .bliss_social_automation import (
     ADBCommandError,
     ADBClient,
     BlissSocialAutomation,
-    ContentGenerator,
+    PersistentAdbShell,
     SOCIAL_APPS,
     SocialAppConfig,
 )
 
+if TYPE_CHECKING:  # ContentGenerator is only referenced in annotations here;
+    # the heavy LLM SDKs behind it stay unimported until generation is used.
+    from .bliss_social_automation import ContentGenerator
+
 __all__ = [
     "NetworkParameters",
     "NETWORKS",
@@ -59,6 +71,21 @@ NETWORKS: Dict[str, NetworkParameters] = {
 }
 
 
+#: Sorted network names, computed once for argparse choices and error text.
+_NETWORK_CHOICES = tuple(sorted(NETWORKS))
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_network(network: str) -> NetworkParameters:
+    """Case-insensitive ``NETWORKS`` lookup, memoised per spelling.
+
+    ``NETWORKS`` is immutable after import, so caching the lowercase
+    normalisation avoids repeating it for every entry of a batch plan.
+    """
+
+    return NETWORKS[network.lower()]
+
+
 class AutonomousSocialPoster:
     """High level orchestration helper around :class:`BlissSocialAutomation`."""
 
@@ -76,10 +103,10 @@ class AutonomousSocialPoster:
 
     def get_network(self, network: str) -> NetworkParameters:
         try:
-            return NETWORKS[network.lower()]
+            return _resolve_network(network)
         except KeyError as exc:
             raise KeyError(
-                f"Unknown social network '{network}'. Available: {', '.join(sorted(NETWORKS))}"
+                f"Unknown social network '{network}'. Available: {', '.join(_NETWORK_CHOICES)}"
             ) from exc
 
     # ──────────────────────────────────────────────────────────────────
@@ -95,6 +122,57 @@ class AutonomousSocialPoster:
             return f"{profile.app.package} already installed"
         return self.automation.install_app(Path(apk_path), reinstall=reinstall)
 
+    def install_apps(
+        self,
+        entries: Sequence[Tuple[str, Path | str]],
+        *,
+        reinstall: bool = False,
+        max_workers: int = 4,
+    ) -> List[Dict[str, str]]:
+        """Install APKs for several networks as one batch.
+
+        Every ``(network, apk_path)`` pair is validated before any device
+        work starts, the device is prepared once instead of per install, and
+        the independent ``adb install`` calls then run through a small thread
+        pool.  Each result records the per-network outcome so one broken APK
+        does not abort the remaining installs.
+
+        ``adb install-multiple`` was considered but it targets split APKs of
+        a single package, not unrelated applications, hence the thread pool.
+        """
+
+        jobs: List[Tuple[str, Path]] = [
+            (
+                self.get_network(network).name,
+                apk if isinstance(apk, Path) else Path(apk),
+            )
+            for network, apk in entries
+        ]
+        if not jobs:
+            return []
+
+        self.automation.ensure_device()
+
+        results: List[Dict[str, str]] = [{} for _ in jobs]
+
+        def _install(index: int, name: str, apk: Path) -> None:
+            try:
+                output = self.automation.adb.install(apk, reinstall=reinstall)
+            except Exception as exc:  # noqa: BLE001 - reported per entry
+                results[index] = {"network": name, "status": "error", "error": str(exc)}
+            else:
+                results[index] = {"network": name, "status": "ok", "output": output}
+
+        workers = min(max_workers, len(jobs)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_install, index, name, apk)
+                for index, (name, apk) in enumerate(jobs)
+            ]
+            for future in futures:
+                future.result()
+        return results
+
     def uninstall_app(self, network: str, *, keep_data: bool = False) -> str:
         profile = self.get_network(network)
         return self.automation.uninstall_app(profile.app.package, keep_data=keep_data)
@@ -120,7 +198,7 @@ class AutonomousSocialPoster:
     ) -> Dict[str, str]:
         profile = self.get_network(network)
         destination = remote_directory or profile.remote_directory
-        paths = [Path(item) for item in files]
+        paths = [item if isinstance(item, Path) else Path(item) for item in files]
         return self.automation.push_assets(paths, remote_directory=destination)
 
     def generate_content(
@@ -159,7 +237,7 @@ class AutonomousSocialPoster:
     ) -> str:
         profile = self.get_network(network)
         target_dir = remote_directory or profile.remote_directory
-        media_paths = [Path(item) for item in media]
+        media_paths = [item if isinstance(item, Path) else Path(item) for item in media]
         return self.automation.publish_post(
             profile.name,
             text=text,
@@ -176,13 +254,25 @@ class AutonomousSocialPoster:
             launch_activity=launch_activity,
         )
 
-    def run_plan(self, plan: Sequence[Mapping[str, Any]], *, stop_on_error: bool = False) -> Sequence[Dict[str, Any]]:
+    def _validate_plan(self, plan: Sequence[Mapping[str, Any]]) -> None:
+        names: set[str] = set()
         for entry in plan:
             if "app" not in entry:
                 raise KeyError("Each plan entry must include the 'app' field")
-            self.get_network(str(entry["app"]))  # validate network name
+            names.add(str(entry["app"]))
+        for name in names:  # validate each distinct network name once
+            self.get_network(name)
+
+    def run_plan(self, plan: Sequence[Mapping[str, Any]], *, stop_on_error: bool = False) -> Sequence[Dict[str, Any]]:
+        self._validate_plan(plan)
         return self.automation.publish_batch(plan, stop_on_error=stop_on_error)
 
+    def run_plan_iter(self, plan: Sequence[Mapping[str, Any]], *, stop_on_error: bool = False) -> Iterator[Dict[str, Any]]:
+        """Validate ``plan`` and yield publish results as each entry finishes."""
+
+        self._validate_plan(plan)
+        return self.automation.publish_batch_iter(plan, stop_on_error=stop_on_error)
+
     # ──────────────────────────────────────────────────────────────────
     # Device helpers
     # ──────────────────────────────────────────────────────────────────
@@ -194,25 +284,47 @@ class AutonomousSocialPoster:
         self.automation.ensure_device()
 
 
+def _emit_json(payload: Any) -> None:
+    """Serialise ``payload`` straight to stdout instead of via a temp string."""
+
+    json.dump(payload, sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write("\n")
+
+
 def _parse_extras(pairs: Sequence[str]) -> Dict[str, str]:
     extras: Dict[str, str] = {}
     for item in pairs:
-        if "=" not in item:
+        # ``partition`` finds the separator in a single scan, unlike the
+        # ``in`` check followed by ``split`` which walked the string twice.
+        key, separator, value = item.partition("=")
+        if not separator:
             raise ValueError(f"Invalid extra '{item}'. Expected KEY=VALUE format")
-        key, value = item.split("=", 1)
         extras[key] = value
     return extras
 
 
 def _load_plan(path: Path) -> Sequence[Mapping[str, Any]]:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    raw = path.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
     if isinstance(data, list):
-        return data
-    if isinstance(data, dict):
-        posts = data.get("posts")
-        if isinstance(posts, list):
-            return posts
-    raise ValueError("Plan must be a list or an object containing a 'posts' list")
+        entries = data
+    elif isinstance(data, dict) and isinstance(data.get("posts"), list):
+        entries = data["posts"]
+    else:
+        raise ValueError("Plan must be a list or an object containing a 'posts' list")
+
+    # Validate entries eagerly so malformed plans fail before any adb work.
+    for entry in entries:
+        if not isinstance(entry, Mapping):
+            raise ValueError("Each plan entry must be a JSON object")
+        if "app" not in entry:
+            raise KeyError("Each plan entry must include the 'app' field")
+        if str(entry["app"]).lower() not in NETWORKS:
+            raise KeyError(
+                f"Unknown social network '{entry['app']}'. Available: {', '.join(_NETWORK_CHOICES)}"
+            )
+    return entries
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
@@ -221,6 +333,12 @@ def build_arg_parser() -> argparse.ArgumentParser:
     parser.add_argument("--serial", help="ADB serial number")
     parser.add_argument("--connect", help="ADB connect address (HOST:PORT)")
     parser.add_argument("--timeout", type=int, default=60, help="Default adb timeout in seconds")
+    parser.add_argument(
+        "--persistent-shell",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Reuse a single adb shell session for device commands instead of spawning adb per call",
+    )
     parser.add_argument("--log-level", default="INFO", help="Python logging level")
     parser.add_argument("--log-file", help="File path for log output")
 
@@ -230,28 +348,28 @@ def build_arg_parser() -> argparse.ArgumentParser:
     devices_parser.set_defaults(command="devices")
 
     install_parser = subparsers.add_parser("install", help="Install or update an application")
-    install_parser.add_argument("network", choices=sorted(NETWORKS))
+    install_parser.add_argument("network", choices=_NETWORK_CHOICES)
     install_parser.add_argument("--apk", type=Path, help="Local path to APK file")
     install_parser.add_argument("--reinstall", action="store_true", help="Pass -r to adb install")
 
     uninstall_parser = subparsers.add_parser("uninstall", help="Remove an installed application")
-    uninstall_parser.add_argument("network", choices=sorted(NETWORKS))
+    uninstall_parser.add_argument("network", choices=_NETWORK_CHOICES)
     uninstall_parser.add_argument("--keep-data", action="store_true", help="Preserve app data during uninstall")
 
     launch_parser = subparsers.add_parser("launch", help="Launch a social media application")
-    launch_parser.add_argument("network", choices=sorted(NETWORKS))
+    launch_parser.add_argument("network", choices=_NETWORK_CHOICES)
     launch_parser.add_argument("--activity", help="Override launch activity component")
 
     force_parser = subparsers.add_parser("force-stop", help="Force stop a running application")
-    force_parser.add_argument("network", choices=sorted(NETWORKS))
+    force_parser.add_argument("network", choices=_NETWORK_CHOICES)
 
     push_parser = subparsers.add_parser("push", help="Upload media files to the device")
-    push_parser.add_argument("network", choices=sorted(NETWORKS))
+    push_parser.add_argument("network", choices=_NETWORK_CHOICES)
     push_parser.add_argument("files", nargs="+", type=Path, help="Local files to push")
     push_parser.add_argument("--remote-dir", help="Destination directory on the device")
 
     post_parser = subparsers.add_parser("post", help="Publish content to a network")
-    post_parser.add_argument("network", choices=sorted(NETWORKS))
+    post_parser.add_argument("network", choices=_NETWORK_CHOICES)
     post_parser.add_argument("--text", help="Post body text")
     post_parser.add_argument("--subject", help="Optional subject/title")
     post_parser.add_argument("--media", nargs="*", type=Path, default=[], help="Media files to attach")
@@ -275,7 +393,7 @@ def build_arg_parser() -> argparse.ArgumentParser:
     post_parser.add_argument("--llm-max-tokens", type=int, help="Maximum number of tokens to generate")
 
     generate_parser = subparsers.add_parser("generate", help="Generate post copy without publishing")
-    generate_parser.add_argument("network", choices=sorted(NETWORKS))
+    generate_parser.add_argument("network", choices=_NETWORK_CHOICES)
     generate_parser.add_argument("prompt", help="Prompt for the generator")
     generate_parser.add_argument("--system-prompt", dest="system_prompt", help="System prompt for the generator")
     generate_parser.add_argument("--llm-provider", choices=["openai", "huggingface"], help="Override LLM provider")
@@ -303,6 +421,100 @@ def _generator_options_from_args(options: Any) -> Dict[str, Any]:
     return config
 
 
+def _cmd_devices(poster: AutonomousSocialPoster, options: Any, log: logging.Logger) -> int:
+    _emit_json(poster.list_devices())
+    return 0
+
+
+def _cmd_install(poster: AutonomousSocialPoster, options: Any, log: logging.Logger) -> int:
+    print(poster.install_app(options.network, options.apk, reinstall=options.reinstall))
+    return 0
+
+
+def _cmd_uninstall(poster: AutonomousSocialPoster, options: Any, log: logging.Logger) -> int:
+    print(poster.uninstall_app(options.network, keep_data=options.keep_data))
+    return 0
+
+
+def _cmd_launch(poster: AutonomousSocialPoster, options: Any, log: logging.Logger) -> int:
+    print(poster.launch_app(options.network, activity=options.activity))
+    return 0
+
+
+def _cmd_force_stop(poster: AutonomousSocialPoster, options: Any, log: logging.Logger) -> int:
+    poster.force_stop(options.network)
+    log.info("Force stopped %s", options.network)
+    return 0
+
+
+def _cmd_push(poster: AutonomousSocialPoster, options: Any, log: logging.Logger) -> int:
+    uploads = poster.push_content(options.network, options.files, remote_directory=options.remote_dir)
+    _emit_json(uploads)
+    return 0
+
+
+def _cmd_post(poster: AutonomousSocialPoster, options: Any, log: logging.Logger) -> int:
+    extras = _parse_extras(options.extra)
+    generator_options = _generator_options_from_args(options)
+    result = poster.post_content(
+        options.network,
+        text=options.text,
+        subject=options.subject,
+        media=options.media,  # already Path objects via argparse type=Path
+        remote_directory=options.remote_dir,
+        share_activity=options.share_activity,
+        extras=extras,
+        generation_prompt=options.generation_prompt,
+        system_prompt=options.system_prompt,
+        generator_options=generator_options or None,
+        launch_before_share=options.launch_before_share,
+        launch_activity=options.launch_activity,
+    )
+    print(result)
+    return 0
+
+
+def _cmd_generate(poster: AutonomousSocialPoster, options: Any, log: logging.Logger) -> int:
+    generator_options = _generator_options_from_args(options)
+    result = poster.generate_content(
+        options.network,
+        options.prompt,
+        system_prompt=options.system_prompt,
+        generator_options=generator_options or None,
+    )
+    print(result)
+    return 0
+
+
+def _cmd_batch(poster: AutonomousSocialPoster, options: Any, log: logging.Logger) -> int:
+    plan = _load_plan(options.plan)
+    # Stream the JSON array element by element so progress is visible while
+    # later batch entries are still publishing.
+    sys.stdout.write("[")
+    first = True
+    for result in poster.run_plan_iter(plan, stop_on_error=options.stop_on_error):
+        sys.stdout.write("\n" if first else ",\n")
+        json.dump(result, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.flush()
+        first = False
+    sys.stdout.write("]\n" if first else "\n]\n")
+    return 0
+
+
+#: Subcommand dispatch table; O(1) lookup replaces the if/elif chain in main().
+_COMMAND_HANDLERS: Dict[str, Any] = {
+    "devices": _cmd_devices,
+    "install": _cmd_install,
+    "uninstall": _cmd_uninstall,
+    "launch": _cmd_launch,
+    "force-stop": _cmd_force_stop,
+    "push": _cmd_push,
+    "post": _cmd_post,
+    "generate": _cmd_generate,
+    "batch": _cmd_batch,
+}
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = build_arg_parser()
     options = parser.parse_args(argv)
@@ -318,6 +530,13 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     logging.basicConfig(**logging_kwargs)
     log = logging.getLogger("autonomous-social-poster")
 
+    handler = _COMMAND_HANDLERS.get(options.command or "")
+    if handler is None:
+        parser.print_help()
+        return 1
+
+    # Only pay for the adb client and automation stack once we know a valid
+    # command was requested; bare invocations exit with the help text above.
     adb_client = ADBClient(
         adb_path=options.adb_path,
         serial=options.serial,
@@ -325,80 +544,16 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         default_timeout=options.timeout,
     )
     poster = AutonomousSocialPoster(adb_client=adb_client)
+    shell_session = PersistentAdbShell(adb_client) if options.persistent_shell else nullcontext()
 
     try:
-        if options.command == "devices":
-            print(json.dumps(poster.list_devices(), indent=2))
-            return 0
-
-        if options.command == "install":
-            print(poster.install_app(options.network, options.apk, reinstall=options.reinstall))
-            return 0
-
-        if options.command == "uninstall":
-            print(poster.uninstall_app(options.network, keep_data=options.keep_data))
-            return 0
-
-        if options.command == "launch":
-            print(poster.launch_app(options.network, activity=options.activity))
-            return 0
-
-        if options.command == "force-stop":
-            poster.force_stop(options.network)
-            log.info("Force stopped %s", options.network)
-            return 0
-
-        if options.command == "push":
-            uploads = poster.push_content(options.network, options.files, remote_directory=options.remote_dir)
-            print(json.dumps(uploads, indent=2))
-            return 0
-
-        if options.command == "post":
-            extras = _parse_extras(options.extra)
-            generator_options = _generator_options_from_args(options)
-            media_paths = [Path(p) for p in options.media]
-            result = poster.post_content(
-                options.network,
-                text=options.text,
-                subject=options.subject,
-                media=media_paths,
-                remote_directory=options.remote_dir,
-                share_activity=options.share_activity,
-                extras=extras,
-                generation_prompt=options.generation_prompt,
-                system_prompt=options.system_prompt,
-                generator_options=generator_options or None,
-                launch_before_share=options.launch_before_share,
-                launch_activity=options.launch_activity,
-            )
-            print(result)
-            return 0
-
-        if options.command == "generate":
-            generator_options = _generator_options_from_args(options)
-            result = poster.generate_content(
-                options.network,
-                options.prompt,
-                system_prompt=options.system_prompt,
-                generator_options=generator_options or None,
-            )
-            print(result)
-            return 0
-
-        if options.command == "batch":
-            plan = _load_plan(options.plan)
-            results = poster.run_plan(plan, stop_on_error=options.stop_on_error)
-            print(json.dumps(results, indent=2))
-            return 0
-
-    except (ADBCommandError, subprocess.SubprocessError, ValueError, RuntimeError) as exc:  # type: ignore[name-defined]
+        with shell_session:
+            return handler(poster, options, log)
+    except (ADBCommandError, subprocess.SubprocessError, ValueError, RuntimeError) as exc:
         log.error("Automation failed: %s", exc)
         print(str(exc), file=sys.stderr)
         return 1
 
-    parser.print_help()
-    return 1
-
 
 if __name__ == "__main__":  # pragma: no cover - CLI entry point
     raise SystemExit(main())
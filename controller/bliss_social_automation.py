@@ -18,26 +18,56 @@ code (for example inside an automation agent or scheduler).
 from __future__ import annotations
 
 import argparse
+import asyncio
+import functools
+import hashlib
+import io
 import json
 import logging
 import os
+import re
 import shlex
+import socket
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Tuple, Union
+
+try:  # Faster JSON decoder when available (see controller/requirements.txt)
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:  # Persistent LLM response cache; purely optional.
+    import diskcache
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    diskcache = None  # type: ignore[assignment]
+
+try:  # Incremental JSON parsing for oversized batch plans; purely optional.
+    import ijson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    ijson = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+#: Precompiled parsers for ``adb devices -l`` lines: ``<serial> <status>``
+#: followed by optional ``key:value`` attribute tokens.
+_DEVICE_LINE = re.compile(r"(\S+)(?:\s+(\S+))?(.*)")
+_DEVICE_ATTR = re.compile(r"(\w+):(\S+)")
+
 __all__ = [
     "ADBCommandError",
     "SocialAppConfig",
     "ADBClient",
+    "PersistentAdbShell",
     "PPADBClient",
     "ContentGenerator",
     "ContentGeneratorError",
+    "BatchPlan",
     "BlissSocialAutomation",
     "SOCIAL_APPS",
     "build_arg_parser",
@@ -74,6 +104,23 @@ class SocialAppConfig:
     allow_text_extra: bool = True
     grant_read_uri_permission: bool = True
     share_categories: Tuple[str, ...] = ("android.intent.category.DEFAULT",)
+    _launch_component: Optional[str] = field(init=False, repr=False, compare=False, default=None)
+    _share_component: Optional[str] = field(init=False, repr=False, compare=False, default=None)
+
+    def __post_init__(self) -> None:
+        # The dataclass is frozen and the activities never change, so the
+        # ``package/activity`` component strings are built exactly once here
+        # instead of on every launch/share call.
+        object.__setattr__(
+            self,
+            "_launch_component",
+            f"{self.package}/{self.launch_activity}" if self.launch_activity else None,
+        )
+        object.__setattr__(
+            self,
+            "_share_component",
+            f"{self.package}/{self.share_activity}" if self.share_activity else None,
+        )
 
     def component(self, activity: Optional[str]) -> Optional[str]:
         """Return ``package/activity`` if an activity is provided."""
@@ -82,9 +129,7 @@ class SocialAppConfig:
             if "/" in activity:
                 return activity
             return f"{self.package}/{activity}"
-        if self.launch_activity:
-            return f"{self.package}/{self.launch_activity}"
-        return None
+        return self._launch_component
 
     def share_component(self, activity: Optional[str]) -> Optional[str]:
         """Return the component used for share intents."""
@@ -93,9 +138,7 @@ class SocialAppConfig:
             if "/" in activity:
                 return activity
             return f"{self.package}/{activity}"
-        if self.share_activity:
-            return f"{self.package}/{self.share_activity}"
-        return None
+        return self._share_component
 
 
 SOCIAL_APPS: Dict[str, SocialAppConfig] = {
@@ -145,6 +188,21 @@ SOCIAL_APPS: Dict[str, SocialAppConfig] = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _lookup_social_app(app_name: str) -> SocialAppConfig:
+    """Resolve a (case-insensitive) app name to its :data:`SOCIAL_APPS` entry.
+
+    The table is immutable after import, so repeat lookups — one per
+    published post — are served from the cache without re-normalising the
+    name or re-formatting the error message.
+    """
+
+    try:
+        return SOCIAL_APPS[app_name.lower()]
+    except KeyError as exc:
+        raise KeyError(f"Unknown social app '{app_name}'. Available: {', '.join(SOCIAL_APPS)}") from exc
+
+
 class ContentGeneratorError(RuntimeError):
     """Raised when LLM based content generation fails."""
 
@@ -169,6 +227,10 @@ def _read_env_int(name: str) -> Optional[int]:
         raise ContentGeneratorError(f"Environment variable {name} must be an integer") from exc
 
 
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
 def _import_optional_torch() -> Optional["torch"]:
     """Import :mod:`torch` only when available.
 
@@ -271,6 +333,36 @@ def _build_hf_device_kwargs(device_setting: Optional[Union[str, int]]) -> Dict[s
         raise ContentGeneratorError(f"Unrecognised Hugging Face device '{device_setting}'") from exc
 
 
+#: Location of the on-disk LLM response cache shared by every generator.
+_LLM_DISK_CACHE_DIR = "~/.cache/bliss_llm"
+_llm_disk_cache_instance: Optional[Any] = None
+_llm_disk_cache_failed = False
+_llm_disk_cache_guard = threading.Lock()
+
+
+def _llm_disk_cache() -> Optional[Any]:
+    """Return the shared :mod:`diskcache` store, or ``None`` when unavailable.
+
+    The cache survives process restarts, so repeated deterministic prompts
+    (CI runs, iterating on a batch plan) skip the LLM round-trip entirely.
+    """
+
+    global _llm_disk_cache_instance, _llm_disk_cache_failed
+    if diskcache is None or _llm_disk_cache_failed:
+        return None
+    if _llm_disk_cache_instance is None:
+        with _llm_disk_cache_guard:
+            if _llm_disk_cache_instance is None and not _llm_disk_cache_failed:
+                try:
+                    _llm_disk_cache_instance = diskcache.Cache(
+                        os.path.expanduser(_LLM_DISK_CACHE_DIR)
+                    )
+                except OSError:  # pragma: no cover - cache directory not writable
+                    _llm_disk_cache_failed = True
+                    return None
+    return _llm_disk_cache_instance
+
+
 @dataclass
 class ContentGenerator:
     """Utility wrapper around OpenAI or Hugging Face text generation."""
@@ -282,9 +374,15 @@ class ContentGenerator:
     openai_api_key: Optional[str] = None
     huggingface_model: Optional[str] = None
     device: Optional[str] = None
+    dtype: Optional[str] = None
+    load_in_8bit: bool = False
     extra_options: Mapping[str, Any] = field(default_factory=dict)
 
+    #: Upper bound on memoized generations kept per generator instance.
+    GENERATION_CACHE_SIZE = 256
+
     def __post_init__(self) -> None:
+        self._generation_cache: Dict[Tuple[Optional[str], str], str] = {}
         provider_env = os.getenv("BLISS_LLM_PROVIDER")
         provider = (self.provider or provider_env or "openai").lower()
         if provider not in {"openai", "huggingface"}:
@@ -356,18 +454,123 @@ class ContentGenerator:
                     bnb_4bit_compute_dtype=torch.float16,
                 )
 
+        dtype_setting = self.dtype or os.getenv("BLISS_HF_DTYPE")
+        if "torch_dtype" not in pipeline_kwargs:
+            resolved_dtype = None
+            if dtype_setting:
+                if torch is None:
+                    raise ContentGeneratorError("PyTorch is required to select a Hugging Face dtype")
+                resolved_dtype = getattr(torch, dtype_setting.lower(), None)
+                if resolved_dtype is None:
+                    raise ContentGeneratorError(f"Unknown Hugging Face dtype '{dtype_setting}'")
+            elif torch is not None and (
+                "device_map" in pipeline_kwargs
+                or (isinstance(pipeline_kwargs.get("device"), int) and pipeline_kwargs["device"] >= 0)
+            ):
+                # FP32 doubles memory traffic for no quality gain during
+                # inference; default to bfloat16 whenever a GPU target was
+                # selected and the installed torch build offers it.
+                resolved_dtype = getattr(torch, "bfloat16", None)
+            if resolved_dtype is not None:
+                pipeline_kwargs["torch_dtype"] = resolved_dtype
+
+        if self.load_in_8bit or _env_flag("BLISS_HF_LOAD_IN_8BIT"):
+            # bitsandbytes handles placement itself; an explicit device
+            # argument conflicts with the quantized loading path.
+            pipeline_kwargs.pop("device", None)
+            pipeline_kwargs.setdefault("model_kwargs", {})["load_in_8bit"] = True
+
         self._hf_pipeline = pipeline("text-generation", model=model, **pipeline_kwargs)
 
     # ──────────────────────────────────────────────────────────────────
     # Public API
     # ──────────────────────────────────────────────────────────────────
 
-    def generate(self, prompt: str, *, system_prompt: Optional[str] = None) -> str:
+    def generate(
+        self, prompt: str, *, system_prompt: Optional[str] = None, use_cache: bool = True
+    ) -> str:
+        # Provider, model and sampling parameters are fixed per instance, so
+        # (system_prompt, prompt) fully determines the request.  Memoization
+        # is only safe for deterministic generations, i.e. temperature == 0;
+        # stochastic outputs must stay stochastic.
+        cacheable = use_cache and self.temperature == 0
+        key = (system_prompt, prompt)
+        if cacheable:
+            cached = self._generation_cache.get(key)
+            if cached is not None:
+                return cached
+
+        # L2: on-disk cache keyed on the full request identity, so it is
+        # shared across generator instances and process restarts.
+        disk = _llm_disk_cache() if cacheable else None
+        digest = self._cache_digest(prompt, system_prompt) if disk is not None else None
+        if disk is not None:
+            stored = disk.get(digest)
+            if isinstance(stored, str):
+                self._store_in_memory(key, stored)
+                return stored
+
         if self.provider == "openai":
-            return self._generate_openai(prompt, system_prompt=system_prompt)
-        return self._generate_huggingface(prompt, system_prompt=system_prompt)
+            text = self._generate_openai(prompt, system_prompt=system_prompt)
+        else:
+            text = self._generate_huggingface(prompt, system_prompt=system_prompt)
+
+        if cacheable:
+            self._store_in_memory(key, text)
+            if disk is not None:
+                disk.set(digest, text)
+        return text
+
+    def _cache_digest(self, prompt: str, system_prompt: Optional[str]) -> str:
+        material = "|".join(
+            (
+                str(self.provider),
+                str(self.model),
+                str(self.temperature),
+                system_prompt or "",
+                prompt,
+            )
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
 
-    def _generate_openai(self, prompt: str, *, system_prompt: Optional[str]) -> str:
+    def _store_in_memory(self, key: Tuple[Optional[str], str], text: str) -> None:
+        if len(self._generation_cache) >= self.GENERATION_CACHE_SIZE:
+            # Drop the oldest entry (insertion order) to bound memory.
+            self._generation_cache.pop(next(iter(self._generation_cache)))
+        self._generation_cache[key] = text
+
+    def clear_cache(self) -> None:
+        """Forget memoized generations (e.g. after changing the prompt context)."""
+
+        self._generation_cache.clear()
+
+    async def agenerate(self, prompt: str, *, system_prompt: Optional[str] = None) -> str:
+        """Async sibling of :meth:`generate`.
+
+        OpenAI generations stream through ``AsyncOpenAI`` when the installed
+        SDK offers it, so the event loop stays free while tokens arrive and
+        callers can overlap generation with adb I/O.  Older SDKs and the
+        Hugging Face provider run :meth:`generate` in a worker thread.
+        """
+
+        cacheable = self.temperature == 0
+        key = (system_prompt, prompt)
+        if cacheable:
+            cached = self._generation_cache.get(key)
+            if cached is not None:
+                return cached
+
+        if self.provider == "openai" and getattr(self._openai, "AsyncOpenAI", None) is not None:
+            text = await self._agenerate_openai(prompt, system_prompt=system_prompt)
+        else:
+            # generate() handles its own cache bookkeeping.
+            return await asyncio.to_thread(self.generate, prompt, system_prompt=system_prompt)
+
+        if cacheable:
+            self._store_in_memory(key, text)
+        return text
+
+    def _openai_request_params(self, prompt: str, system_prompt: Optional[str]) -> Dict[str, Any]:
         messages: List[Dict[str, str]] = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
@@ -382,7 +585,25 @@ class ContentGenerator:
         if self.max_tokens is not None:
             params["max_tokens"] = self.max_tokens
         params.update(dict(self.extra_options))
+        return params
+
+    async def _agenerate_openai(self, prompt: str, *, system_prompt: Optional[str]) -> str:
+        params = self._openai_request_params(prompt, system_prompt)
+        client = self._openai.AsyncOpenAI(api_key=self._openai.api_key)
+        stream = await client.chat.completions.create(stream=True, **params)
+        pieces: List[str] = []
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                pieces.append(delta)
+        if not pieces:
+            raise ContentGeneratorError("OpenAI stream produced no content")
+        return "".join(pieces).strip()
 
+    def _generate_openai(self, prompt: str, *, system_prompt: Optional[str]) -> str:
+        params = self._openai_request_params(prompt, system_prompt)
         response = self._openai.ChatCompletion.create(**params)
         try:
             content = response["choices"][0]["message"]["content"]
@@ -392,33 +613,139 @@ class ContentGenerator:
             raise ContentGeneratorError("OpenAI returned non-string message content")
         return content.strip()
 
-    def _generate_huggingface(self, prompt: str, *, system_prompt: Optional[str]) -> str:
-        combined_prompt = prompt
-        if system_prompt:
-            combined_prompt = f"{system_prompt.strip()}\n{prompt}"
+    def generate_many(self, prompts: Sequence[str], *, system_prompt: Optional[str] = None) -> List[str]:
+        """Generate several texts, fusing them into one model call when possible.
+
+        The Hugging Face pipeline accepts a list of prompts and runs them as
+        one batched forward pass.  The OpenAI chat endpoint has no true
+        multi-prompt request (``n`` replicates a single prompt), so that
+        provider degrades to sequential :meth:`generate` calls, which still
+        benefit from the memo cache.
+        """
+
+        prompts = list(prompts)
+        if not prompts:
+            return []
+        if len(prompts) == 1 or self.provider == "openai":
+            return [self.generate(prompt, system_prompt=system_prompt) for prompt in prompts]
+        return self._generate_huggingface_many(prompts, system_prompt=system_prompt)
+
+    def generate_stream(self, prompt: str, *, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """Yield generated text incrementally instead of all at once.
+
+        Hugging Face models stream tokens through ``TextIteratorStreamer``
+        while ``model.generate`` runs in a background thread, so callers can
+        surface (or act on) the first words while the rest is still being
+        produced.  Providers without native streaming here fall back to one
+        final chunk from :meth:`generate`.
+        """
+
+        streaming_parts = self._hf_streaming_parts() if self.provider == "huggingface" else None
+        if streaming_parts is None:
+            yield self.generate(prompt, system_prompt=system_prompt)
+            return
+
+        streamer_cls, tokenizer, model = streaming_parts
+        combined = f"{system_prompt.strip()}\n{prompt}" if system_prompt else prompt
+        streamer = streamer_cls(tokenizer, skip_prompt=True, skip_special_tokens=True)
+        inputs = tokenizer(combined, return_tensors="pt")
+        if hasattr(inputs, "to") and hasattr(model, "device"):
+            inputs = inputs.to(model.device)
+
+        generation_kwargs = self._hf_generation_kwargs()
+        generation_kwargs.pop("batch_size", None)
+        worker = threading.Thread(
+            target=model.generate,
+            kwargs={**inputs, "streamer": streamer, **generation_kwargs},
+            daemon=True,
+        )
+        worker.start()
+        try:
+            for piece in streamer:
+                if piece:
+                    yield piece
+        finally:
+            worker.join()
 
+    def _hf_streaming_parts(self) -> Optional[Tuple[Any, Any, Any]]:
+        """Return ``(TextIteratorStreamer, tokenizer, model)`` when streamable."""
+
+        try:
+            from transformers import TextIteratorStreamer  # type: ignore[import-not-found]
+        except ImportError:
+            return None
+        tokenizer = getattr(self._hf_pipeline, "tokenizer", None)
+        model = getattr(self._hf_pipeline, "model", None)
+        if tokenizer is None or model is None:
+            return None
+        return TextIteratorStreamer, tokenizer, model
+
+    def _hf_generation_kwargs(self) -> Dict[str, Any]:
         generation_kwargs: Dict[str, Any] = dict(self.extra_options)
         if self.temperature is not None:
             generation_kwargs.setdefault("temperature", self.temperature)
         if self.max_tokens is not None:
             generation_kwargs.setdefault("max_new_tokens", self.max_tokens)
+        return generation_kwargs
 
-        outputs = self._hf_pipeline(combined_prompt, **generation_kwargs)
-        if not outputs:
-            raise ContentGeneratorError("Hugging Face pipeline did not return any output")
-
-        first = outputs[0]
-        if isinstance(first, Mapping):
+    @staticmethod
+    def _extract_hf_text(entry: Any) -> str:
+        if isinstance(entry, Mapping):
             for key in ("generated_text", "summary_text", "text"):
-                value = first.get(key)
+                value = entry.get(key)
                 if isinstance(value, str):
                     return value.strip()
         raise ContentGeneratorError("Unsupported output format from Hugging Face pipeline")
 
+    def _generate_huggingface(self, prompt: str, *, system_prompt: Optional[str]) -> str:
+        combined_prompt = prompt
+        if system_prompt:
+            combined_prompt = f"{system_prompt.strip()}\n{prompt}"
+
+        outputs = self._hf_pipeline(combined_prompt, **self._hf_generation_kwargs())
+        if not outputs:
+            raise ContentGeneratorError("Hugging Face pipeline did not return any output")
+        return self._extract_hf_text(outputs[0])
+
+    def _generate_huggingface_many(self, prompts: Sequence[str], *, system_prompt: Optional[str]) -> List[str]:
+        if system_prompt:
+            prefix = system_prompt.strip()
+            combined = [f"{prefix}\n{prompt}" for prompt in prompts]
+        else:
+            combined = list(prompts)
+
+        generation_kwargs = self._hf_generation_kwargs()
+        generation_kwargs.setdefault("batch_size", len(combined))
+        outputs = self._hf_pipeline(combined, **generation_kwargs)
+        if not outputs or len(outputs) != len(combined):
+            raise ContentGeneratorError("Hugging Face pipeline returned an unexpected number of outputs")
+
+        texts: List[str] = []
+        for output in outputs:
+            # Batched pipelines wrap each prompt's results in a list.
+            entry = output[0] if isinstance(output, list) else output
+            texts.append(self._extract_hf_text(entry))
+        return texts
+
 
 class ADBClient:
     """Convenience wrapper around ``adb`` with optional serial selection."""
 
+    #: Upper bound on concurrent adb invocations per target device. Bounding
+    #: this avoids overwhelming adbd when thread pools fan commands out,
+    #: while still allowing a few transfers to overlap.
+    SERIAL_MAX_CONCURRENCY = 4
+
+    #: How long (seconds) a cached ``pm path`` probe result stays valid.
+    PKG_CACHE_TTL = 300.0
+
+    _serial_semaphores: Dict[str, threading.Semaphore] = {}
+    _serial_semaphores_guard = threading.Lock()
+
+    #: adb binaries whose server has already been started by this process.
+    _servers_started: "set[str]" = set()
+    _servers_started_guard = threading.Lock()
+
     def __init__(
         self,
         adb_path: Optional[str] = None,
@@ -430,6 +757,10 @@ class ADBClient:
         self.serial = serial or os.getenv("BLISS_ADB_SERIAL")
         self.connect_address = _resolve_connect_address(connect_address)
         self.default_timeout = default_timeout
+        self.pkg_cache_ttl = self.PKG_CACHE_TTL
+        self._pkg_cache: Dict[Tuple[Optional[str], str], Tuple[float, bool]] = {}
+        self._ready_serials: set[str] = set()
+        self._persistent_shell: Optional["PersistentAdbShell"] = None
 
     # ──────────────────────────────────────────────────────────────────────
     # Utility helpers
@@ -441,6 +772,72 @@ class ADBClient:
             cmd.extend(["-s", self.serial])
         return cmd
 
+    def _serial_key(self) -> str:
+        return self.serial or self.connect_address or "<any>"
+
+    def mark_ready(self) -> None:
+        """Record that the current target device passed its readiness check."""
+
+        self._ready_serials.add(self._serial_key())
+
+    def is_ready(self) -> bool:
+        """Return whether the target device is cached as known-online."""
+
+        return self._serial_key() in self._ready_serials
+
+    def _serial_semaphore(self) -> threading.Semaphore:
+        key = self.serial or self.connect_address or "<any>"
+        with ADBClient._serial_semaphores_guard:
+            semaphore = ADBClient._serial_semaphores.get(key)
+            if semaphore is None:
+                semaphore = threading.Semaphore(self.SERIAL_MAX_CONCURRENCY)
+                ADBClient._serial_semaphores[key] = semaphore
+            return semaphore
+
+    def _ensure_server(self) -> None:
+        """Start the local adb server once per process and adb binary.
+
+        Relying on the implicit auto-start means the first command of every
+        worker pays the ~1s server boot, and parallel workers race each
+        other through it.  Starting it explicitly up front also fails fast
+        when the binary is missing instead of on some later command.
+        ``adb start-server`` is idempotent, so concurrent processes at
+        worst both issue a no-op.
+        """
+
+        if self.adb_path in self._servers_started:
+            return
+        with self._servers_started_guard:
+            if self.adb_path in self._servers_started:
+                return
+            subprocess.run(
+                [self.adb_path, "start-server"],
+                check=False,
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+            self._servers_started.add(self.adb_path)
+
+    @staticmethod
+    def _drain_stream(
+        stream: Any,
+        sink: io.StringIO,
+        on_output: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """Copy a subprocess pipe into ``sink`` line by line.
+
+        Reading incrementally keeps the OS pipe buffer from filling up on
+        chatty commands (large installs, verbose ``devices -l``) and lets an
+        optional ``on_output`` callback observe progress as it happens.
+        """
+
+        for line in stream:
+            sink.write(line)
+            if on_output is not None:
+                on_output(line.rstrip("\n"))
+        stream.close()
+
     def run(
         self,
         args: Sequence[str],
@@ -448,21 +845,173 @@ class ADBClient:
         timeout: Optional[int] = None,
         check: bool = True,
         capture_output: bool = True,
+        on_output: Optional[Callable[[str], None]] = None,
     ) -> subprocess.CompletedProcess[str]:
         command = self._adb_base() + list(args)
+
+        shell_session = self._persistent_shell
+        if shell_session is not None and args and args[0] == "shell" and len(args) > 1:
+            # A lone shell argument is already a complete script (see
+            # shell_script / installed_packages); quoting it would collapse
+            # the whole script into a single command name.
+            script = args[1] if len(args) == 2 else shlex.join(list(args)[1:])
+            try:
+                returncode, output = shell_session.run(
+                    script, timeout=timeout or self.default_timeout
+                )
+            except OSError:
+                logger.warning("Persistent adb shell died; reverting to one-shot commands")
+                self._persistent_shell = None
+            else:
+                if check and returncode != 0:
+                    raise ADBCommandError(command, returncode, output, "")
+                return subprocess.CompletedProcess(command, returncode, output, "")
+
+        self._ensure_server()
         logger.debug("Executing adb command: %s", shlex.join(command))
-        completed = subprocess.run(
+        stdout_sink = io.StringIO()
+        stderr_sink = io.StringIO()
+        with self._serial_semaphore():
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE if capture_output else None,
+                stderr=subprocess.PIPE if capture_output else None,
+                text=True,
+            )
+            readers: List[threading.Thread] = []
+            if capture_output:
+                for stream, sink, callback in (
+                    (process.stdout, stdout_sink, on_output),
+                    (process.stderr, stderr_sink, None),
+                ):
+                    reader = threading.Thread(
+                        target=self._drain_stream, args=(stream, sink, callback), daemon=True
+                    )
+                    reader.start()
+                    readers.append(reader)
+            try:
+                returncode = process.wait(timeout=timeout or self.default_timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                raise
+            for reader in readers:
+                reader.join()
+        completed = subprocess.CompletedProcess(
+            command, returncode, stdout_sink.getvalue(), stderr_sink.getvalue()
+        )
+        if check and completed.returncode != 0:
+            # The failure may mean the device dropped offline; make the next
+            # ensure_device() re-verify instead of trusting the cached flag.
+            self._ready_serials.discard(self._serial_key())
+            raise ADBCommandError(command, completed.returncode, completed.stdout, completed.stderr)
+        logger.debug("adb command finished with return code %s", completed.returncode)
+        return completed
+
+    async def arun(
+        self,
+        args: Sequence[str],
+        *,
+        timeout: Optional[int] = None,
+        check: bool = True,
+    ) -> subprocess.CompletedProcess[str]:
+        """Async sibling of :meth:`run` built on ``asyncio`` subprocesses.
+
+        Lets callers overlap several independent adb invocations (or adb I/O
+        with other work) instead of serialising on the blocking
+        ``subprocess.run`` path.
+        """
+
+        command = self._adb_base() + list(args)
+        logger.debug("Executing adb command (async): %s", shlex.join(command))
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                process.communicate(), timeout or self.default_timeout
+            )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+        completed = subprocess.CompletedProcess(
             command,
-            check=False,
-            capture_output=capture_output,
-            text=True,
-            timeout=timeout or self.default_timeout,
+            process.returncode or 0,
+            stdout_bytes.decode("utf-8", errors="replace"),
+            stderr_bytes.decode("utf-8", errors="replace"),
         )
         if check and completed.returncode != 0:
             raise ADBCommandError(command, completed.returncode, completed.stdout, completed.stderr)
         logger.debug("adb command finished with return code %s", completed.returncode)
         return completed
 
+    async def ashell(self, *args: str, timeout: Optional[int] = None) -> str:
+        result = await self.arun(["shell", *args], timeout=timeout or 30)
+        return result.stdout.strip()
+
+    async def ainstall(self, apk_path: Path, *, reinstall: bool = False, timeout: Optional[int] = None) -> str:
+        install_args = ["install", "-r", str(apk_path)] if reinstall else ["install", str(apk_path)]
+        result = await self.arun(install_args, timeout=timeout)
+        return result.stdout.strip()
+
+    async def apush(self, source: Path, destination: str) -> str:
+        result = await self.arun(["push", str(source), destination], timeout=120)
+        return result.stdout.strip()
+
+    # ──────────────────────────────────────────────────────────────────────
+    # Persistent shell session management
+    # ──────────────────────────────────────────────────────────────────────
+
+    def start_persistent_shell(self) -> "PersistentAdbShell":
+        """Lazily create and attach a shared shell session for this client.
+
+        Once attached, every ``shell`` subcommand issued through :meth:`run`
+        (``force_stop``, ``is_package_installed``, ``input``/``am`` helpers,
+        share intents, ...) reuses the single session instead of forking a
+        new ``adb`` process per call.
+        """
+
+        if self._persistent_shell is None:
+            shell = PersistentAdbShell(self)
+            shell.start()
+            self._persistent_shell = shell
+        return self._persistent_shell
+
+    def shell_persistent(self, command: str, *, check: bool = True) -> str:
+        """Run a raw shell ``command`` through the long-lived session."""
+
+        shell = self.start_persistent_shell()
+        try:
+            returncode, output = shell.run(command)
+        except OSError:
+            logger.warning("Persistent adb shell died; retrying via one-shot adb")
+            self.close_persistent_shell()
+            return self.run(["shell", command], check=check).stdout
+        if check and returncode != 0:
+            raise ADBCommandError(self._adb_base() + ["shell", command], returncode, output, "")
+        return output
+
+    def close_persistent_shell(self) -> None:
+        shell = self._persistent_shell
+        self._persistent_shell = None
+        if shell is not None:
+            shell.close()
+
+    def close(self) -> None:
+        """Release resources held by the client (the shared shell session)."""
+
+        self.close_persistent_shell()
+
+    def __enter__(self) -> "ADBClient":
+        self.start_persistent_shell()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     # ──────────────────────────────────────────────────────────────────────
     # Device discovery and connection management
     # ──────────────────────────────────────────────────────────────────────
@@ -490,17 +1039,12 @@ class ADBClient:
         result = self.run(["devices", "-l"], timeout=15)
         devices: List[Dict[str, str]] = []
         for line in result.stdout.splitlines()[1:]:  # Skip the header
-            line = line.strip()
-            if not line:
+            match = _DEVICE_LINE.match(line.strip())
+            if match is None:
                 continue
-            parts = line.split()
-            serial = parts[0]
-            status = parts[1] if len(parts) > 1 else "unknown"
-            attrs: Dict[str, str] = {"serial": serial, "status": status}
-            for token in parts[2:]:
-                if ":" in token:
-                    key, value = token.split(":", 1)
-                    attrs[key] = value
+            serial, status, rest = match.groups()
+            attrs: Dict[str, str] = {"serial": serial, "status": status or "unknown"}
+            attrs.update(_DEVICE_ATTR.findall(rest))
             devices.append(attrs)
         logger.info("Detected %d adb device(s)", len(devices))
         return devices
@@ -548,7 +1092,15 @@ class ADBClient:
             args.append("-r")
         args.append(str(apk_path))
         logger.info("Installing APK %s (reinstall=%s)", apk_path, reinstall)
-        result = self.run(args, timeout=timeout, check=True)
+        result = self.run(
+            args,
+            timeout=timeout,
+            check=True,
+            on_output=lambda line: logger.info("adb install: %s", line),
+        )
+        # The package name inside the APK is unknown here, so drop the whole
+        # probe cache rather than a single entry.
+        self.invalidate_package_cache()
         return result.stdout.strip()
 
     def uninstall(self, package: str, *, keep_data: bool = False, timeout: Optional[int] = None) -> str:
@@ -558,15 +1110,33 @@ class ADBClient:
         args.append(package)
         logger.info("Uninstalling package %s (keep_data=%s)", package, keep_data)
         result = self.run(args, timeout=timeout, check=True)
+        self.invalidate_package_cache(package)
         return result.stdout.strip()
 
     def is_package_installed(self, package: str) -> bool:
+        key = (self.serial or self.connect_address, package)
+        cached = self._pkg_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.pkg_cache_ttl:
+            return cached[1]
         result = self.run(["shell", "pm", "path", package], check=False)
-        return result.returncode == 0 and "package:" in result.stdout
+        installed = result.returncode == 0 and "package:" in result.stdout
+        self._pkg_cache[key] = (time.monotonic(), installed)
+        return installed
+
+    def invalidate_package_cache(self, package: Optional[str] = None) -> None:
+        """Forget cached ``pm path`` probes after installs/uninstalls."""
+
+        if package is None:
+            self._pkg_cache.clear()
+            return
+        for key in [key for key in self._pkg_cache if key[1] == package]:
+            del self._pkg_cache[key]
 
     def force_stop(self, package: str) -> None:
         logger.info("Force stopping package %s", package)
-        self.run(["shell", "am", "force-stop", package], check=False)
+        # The exit code is ignored anyway, so this qualifies for the direct
+        # socket path.
+        self.shell_fast("am", "force-stop", package)
 
     def launch_activity(self, component: str, *, extras: Sequence[str] = ()) -> str:
         args = ["shell", "am", "start", "-n", component, *extras]
@@ -585,6 +1155,22 @@ class ADBClient:
         result = self.run(["push", str(source), destination], timeout=120)
         return result.stdout.strip()
 
+    def push_many(self, sources: Sequence[Path], destination_dir: str) -> str:
+        """Transfer several files with a single ``adb push`` invocation.
+
+        ``adb push`` accepts multiple sources followed by a destination
+        directory, so N uploads cost one process spawn and one device
+        handshake instead of N.
+        """
+
+        if not sources:
+            return ""
+        logger.info("Pushing %d file(s) -> %s", len(sources), destination_dir)
+        target = destination_dir if destination_dir.endswith("/") else f"{destination_dir}/"
+        args = ["push", *[str(source) for source in sources], target]
+        result = self.run(args, timeout=120 * len(sources))
+        return result.stdout.strip()
+
     def ensure_remote_directory(self, path: str) -> None:
         """Ensure a directory exists on the BlissOS device before uploading."""
 
@@ -598,6 +1184,42 @@ class ADBClient:
         # behaviour deterministic across devices.
         self.run(["shell", "mkdir", "-p", normalized], check=False)
 
+    def shell_script(self, commands: Sequence[str], *, timeout: Optional[int] = None, check: bool = True) -> str:
+        """Run several shell commands in a single adb round-trip.
+
+        Joining independent commands with ``;`` amortises the per-invocation
+        connection cost over the whole script instead of paying it per
+        command.
+        """
+
+        return self.run(["shell", "; ".join(commands)], timeout=timeout, check=check).stdout
+
+    def installed_packages(self, packages: Sequence[str]) -> Dict[str, bool]:
+        """Probe several packages for installation with one shell call.
+
+        Instead of firing ``pm path`` per package (one adb round-trip each),
+        a single shell script echoes a marker line per package whose suffix
+        encodes whether ``pm path`` succeeded.
+        """
+
+        unique = list(dict.fromkeys(packages))
+        if not unique:
+            return {}
+        script = "; ".join(
+            f"echo __PKG__{shlex.quote(pkg)}:$(pm path {shlex.quote(pkg)} >/dev/null 2>&1 && echo 1 || echo 0)"
+            for pkg in unique
+        )
+        result = self.run(["shell", script], check=False)
+        installed = {pkg: False for pkg in unique}
+        for line in result.stdout.splitlines():
+            line = line.strip()
+            if not line.startswith("__PKG__"):
+                continue
+            name, _, flag = line[len("__PKG__"):].rpartition(":")
+            if name in installed:
+                installed[name] = flag == "1"
+        return installed
+
     def wait_for_device(self, serial: Optional[str] = None, *, timeout: Optional[int] = None) -> None:
         args = []
         if serial or self.serial or self.connect_address:
@@ -608,6 +1230,85 @@ class ADBClient:
         result = self.run(["shell", *args], timeout=timeout or 30)
         return result.stdout.strip()
 
+    # ──────────────────────────────────────────────────────────────────────
+    # Direct adb server protocol (bypasses the adb CLI binary)
+    # ──────────────────────────────────────────────────────────────────────
+
+    #: Default TCP port of the local adb server.
+    ADB_SERVER_PORT = 5037
+
+    def _adb_server_address(self) -> Tuple[str, int]:
+        port = os.getenv("ANDROID_ADB_SERVER_PORT")
+        return ("127.0.0.1", int(port) if port else self.ADB_SERVER_PORT)
+
+    @staticmethod
+    def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+        data = b""
+        while len(data) < size:
+            chunk = sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("adb server closed the connection mid-message")
+            data += chunk
+        return data
+
+    def _send_adb_request(self, sock: socket.socket, message: str) -> None:
+        payload = message.encode("utf-8")
+        sock.sendall(f"{len(payload):04x}".encode("ascii") + payload)
+        status = self._recv_exactly(sock, 4)
+        if status != b"OKAY":
+            length = int(self._recv_exactly(sock, 4), 16)
+            reason = self._recv_exactly(sock, length).decode("utf-8", errors="replace")
+            raise ADBCommandError([self.adb_path, message], 1, "", reason)
+
+    def _adb_protocol_cmd(self, command: str, *, timeout: Optional[int] = None) -> str:
+        """Run a shell command by speaking the adb wire protocol directly.
+
+        Connects to the local adb server, selects the transport and issues
+        the legacy ``shell:`` service, skipping the fork of the ``adb``
+        binary entirely.  The response is the raw command output; the v1
+        service does not report an exit code.
+        """
+
+        target = self.serial or self.connect_address
+        with socket.create_connection(
+            self._adb_server_address(), timeout or self.default_timeout
+        ) as sock:
+            sock.settimeout(timeout or self.default_timeout)
+            self._send_adb_request(
+                sock, f"host:transport:{target}" if target else "host:transport-any"
+            )
+            self._send_adb_request(sock, f"shell:{command}")
+            output = bytearray()
+            while True:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                output.extend(chunk)
+        return output.decode("utf-8", errors="replace")
+
+    def shell_fast(self, *args: str, timeout: Optional[int] = None) -> str:
+        """Run an output-insensitive shell command without forking ``adb``.
+
+        Intended for hot fire-and-forget commands (``input tap``, ``input
+        text``, ``am force-stop``) where the exit code is not inspected.
+        Prefers an attached persistent session, then the raw server socket,
+        and finally falls back to the regular CLI path when the socket is
+        unavailable.  All paths stay best-effort: the v1 shell service never
+        reports an exit code, so the fallbacks run with ``check=False`` to
+        match.
+        """
+
+        if self._persistent_shell is not None:
+            result = self.run(["shell", *args], timeout=timeout or 30, check=False)
+            return result.stdout.strip()
+        command = shlex.join(list(args))
+        try:
+            return self._adb_protocol_cmd(command, timeout=timeout).strip()
+        except OSError as exc:
+            logger.debug("adb server socket unavailable (%s); using the adb CLI", exc)
+            result = self.run(["shell", *args], timeout=timeout or 30, check=False)
+            return result.stdout.strip()
+
 
 def _resolve_connect_address(explicit: Optional[str]) -> Optional[str]:
     if explicit:
@@ -622,6 +1323,124 @@ def _resolve_connect_address(explicit: Optional[str]) -> Optional[str]:
     return None
 
 
+class PersistentAdbShell:
+    """Reusable ``adb shell`` session for chatty automation workflows.
+
+    Every :meth:`ADBClient.run` call normally spawns a fresh ``adb`` process
+    that performs its own handshake with the device.  For command sequences
+    dominated by tiny ``shell`` invocations (force-stop, ``am start`` share
+    intents, ``mkdir -p``) this start-up cost outweighs the actual work.  The
+    helper keeps a single ``adb shell`` child alive and multiplexes commands
+    over its stdin/stdout, terminating each command with a sentinel line that
+    also carries the exit status.
+
+    Entering the context manager attaches the session to the owning
+    :class:`ADBClient`, transparently accelerating every ``shell``
+    subcommand; if the child process dies the client silently falls back to
+    one-shot invocations.
+    """
+
+    _SENTINEL = "__BLISS_SHELL_DONE__"
+
+    def __init__(self, adb: ADBClient) -> None:
+        self._adb = adb
+        self._process: Optional[subprocess.Popen[str]] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Spawn the backing ``adb shell`` process if it is not running."""
+
+        if self._process is not None and self._process.poll() is None:
+            return
+        command = self._adb._adb_base() + ["shell"]
+        logger.debug("Starting persistent adb shell: %s", shlex.join(command))
+        self._process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+
+    def run(self, command: str, *, timeout: Optional[float] = None) -> Tuple[int, str]:
+        """Execute ``command`` in the shared session and return (rc, output).
+
+        When ``timeout`` is given a watchdog kills the backing process if the
+        sentinel does not arrive in time; the session restarts on the next
+        command.  Without it a hung device command would block ``readline``
+        forever, silently discarding the caller's deadline.
+        """
+
+        with self._lock:
+            self.start()
+            process = self._process
+            assert process is not None and process.stdin is not None and process.stdout is not None
+            process.stdin.write(f"{command}; echo {self._SENTINEL}$?\n")
+            process.stdin.flush()
+            watchdog: Optional[threading.Timer] = None
+            timed_out = threading.Event()
+            if timeout is not None:
+                def _expire() -> None:
+                    timed_out.set()
+                    process.kill()
+
+                watchdog = threading.Timer(timeout, _expire)
+                watchdog.daemon = True
+                watchdog.start()
+            chunks: List[str] = []
+            try:
+                while True:
+                    line = process.stdout.readline()
+                    if not line:
+                        if timed_out.is_set():
+                            raise subprocess.TimeoutExpired(command, timeout or 0)
+                        raise BrokenPipeError("Persistent adb shell terminated unexpectedly")
+                    stripped = line.rstrip("\r\n")
+                    if stripped.startswith(self._SENTINEL):
+                        suffix = stripped[len(self._SENTINEL):]
+                        try:
+                            returncode = int(suffix)
+                        except ValueError:
+                            returncode = 1
+                        return returncode, "".join(chunks)
+                    chunks.append(line)
+            finally:
+                if watchdog is not None:
+                    watchdog.cancel()
+
+    def close(self) -> None:
+        """Terminate the backing shell process, ignoring teardown errors."""
+
+        with self._lock:
+            process = self._process
+            self._process = None
+        if process is None:
+            return
+        try:
+            if process.stdin is not None:
+                process.stdin.write("exit\n")
+                process.stdin.flush()
+                process.stdin.close()
+            process.wait(timeout=5)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            process.kill()
+
+    def __enter__(self) -> "PersistentAdbShell":
+        try:
+            self.start()
+        except OSError as exc:
+            logger.warning("Could not start persistent adb shell (%s); using one-shot mode", exc)
+            return self
+        self._adb._persistent_shell = self
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._adb._persistent_shell is self:
+            self._adb._persistent_shell = None
+        self.close()
+
+
 class PPADBClient:
     """Pure Python alternative to :class:`ADBClient` using ``ppadb``."""
 
@@ -882,6 +1701,12 @@ class PPADBClient:
         device.push(str(source), destination)
         return f"Pushed {source} -> {destination}"
 
+    def push_many(self, sources: Sequence[Path], destination_dir: str) -> str:
+        # ppadb has no multi-source transfer; mirror the interface with a loop.
+        base = destination_dir.rstrip("/")
+        messages = [self.push(source, f"{base}/{Path(source).name}") for source in sources]
+        return "\n".join(messages)
+
     def ensure_remote_directory(self, path: str) -> None:
         normalized = path.strip()
         if not normalized or normalized == "." or normalized == "/":
@@ -899,12 +1724,34 @@ class PPADBClient:
         output = device.shell(command, timeout=timeout or self.default_timeout)
         return str(output or "")
 
+#: Media suffix → MIME category used by :meth:`ShareIntent.determine_mime`.
+_MIME_BY_SUFFIX = {
+    ".jpg": "image/*",
+    ".jpeg": "image/*",
+    ".png": "image/*",
+    ".gif": "image/*",
+    ".webp": "image/*",
+    ".mp4": "video/*",
+    ".mov": "video/*",
+    ".mkv": "video/*",
+    ".webm": "video/*",
+}
+
+#: Static ``am start`` argument fragments reused by every share command.
+_EXTRA_SUBJECT = ("-e", "android.intent.extra.SUBJECT")
+_EXTRA_TEXT = ("-e", "android.intent.extra.TEXT")
+_EXTRA_STREAM = ("--eu", "android.intent.extra.STREAM")
+_SEND_MULTIPLE = "android.intent.action.SEND_MULTIPLE"
+
+#: Translation table for ``adb shell input text`` escaping; built once so the
+#: string is walked a single time in C instead of once per replacement.
+_INPUT_TRANSLATE = str.maketrans({" ": "%s", "\n": "%n", "\t": "%t", "'": "\\'"})
+
+
 def _encode_input_text(value: str) -> str:
     """Prepare text for ``adb shell input text`` (escape spaces and quotes)."""
 
-    escaped = value.replace(" ", "%s").replace("\n", "%n")
-    escaped = escaped.replace("\t", "%t").replace("'", "\\'")
-    return escaped
+    return value.translate(_INPUT_TRANSLATE)
 
 
 @dataclass
@@ -922,27 +1769,125 @@ class ShareIntent:
         if self.mime_type:
             return self.mime_type
         if self.media_files:
-            # Pick a heuristic based on file suffix.
-            suffixes = {path.suffix.lower() for path in self.media_files if path.suffix}
-            if suffixes <= {".jpg", ".jpeg", ".png", ".gif", ".webp"}:
-                return "image/*"
-            if suffixes <= {".mp4", ".mov", ".mkv", ".webm"}:
-                return "video/*"
+            # Suffix heuristic via one dict lookup per file; mixed or unknown
+            # suffixes fall through to the app default.
+            categories = {
+                _MIME_BY_SUFFIX.get(path.suffix.lower())
+                for path in self.media_files
+                if path.suffix
+            }
+            if len(categories) == 1 and None not in categories:
+                return categories.pop()  # type: ignore[return-value]
         return self.app.default_mime_type
 
 
+@dataclass
+class BatchPlan:
+    """One validated entry of a :meth:`BlissSocialAutomation.publish_batch` plan.
+
+    All type checks and ``str`` coercions happen once in
+    :meth:`from_mapping`; the publishing loops then work with plain
+    attribute access instead of re-validating mappings per entry.
+    """
+
+    app: str
+    text: Optional[str] = None
+    generation_prompt: Optional[str] = None
+    system_prompt: Optional[str] = None
+    subject: Optional[str] = None
+    media: Tuple[Path, ...] = ()
+    remote_directory: str = "/sdcard/Download"
+    share_activity: Optional[str] = None
+    extras: Dict[str, str] = field(default_factory=dict)
+    launch_before_share: bool = False
+    launch_activity: Optional[str] = None
+
+    @classmethod
+    def from_mapping(cls, index: int, plan: Mapping[str, Any]) -> "BatchPlan":
+        """Coerce one raw batch entry, raising on malformed input.
+
+        Malformed entries raise immediately regardless of ``stop_on_error``;
+        only publishing failures are turned into per-entry error results.
+        """
+
+        if "app" not in plan:
+            raise KeyError(f"Batch entry {index} is missing the 'app' field")
+
+        extras_obj = plan.get("extras") or {}
+        if not isinstance(extras_obj, Mapping):
+            raise TypeError(
+                f"Batch entry {index} extras must be a mapping, got {type(extras_obj)!r}"
+            )
+
+        media_obj = plan.get("media") or []
+        if isinstance(media_obj, (str, Path)):
+            media_iterable: Iterable[Any] = [media_obj]
+        else:
+            if not isinstance(media_obj, Iterable):
+                raise TypeError(
+                    f"Batch entry {index} media must be iterable or string, got {type(media_obj)!r}"
+                )
+            media_iterable = media_obj
+
+        def _opt_str(value: Any) -> Optional[str]:
+            return value if value is None or isinstance(value, str) else str(value)
+
+        share_activity = plan.get("share_activity")
+        launch_activity = plan.get("launch_activity")
+        return cls(
+            app=str(plan["app"]),
+            text=_opt_str(plan.get("text")),
+            generation_prompt=_opt_str(plan.get("generation_prompt")),
+            system_prompt=_opt_str(plan.get("system_prompt")),
+            subject=_opt_str(plan.get("subject")),
+            media=tuple(Path(str(item)) for item in media_iterable),
+            remote_directory=str(plan.get("remote_directory", "/sdcard/Download")),
+            share_activity=share_activity if isinstance(share_activity, str) else None,
+            extras={str(k): str(v) for k, v in extras_obj.items()},
+            launch_before_share=bool(plan.get("launch_before_share", False)),
+            launch_activity=str(launch_activity) if launch_activity is not None else None,
+        )
+
+    def publish_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for :meth:`BlissSocialAutomation.publish_post`."""
+
+        return {
+            "text": self.text,
+            "generation_prompt": self.generation_prompt,
+            "system_prompt": self.system_prompt,
+            "subject": self.subject,
+            "media": self.media,
+            "remote_directory": self.remote_directory,
+            "share_activity": self.share_activity,
+            "extras": self.extras,
+            "launch_before_share": self.launch_before_share,
+            "launch_activity": self.launch_activity,
+        }
+
+
 class BlissSocialAutomation:
     """High level orchestration helpers for BlissOS social publishing."""
 
     def __init__(self, adb: Optional[ADBClient] = None) -> None:
         self.adb = adb or ADBClient()
+        self._default_generator: Optional[ContentGenerator] = None
 
     # ──────────────────────────────────────────────────────────────────────
     # App lifecycle operations
     # ──────────────────────────────────────────────────────────────────────
 
     def ensure_device(self) -> None:
-        """Connect to the target BlissOS device if requested."""
+        """Connect to the target BlissOS device if requested.
+
+        The check short-circuits once the device is cached as known-online
+        (see :meth:`ADBClient.mark_ready`); the cache is dropped whenever an
+        adb command fails, so the next call re-verifies. Duck-typed adb
+        doubles without the cache hooks are always fully checked.
+        """
+
+        is_ready = getattr(self.adb, "is_ready", None)
+        if is_ready is not None and is_ready():
+            return
 
         if self.adb.connect_address:
             self.adb.connect()
@@ -952,6 +1897,10 @@ class BlissSocialAutomation:
             self.adb.wait_for_device()
         self.adb.ensure_device_ready()
 
+        mark_ready = getattr(self.adb, "mark_ready", None)
+        if mark_ready is not None:
+            mark_ready()
+
     def install_app(self, apk_path: Path, *, reinstall: bool = False) -> str:
         self.ensure_device()
         return self.adb.install(apk_path, reinstall=reinstall)
@@ -960,6 +1909,21 @@ class BlissSocialAutomation:
         self.ensure_device()
         return self.adb.uninstall(package, keep_data=keep_data)
 
+    def ensure_apps_installed(self, apps: Sequence[SocialAppConfig]) -> None:
+        """Verify several applications with one shell probe instead of N.
+
+        Raises :class:`RuntimeError` naming every missing package so batch
+        callers can fail fast before pushing any media.
+        """
+
+        if not apps:
+            return
+        self.ensure_device()
+        status = self.adb.installed_packages([app.package for app in apps])
+        missing = sorted(pkg for pkg, ok in status.items() if not ok)
+        if missing:
+            raise RuntimeError(f"Applications not installed: {', '.join(missing)}")
+
     def ensure_app_installed(self, app: SocialAppConfig, apk_path: Optional[Path] = None) -> None:
         self.ensure_device()
         if self.adb.is_package_installed(app.package):
@@ -988,43 +1952,60 @@ class BlissSocialAutomation:
         logger.info("Force stopping %s", app.package)
         self.adb.force_stop(app.package)
 
-    def _prepare_remote_media(self, intent: ShareIntent) -> List[str]:
-        remote_uris: List[str] = []
-        if not intent.media_files:
-            return remote_uris
+    def _push_transfers(self, transfers: Sequence[Tuple[Union[str, Path], str]], base_directory: str) -> None:
+        """Upload ``(local, remote)`` pairs, batching into one ``adb push``.
 
-        base_directory = intent.remote_directory.rstrip("/") or "/"
+        All destinations share ``base_directory`` and keep their original
+        filenames, so a single multi-source push covers the whole batch;
+        adb doubles without :meth:`ADBClient.push_many` fall back to the
+        per-file call.
+        """
+
+        if not transfers:
+            return
+        push_many = getattr(self.adb, "push_many", None)
+        if len(transfers) > 1 and push_many is not None:
+            push_many([path for path, _ in transfers], base_directory)
+            return
+        for path, destination in transfers:
+            self.adb.push(path, destination)
+
+    def _prepare_remote_media(self, intent: ShareIntent) -> List[str]:
+        remote_uris: List[str] = []
+        if not intent.media_files:
+            return remote_uris
+
+        base_directory = intent.remote_directory.rstrip("/") or "/"
 
         if base_directory not in {"/", "."}:
             self.adb.ensure_remote_directory(base_directory)
 
-        ensured_directories: set[str] = {base_directory} if base_directory not in {"/", "."} else set()
-
-        for media in intent.media_files:
-            destination = f"{intent.remote_directory.rstrip('/')}/{media.name}"
-            logger.debug("Uploading media asset %s", media)
-            parent_directory = destination.rsplit("/", 1)[0] if "/" in destination else "/"
-            if parent_directory not in ensured_directories and parent_directory not in {"/", "."}:
-                self.adb.ensure_remote_directory(parent_directory)
-                ensured_directories.add(parent_directory)
-            self.adb.push(media, destination)
-            remote_uris.append(f"file://{destination}")
-        return remote_uris
+        prefix = intent.remote_directory.rstrip("/")
+        transfers = [(media, f"{prefix}/{media.name}") for media in intent.media_files]
+        self._push_transfers(transfers, base_directory)
+        return [f"file://{destination}" for _, destination in transfers]
 
     def push_assets(
         self,
-        files: Sequence[Path],
+        files: Sequence[Union[str, Path]],
         remote_directory: str = "/sdcard/Download",
+        *,
+        resolve_symlinks: bool = False,
     ) -> Dict[str, str]:
         """Push local files to the BlissOS device and return their destinations.
 
         The helper mirrors the behaviour of ``adb push`` but adds a few quality
         of life features required by social media automation scripts.  Each
-        source path is resolved, validated and copied into ``remote_directory``
-        while preserving the original filename.  The resulting dictionary maps
-        the absolute local path to the computed remote location so the caller
-        can later reference the uploaded assets when constructing share intents
-        or other automation actions.
+        source path is validated and copied into ``remote_directory`` while
+        preserving the original filename.  The resulting dictionary maps the
+        absolute local path (symlinks resolved only when ``resolve_symlinks``
+        is set) to the computed remote location so the caller can later
+        reference the uploaded assets when constructing share intents or
+        other automation actions.
+
+        When several files are queued they are uploaded with a single
+        multi-source ``adb push`` invocation instead of one process per
+        file, so the batch pays the adb handshake cost only once.
         """
 
         self.ensure_device()
@@ -1037,54 +2018,66 @@ class BlissSocialAutomation:
             self.adb.ensure_remote_directory(base_directory)
             ensured_directories.add(base_directory)
 
+        transfers: List[Tuple[str, str]] = []
         for item in files:
-            path = Path(item)
-            if not path.exists():
-                raise FileNotFoundError(path)
+            source = os.fspath(item)
+            if not os.path.isfile(source):
+                raise FileNotFoundError(source)
 
+            name = os.path.basename(source)
             if base_directory == "/":
-                destination = f"/{path.name}"
+                destination = f"/{name}"
             else:
-                destination = f"{base_directory}/{path.name}"
+                destination = f"{base_directory}/{name}"
 
             parent_directory = destination.rsplit("/", 1)[0] if "/" in destination else "/"
             if parent_directory not in ensured_directories and parent_directory not in {"/", "."}:
                 self.adb.ensure_remote_directory(parent_directory)
                 ensured_directories.add(parent_directory)
 
-            self.adb.push(path, destination)
-            uploaded[str(path.resolve())] = destination
+            transfers.append((source, destination))
+
+        self._push_transfers(transfers, base_directory)
+
+        # ``abspath`` is pure string manipulation; ``realpath`` (and thus
+        # ``Path.resolve``) costs a syscall per file, so symlink resolution
+        # is opt-in.
+        key_of = os.path.realpath if resolve_symlinks else os.path.abspath
+        for source, destination in transfers:
+            uploaded[key_of(source)] = destination
 
         return uploaded
 
     def _build_share_command(self, intent: ShareIntent, remote_uris: Sequence[str]) -> List[str]:
-        mime = intent.determine_mime()
-        action = intent.app.share_action
-        extras: List[str] = []
-        if intent.subject:
-            extras.extend(["-e", "android.intent.extra.SUBJECT", intent.subject])
-        if intent.text and intent.app.allow_text_extra:
-            extras.extend(["-e", "android.intent.extra.TEXT", intent.text])
-        for key, value in intent.extras.items():
-            extras.extend(["-e", key, value])
-        permission_flags: List[str] = []
-        if remote_uris:
-            if intent.app.supports_multiple and len(remote_uris) > 1:
-                action = "android.intent.action.SEND_MULTIPLE"
-            for uri in remote_uris:
-                extras.extend(["--eu", "android.intent.extra.STREAM", uri])
-            if intent.app.grant_read_uri_permission:
-                permission_flags.append("--grant-read-uri-permission")
-
-        extras.extend(intent.app.extra_flags)
-        component = intent.app.share_component(intent.share_activity)
+        # Assembled into a single list in final argument order; the static
+        # flag pairs live at module scope so no throwaway literal lists are
+        # allocated per share intent.
+        app = intent.app
+        action = app.share_action
+        if remote_uris and app.supports_multiple and len(remote_uris) > 1:
+            action = _SEND_MULTIPLE
+
         command = ["shell", "am", "start", "-a", action]
-        for category in intent.app.share_categories:
-            command.extend(["-c", category])
-        command.extend(["-t", mime, *permission_flags])
+        for category in app.share_categories:
+            command += ("-c", category)
+        command += ("-t", intent.determine_mime())
+        if remote_uris and app.grant_read_uri_permission:
+            command.append("--grant-read-uri-permission")
+        component = app.share_component(intent.share_activity)
         if component:
-            command.extend(["-n", component])
-        command.extend(extras)
+            command += ("-n", component)
+        if intent.subject:
+            command += _EXTRA_SUBJECT
+            command.append(intent.subject)
+        if intent.text and app.allow_text_extra:
+            command += _EXTRA_TEXT
+            command.append(intent.text)
+        for key, value in intent.extras.items():
+            command += ("-e", key, value)
+        for uri in remote_uris:
+            command += _EXTRA_STREAM
+            command.append(uri)
+        command += app.extra_flags
         return command
 
     def share(self, intent: ShareIntent) -> str:
@@ -1104,6 +2097,7 @@ class BlissSocialAutomation:
         generator: Optional[ContentGenerator] = None,
         generator_options: Optional[Mapping[str, Any]] = None,
         system_prompt: Optional[str] = None,
+        enable_cache: bool = True,
     ) -> str:
         """Generate social media copy using the configured LLM provider."""
 
@@ -1111,25 +2105,79 @@ class BlissSocialAutomation:
             raise ValueError("Specify either an existing generator or generator_options, not both")
 
         if generator is None:
-            options_dict = dict(generator_options or {})
-            generator = ContentGenerator(**options_dict)
+            if generator_options:
+                generator = ContentGenerator(**dict(generator_options))
+            else:
+                generator = self._shared_generator()
 
+        if not enable_cache:
+            return generator.generate(prompt, system_prompt=system_prompt, use_cache=False)
         return generator.generate(prompt, system_prompt=system_prompt)
 
+    def generate_post_text_batch(
+        self,
+        prompts: Sequence[str],
+        *,
+        generator: Optional[ContentGenerator] = None,
+        generator_options: Optional[Mapping[str, Any]] = None,
+        system_prompt: Optional[str] = None,
+    ) -> List[str]:
+        """Generate copy for several prompts in one provider round.
+
+        Routes through :meth:`ContentGenerator.generate_many`, so Hugging
+        Face runs a single batched inference call instead of one forward
+        pass per prompt.  ``publish_batch`` uses the same path internally
+        when plan entries need generated text.
+        """
+
+        if generator is not None and generator_options is not None:
+            raise ValueError("Specify either an existing generator or generator_options, not both")
+
+        if generator is None:
+            if generator_options:
+                generator = ContentGenerator(**dict(generator_options))
+            else:
+                generator = self._shared_generator()
+
+        return generator.generate_many(list(prompts), system_prompt=system_prompt)
+
+    def _shared_generator(self) -> ContentGenerator:
+        """Return the default generator, constructing it at most once.
+
+        Rebuilding a :class:`ContentGenerator` per post re-imports the
+        provider SDK and, for Hugging Face, reloads the whole model; keeping
+        one instance on the automation object pays that cost a single time
+        and lets its memo cache span posts.
+        """
+
+        if self._default_generator is None:
+            self._default_generator = ContentGenerator()
+        return self._default_generator
+
+    def _shell_fire(self, *args: str) -> str:
+        """Issue an output-insensitive shell command on the fastest path.
+
+        Uses :meth:`ADBClient.shell_fast` when the adb backend offers it
+        (raw server socket, no CLI fork) and plain ``shell`` otherwise.
+        """
+
+        shell_fast = getattr(self.adb, "shell_fast", None)
+        if shell_fast is not None:
+            return shell_fast(*args)
+        return self.adb.shell(*args)
+
     def input_text(self, value: str) -> str:
         self.ensure_device()
         encoded = _encode_input_text(value)
-        result = self.adb.shell("input", "text", encoded)
-        return result.strip()
+        return self._shell_fire("input", "text", encoded).strip()
 
     def tap(self, x: int, y: int) -> str:
         self.ensure_device()
-        result = self.adb.shell("input", "tap", str(x), str(y))
-        return result.strip()
+        return self._shell_fire("input", "tap", str(x), str(y)).strip()
 
     def swipe(self, x1: int, y1: int, x2: int, y2: int, duration_ms: int = 300) -> str:
         self.ensure_device()
-        result = self.adb.shell(
+        return self._shell_fire(
             "input",
             "swipe",
             str(x1),
@@ -1137,8 +2185,7 @@ class BlissSocialAutomation:
             str(x2),
             str(y2),
             str(duration_ms),
-        )
-        return result.strip()
+        ).strip()
 
     def publish_post(
         self,
@@ -1157,10 +2204,7 @@ class BlissSocialAutomation:
         launch_before_share: bool = False,
         launch_activity: Optional[str] = None,
     ) -> str:
-        try:
-            app = SOCIAL_APPS[app_name.lower()]
-        except KeyError as exc:
-            raise KeyError(f"Unknown social app '{app_name}'. Available: {', '.join(SOCIAL_APPS)}") from exc
+        app = _lookup_social_app(app_name)
 
         resolved_text = text
         if generation_prompt and resolved_text is None:
@@ -1192,67 +2236,243 @@ class BlissSocialAutomation:
         )
         return self.share(intent)
 
+    async def apublish_post(
+        self,
+        app_name: str,
+        *,
+        text: Optional[str] = None,
+        generation_prompt: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+        generator: Optional[ContentGenerator] = None,
+        generator_options: Optional[Mapping[str, Any]] = None,
+        subject: Optional[str] = None,
+        media: Sequence[Path] = (),
+        remote_directory: str = "/sdcard/Download",
+        share_activity: Optional[str] = None,
+        extras: Optional[MutableMapping[str, str]] = None,
+        launch_before_share: bool = False,
+        launch_activity: Optional[str] = None,
+    ) -> str:
+        """Async :meth:`publish_post` that overlaps generation with uploads.
+
+        Text generation is network/GPU bound while media preparation is adb
+        bound, so the two run concurrently instead of back to back; the
+        share intent fires once both are resolved.
+        """
+
+        app = _lookup_social_app(app_name)
+        intent = ShareIntent(
+            app=app,
+            text=text,
+            subject=subject,
+            media_files=list(media),
+            remote_directory=remote_directory,
+            share_activity=share_activity,
+            extras=extras or {},
+        )
+
+        generation_task: Optional["asyncio.Task[str]"] = None
+        if generation_prompt and text is None:
+            if generator is not None and generator_options is not None:
+                raise ValueError("Specify either an existing generator or generator_options, not both")
+            if generator is None:
+                generator = ContentGenerator(**dict(generator_options or {}))
+            logger.info("Generating post text for %s", app.package)
+            generation_task = asyncio.create_task(
+                generator.agenerate(generation_prompt, system_prompt=system_prompt)
+            )
+
+        await asyncio.to_thread(self.ensure_device)
+        push_job = asyncio.to_thread(self._prepare_remote_media, intent)
+        if generation_task is not None:
+            remote_uris, intent.text = await asyncio.gather(push_job, generation_task)
+        else:
+            remote_uris = await push_job
+
+        if launch_before_share:
+            activity_target = launch_activity or app.launch_activity or share_activity
+            await asyncio.to_thread(self.launch_app, app, activity=activity_target)
+
+        command = self._build_share_command(intent, remote_uris)
+        logger.info(
+            "Sharing to %s with %d media file(s)", intent.app.package, len(remote_uris)
+        )
+        arun = getattr(self.adb, "arun", None)
+        if arun is not None:
+            result = await arun(command, timeout=120)
+        else:
+            result = await asyncio.to_thread(self.adb.run, command, timeout=120)
+        return result.stdout.strip()
+
+    def _clone_for_serial(self, serial: str) -> "BlissSocialAutomation":
+        """Return an automation instance bound to another device serial."""
+
+        adb = ADBClient(
+            adb_path=getattr(self.adb, "adb_path", None),
+            serial=serial,
+            default_timeout=getattr(self.adb, "default_timeout", 60),
+        )
+        return BlissSocialAutomation(adb)
+
     def publish_batch(
         self,
         plans: Sequence[Mapping[str, Any]],
         *,
         stop_on_error: bool = False,
+        generator: Optional[ContentGenerator] = None,
     ) -> List[Dict[str, Any]]:
-        """Execute multiple :meth:`publish_post` jobs sequentially."""
+        """Execute multiple :meth:`publish_post` jobs, one per plan entry.
 
-        results: List[Dict[str, Any]] = []
+        Plans that carry an explicit ``"serial"`` key are grouped by device
+        and the groups run concurrently (one thread each), since commands
+        for distinct devices are independent; within a device the original
+        sequential ordering is preserved. Without per-plan serials the batch
+        degenerates to the plain sequential path.
+        """
+
+        groups: Dict[Optional[str], List[int]] = {}
         for index, plan in enumerate(plans):
-            if "app" not in plan:
-                raise KeyError(f"Batch entry {index} is missing the 'app' field")
-
-            app_name = str(plan["app"])
-            text = plan.get("text")
-            subject = plan.get("subject")
-            remote_dir = str(plan.get("remote_directory", "/sdcard/Download"))
-            share_activity = plan.get("share_activity")
-            launch_before_share = bool(plan.get("launch_before_share", False))
-            launch_activity_value = plan.get("launch_activity")
-            launch_activity = (
-                str(launch_activity_value) if launch_activity_value is not None else None
+            serial = plan.get("serial") if isinstance(plan, Mapping) else None
+            groups.setdefault(str(serial) if serial else None, []).append(index)
+
+        if len(groups) <= 1:
+            return list(
+                self.publish_batch_iter(plans, stop_on_error=stop_on_error, generator=generator)
             )
 
-            extras_obj = plan.get("extras") or {}
-            if not isinstance(extras_obj, Mapping):
-                raise TypeError(
-                    f"Batch entry {index} extras must be a mapping, got {type(extras_obj)!r}"
-                )
-            extras: Dict[str, str] = {str(k): str(v) for k, v in extras_obj.items()}
+        results: Dict[int, Dict[str, Any]] = {}
+
+        def run_group(serial: Optional[str], indices: List[int]) -> None:
+            automation = self if serial is None else self._clone_for_serial(serial)
+            group_plans = [plans[i] for i in indices]
+            for i, result in zip(
+                indices,
+                automation.publish_batch_iter(
+                    group_plans, stop_on_error=stop_on_error, generator=generator
+                ),
+            ):
+                results[i] = result
+
+        with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+            futures = [
+                pool.submit(run_group, serial, indices)
+                for serial, indices in groups.items()
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except Exception:
+                # stop_on_error: drop work that has not started yet and
+                # surface the first failure to the caller.
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return [results[index] for index in sorted(results)]
+
+    def _pregenerate_batch_texts(
+        self,
+        entries: Sequence[BatchPlan],
+        *,
+        generator: Optional[ContentGenerator] = None,
+    ) -> None:
+        """Resolve generation prompts for a whole batch before publishing.
 
-            media_obj = plan.get("media") or []
-            if isinstance(media_obj, (str, Path)):
-                media_iterable: Iterable[Any] = [media_obj]
-            else:
-                if not isinstance(media_obj, Iterable):
-                    raise TypeError(
-                        f"Batch entry {index} media must be iterable or string, got {type(media_obj)!r}"
-                    )
-                media_iterable = media_obj
-            media_paths = [Path(str(item)) for item in media_iterable]
+        Entries that still need text are grouped by system prompt and handed
+        to :meth:`ContentGenerator.generate_many`, which fuses each group
+        into as few model calls as the provider allows, instead of paying one
+        round-trip per post inside :meth:`publish_post`.
+        """
 
+        pending: Dict[Optional[str], List[BatchPlan]] = {}
+        for entry in entries:
+            if entry.generation_prompt and entry.text is None:
+                pending.setdefault(entry.system_prompt, []).append(entry)
+        if not pending:
+            return
+
+        if generator is None:
+            generator = self._shared_generator()
+        for system_prompt, group in pending.items():
+            texts = generator.generate_many(
+                [entry.generation_prompt or "" for entry in group], system_prompt=system_prompt
+            )
+            for entry, text in zip(group, texts):
+                entry.text = text
+
+    def publish_batch_iter(
+        self,
+        plans: Sequence[Mapping[str, Any]],
+        *,
+        stop_on_error: bool = False,
+        generator: Optional[ContentGenerator] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield per-entry results as each :meth:`publish_post` job finishes.
+
+        Streaming the results lets callers report progress (or serialise
+        output) incrementally instead of holding the entire batch outcome in
+        memory until the last post completes.
+        """
+
+        entries = [BatchPlan.from_mapping(index, plan) for index, plan in enumerate(plans)]
+
+        if entries:
+            # One readiness check for the whole batch; the per-post calls
+            # inside publish_post become cache hits.
+            self.ensure_device()
+            self._pregenerate_batch_texts(entries, generator=generator)
+
+        for entry in entries:
             try:
-                logger.info("Publishing batch entry %s", app_name)
-                output = self.publish_post(
-                    app_name,
-                    text=text if text is None or isinstance(text, str) else str(text),
-                    subject=subject if subject is None or isinstance(subject, str) else str(subject),
-                    media=media_paths,
-                    remote_directory=remote_dir,
-                    share_activity=share_activity if isinstance(share_activity, str) else None,
-                    extras=extras,
-                    launch_before_share=launch_before_share,
-                    launch_activity=launch_activity,
-                )
-                results.append({"app": app_name, "status": "ok", "output": output})
+                logger.info("Publishing batch entry %s", entry.app)
+                output = self.publish_post(entry.app, **entry.publish_kwargs())
+                yield {"app": entry.app, "status": "ok", "output": output}
             except Exception as exc:  # pragma: no cover - error path validated separately
-                results.append({"app": app_name, "status": "error", "error": str(exc)})
-                logger.error("Failed to publish batch entry %s: %s", app_name, exc)
+                logger.error("Failed to publish batch entry %s: %s", entry.app, exc)
                 if stop_on_error:
                     raise
+                yield {"app": entry.app, "status": "error", "error": str(exc)}
+
+    async def apublish_batch(
+        self,
+        plans: Sequence[Mapping[str, Any]],
+        *,
+        stop_on_error: bool = False,
+        max_concurrency: int = 4,
+        generator: Optional[ContentGenerator] = None,
+    ) -> List[Dict[str, Any]]:
+        """Publish several plans concurrently from an event loop.
+
+        Entries are validated up front, then each :meth:`publish_post` runs
+        in a worker thread with at most ``max_concurrency`` in flight, so
+        independent posts overlap their adb I/O instead of executing strictly
+        one after another. Results keep the original plan order.
+        """
+
+        parsed = [BatchPlan.from_mapping(index, plan) for index, plan in enumerate(plans)]
+        if parsed:
+            await asyncio.to_thread(self._pregenerate_batch_texts, parsed, generator=generator)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def publish(entry: BatchPlan) -> str:
+            async with semaphore:
+                logger.info("Publishing batch entry %s", entry.app)
+                return await asyncio.to_thread(self.publish_post, entry.app, **entry.publish_kwargs())
+
+        outcomes = await asyncio.gather(
+            *(publish(entry) for entry in parsed),
+            return_exceptions=True,
+        )
+
+        results: List[Dict[str, Any]] = []
+        for entry, outcome in zip(parsed, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error("Failed to publish batch entry %s: %s", entry.app, outcome)
+                if stop_on_error:
+                    raise outcome
+                results.append({"app": entry.app, "status": "error", "error": str(outcome)})
+            else:
+                results.append({"app": entry.app, "status": "ok", "output": outcome})
         return results
 
 
@@ -1261,55 +2481,40 @@ class BlissSocialAutomation:
 # ──────────────────────────────────────────────────────────────────────────
 
 
-def build_arg_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        description="Automate BlissOS social media publishing via adb",
-    )
-    parser.add_argument("--adb", dest="adb_path", help="Path to the adb binary")
-    parser.add_argument("--serial", dest="serial", help="ADB serial/host of the BlissOS VM")
-    parser.add_argument("--connect", dest="connect", help="Connect to BlissOS before running commands")
-    parser.add_argument(
-        "--timeout",
-        type=int,
-        default=60,
-        help="Default adb command timeout in seconds",
-    )
-    parser.add_argument(
-        "--log-level",
-        dest="log_level",
-        default="INFO",
-        choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
-        help="Logging verbosity for the automation script",
-    )
-    parser.add_argument(
-        "--log-file",
-        dest="log_file",
-        help="Optional file path for writing logs",
-    )
-
-    subparsers = parser.add_subparsers(dest="command", required=True)
-
+def _add_devices_parser(subparsers: Any) -> None:
     subparsers.add_parser("devices", help="List connected adb devices")
 
+
+def _add_connect_parser(subparsers: Any) -> None:
     connect_parser = subparsers.add_parser("connect", help="Run adb connect against the BlissOS VM")
     connect_parser.add_argument("address", nargs="?", help="host:port pair")
 
+
+def _add_disconnect_parser(subparsers: Any) -> None:
     disconnect_parser = subparsers.add_parser("disconnect", help="Run adb disconnect")
     disconnect_parser.add_argument("address", nargs="?")
     disconnect_parser.add_argument("--all", action="store_true", help="Disconnect all adb sessions")
 
+
+def _add_install_parser(subparsers: Any) -> None:
     install_parser = subparsers.add_parser("install", help="Install an APK onto BlissOS")
     install_parser.add_argument("apk", type=Path)
     install_parser.add_argument("--reinstall", action="store_true", help="Use adb install -r")
 
+
+def _add_uninstall_parser(subparsers: Any) -> None:
     uninstall_parser = subparsers.add_parser("uninstall", help="Uninstall an application from BlissOS")
     uninstall_parser.add_argument("package")
     uninstall_parser.add_argument("--keep-data", action="store_true", help="Keep data/cache via adb uninstall -k")
 
+
+def _add_launch_parser(subparsers: Any) -> None:
     launch_parser = subparsers.add_parser("launch", help="Launch a supported social media app")
     launch_parser.add_argument("app", choices=sorted(SOCIAL_APPS))
     launch_parser.add_argument("--activity", help="Override the activity to launch")
 
+
+def _add_share_parser(subparsers: Any) -> None:
     share_parser = subparsers.add_parser("share", help="Trigger a share intent for a social media app")
     share_parser.add_argument("app", choices=sorted(SOCIAL_APPS))
     share_parser.add_argument("--text", help="Text of the post")
@@ -1371,6 +2576,8 @@ def build_arg_parser() -> argparse.ArgumentParser:
         help="Maximum number of tokens (or new tokens) to generate",
     )
 
+
+def _add_push_parser(subparsers: Any) -> None:
     push_parser = subparsers.add_parser(
         "push",
         help="Copy local files into BlissOS storage",
@@ -1382,6 +2589,8 @@ def build_arg_parser() -> argparse.ArgumentParser:
         help="Directory on the device where files will be stored",
     )
 
+
+def _add_batch_share_parser(subparsers: Any) -> None:
     batch_share_parser = subparsers.add_parser(
         "batch-share",
         help="Execute multiple share actions defined in a JSON plan",
@@ -1393,13 +2602,19 @@ def build_arg_parser() -> argparse.ArgumentParser:
         help="Abort batch execution when a share action fails",
     )
 
+
+def _add_input_text_parser(subparsers: Any) -> None:
     input_parser = subparsers.add_parser("input-text", help="Send text using adb shell input text")
     input_parser.add_argument("text")
 
+
+def _add_tap_parser(subparsers: Any) -> None:
     tap_parser = subparsers.add_parser("tap", help="Simulate a touchscreen tap")
     tap_parser.add_argument("x", type=int)
     tap_parser.add_argument("y", type=int)
 
+
+def _add_swipe_parser(subparsers: Any) -> None:
     swipe_parser = subparsers.add_parser("swipe", help="Simulate a swipe gesture")
     swipe_parser.add_argument("x1", type=int)
     swipe_parser.add_argument("y1", type=int)
@@ -1407,6 +2622,8 @@ def build_arg_parser() -> argparse.ArgumentParser:
     swipe_parser.add_argument("y2", type=int)
     swipe_parser.add_argument("--duration", type=int, default=300, help="Swipe duration in milliseconds")
 
+
+def _add_generate_parser(subparsers: Any) -> None:
     generate_parser = subparsers.add_parser(
         "generate",
         help="Generate social media post text using the configured LLM",
@@ -1441,6 +2658,105 @@ def build_arg_parser() -> argparse.ArgumentParser:
         help="Maximum number of tokens (or new tokens) to produce",
     )
 
+
+#: Subcommand name → function registering its subparser.  Keeping builders
+#: separate lets the CLI entry point construct only the invoked command's
+#: subparser instead of all of them on every run.
+_COMMAND_BUILDERS: Dict[str, Callable[[Any], None]] = {
+    "devices": _add_devices_parser,
+    "connect": _add_connect_parser,
+    "disconnect": _add_disconnect_parser,
+    "install": _add_install_parser,
+    "uninstall": _add_uninstall_parser,
+    "launch": _add_launch_parser,
+    "share": _add_share_parser,
+    "push": _add_push_parser,
+    "batch-share": _add_batch_share_parser,
+    "input-text": _add_input_text_parser,
+    "tap": _add_tap_parser,
+    "swipe": _add_swipe_parser,
+    "generate": _add_generate_parser,
+}
+
+#: Root options that consume a value, skipped when peeking for the command.
+_ROOT_VALUE_FLAGS = {"--adb", "--serial", "--connect", "--timeout", "--log-level", "--log-file"}
+
+
+def _peek_command(argv: Optional[Sequence[str]]) -> Optional[str]:
+    """Return the subcommand name from raw argv without parsing anything."""
+
+    args = list(sys.argv[1:]) if argv is None else list(argv)
+    skip_next = False
+    for token in args:
+        if skip_next:
+            skip_next = False
+            continue
+        if token.startswith("-"):
+            skip_next = "=" not in token and token in _ROOT_VALUE_FLAGS
+            continue
+        return token
+    return None
+
+
+def build_arg_parser(commands: Optional[Sequence[str]] = None) -> argparse.ArgumentParser:
+    """Construct the CLI parser.
+
+    ``commands`` restricts which subparsers are registered; the default
+    registers all of them.  A single CLI invocation only ever uses one
+    subcommand, so :func:`main` passes the peeked command name and skips
+    building the dozen unused subparsers (and their formatter setup).
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Automate BlissOS social media publishing via adb",
+    )
+    parser.add_argument("--adb", dest="adb_path", help="Path to the adb binary")
+    parser.add_argument("--serial", dest="serial", help="ADB serial/host of the BlissOS VM")
+    parser.add_argument("--connect", dest="connect", help="Connect to BlissOS before running commands")
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=60,
+        help="Default adb command timeout in seconds",
+    )
+    parser.add_argument(
+        "--log-level",
+        dest="log_level",
+        default="INFO",
+        choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
+        help="Logging verbosity for the automation script",
+    )
+    parser.add_argument(
+        "--log-file",
+        dest="log_file",
+        help="Optional file path for writing logs",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    names = _COMMAND_BUILDERS if commands is None else commands
+    for name in names:
+        _COMMAND_BUILDERS[name](subparsers)
+    return parser
+
+
+#: Parsers built so far, keyed by the single registered command (None = all).
+_PARSER_CACHE: Dict[Optional[str], argparse.ArgumentParser] = {}
+
+
+def _get_parser(command: Optional[str]) -> argparse.ArgumentParser:
+    """Return a (possibly cached) parser for ``command``.
+
+    Parser construction is the dominant cost of CLI startup, and
+    ``parse_args`` allocates a fresh ``Namespace`` per call without
+    mutating the parser, so embedded callers and tests that invoke
+    :func:`main` repeatedly can safely share one instance.
+    """
+
+    key = command if command in _COMMAND_BUILDERS else None
+    parser = _PARSER_CACHE.get(key)
+    if parser is None:
+        parser = build_arg_parser([key] if key is not None else None)
+        _PARSER_CACHE[key] = parser
     return parser
 
 
@@ -1471,27 +2787,220 @@ def _generator_options_from_args(options: Any) -> Dict[str, Any]:
     return config
 
 
-def _load_batch_plan(path: Path) -> List[MutableMapping[str, Any]]:
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:  # pragma: no cover - invalid JSON path unlikely
-        raise ValueError(f"Failed to parse batch plan '{path}': {exc}") from exc
+#: Plans above this size are parsed incrementally instead of loaded whole.
+_BATCH_PLAN_STREAM_THRESHOLD = 4 * 1024 * 1024
+
+
+def _stream_batch_plan(path: Path) -> Optional[List[MutableMapping[str, Any]]]:
+    """Parse a large plan file incrementally with :mod:`ijson`.
+
+    Avoids holding the raw file bytes and the fully parsed document in
+    memory at the same time.  Returns ``None`` when the file shape cannot
+    be determined up front, letting the caller fall back to a full parse.
+    """
+
+    with path.open("rb") as handle:
+        first = handle.read(1)
+        while first.isspace():
+            first = handle.read(1)
+        handle.seek(0)
+        if first == b"[":
+            prefix = "item"
+        elif first == b"{":
+            prefix = "posts.item"
+        else:
+            return None
+        try:
+            entries = [
+                entry if isinstance(entry, dict) else dict(entry)
+                for entry in ijson.items(handle, prefix)
+            ]
+        except ijson.JSONError as exc:
+            raise ValueError(f"Failed to parse batch plan '{path}': {exc}") from exc
+
+    if not entries and first == b"{":
+        # Could be an object without a 'posts' list; let the regular parse
+        # produce its usual validation error (or handle an empty plan).
+        return None
+    return entries
+
+
+def _coerce_plan_entries(entries: List[Any]) -> List[MutableMapping[str, Any]]:
+    # The plan is only read downstream (BatchPlan.from_mapping copies what
+    # it needs), so a parsed list of plain dicts is returned as-is; only
+    # non-dict mappings are converted.
+    if all(type(entry) is dict for entry in entries):
+        return entries
+    return [entry if isinstance(entry, dict) else dict(entry) for entry in entries]
+
+
+def _parse_batch_plan(data: Any) -> List[MutableMapping[str, Any]]:
+    """Validate an already-parsed plan document and return its entries.
+
+    The loaded plan is only read (``BatchPlan.from_mapping`` copies what it
+    needs), so entries that are already plain dicts are passed through
+    without a defensive copy.
+    """
 
     if isinstance(data, list):
-        return [dict(entry) for entry in data]
+        return _coerce_plan_entries(data)
 
     if isinstance(data, dict):
         posts = data.get("posts")
         if isinstance(posts, list):
-            return [dict(entry) for entry in posts]
+            return _coerce_plan_entries(posts)
 
     raise ValueError(
         "Batch plan must be a list of entries or an object with a 'posts' list"
     )
 
 
+def _load_batch_plan(path: Path) -> List[MutableMapping[str, Any]]:
+    if ijson is not None and path.stat().st_size > _BATCH_PLAN_STREAM_THRESHOLD:
+        entries = _stream_batch_plan(path)
+        if entries is not None:
+            return entries
+
+    raw = path.read_bytes()
+    try:
+        # Parsing the raw bytes skips a full text-decode pass over the file.
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except ValueError as exc:  # pragma: no cover - invalid JSON path unlikely
+        raise ValueError(f"Failed to parse batch plan '{path}': {exc}") from exc
+
+    return _parse_batch_plan(data)
+
+
+def _emit_json(payload: Any) -> None:
+    """Write ``payload`` as indented JSON on stdout, preferring :mod:`orjson`.
+
+    orjson serialises straight to bytes, skipping both the pretty-printing
+    re-walk of stdlib ``json`` and the str→bytes transcode on output.
+    """
+
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2) + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        json.dump(payload, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+def _cmd_devices(automation: BlissSocialAutomation, options: argparse.Namespace) -> int:
+    _emit_json(automation.adb.list_devices())
+    return 0
+
+
+def _cmd_connect(automation: BlissSocialAutomation, options: argparse.Namespace) -> int:
+    print(automation.adb.connect(options.address))
+    return 0
+
+
+def _cmd_disconnect(automation: BlissSocialAutomation, options: argparse.Namespace) -> int:
+    print(automation.adb.disconnect(options.address, all_devices=options.all))
+    return 0
+
+
+def _cmd_install(automation: BlissSocialAutomation, options: argparse.Namespace) -> int:
+    print(automation.install_app(options.apk, reinstall=options.reinstall))
+    return 0
+
+
+def _cmd_uninstall(automation: BlissSocialAutomation, options: argparse.Namespace) -> int:
+    print(automation.uninstall_app(options.package, keep_data=options.keep_data))
+    return 0
+
+
+def _cmd_launch(automation: BlissSocialAutomation, options: argparse.Namespace) -> int:
+    app = SOCIAL_APPS[options.app]
+    print(automation.launch_app(app, activity=options.activity))
+    return 0
+
+
+def _cmd_generate(automation: BlissSocialAutomation, options: argparse.Namespace) -> int:
+    generator_options = _generator_options_from_args(options)
+    text = automation.generate_post_text(
+        options.prompt,
+        generator_options=generator_options or None,
+        system_prompt=options.system_prompt,
+    )
+    print(text)
+    return 0
+
+
+def _cmd_share(automation: BlissSocialAutomation, options: argparse.Namespace) -> int:
+    extras = _extras_from_pairs(options.extra)
+    generator_options = _generator_options_from_args(options)
+    output = automation.publish_post(
+        options.app,
+        text=options.text,
+        generation_prompt=options.generation_prompt,
+        system_prompt=options.system_prompt,
+        generator_options=generator_options or None,
+        subject=options.subject,
+        # argparse already produced Path objects (type=Path on --media).
+        media=options.media,
+        remote_directory=options.remote_dir,
+        share_activity=options.share_activity,
+        extras=extras,
+        launch_before_share=options.launch_before_share,
+        launch_activity=options.launch_activity,
+    )
+    print(output)
+    return 0
+
+
+def _cmd_push(automation: BlissSocialAutomation, options: argparse.Namespace) -> int:
+    uploads = automation.push_assets(options.files, remote_directory=options.remote_dir)
+    _emit_json(uploads)
+    return 0
+
+
+def _cmd_batch_share(automation: BlissSocialAutomation, options: argparse.Namespace) -> int:
+    plans = _load_batch_plan(options.plan)
+    results = automation.publish_batch(plans, stop_on_error=options.stop_on_error)
+    _emit_json(results)
+    return 0
+
+
+def _cmd_input_text(automation: BlissSocialAutomation, options: argparse.Namespace) -> int:
+    print(automation.input_text(options.text))
+    return 0
+
+
+def _cmd_tap(automation: BlissSocialAutomation, options: argparse.Namespace) -> int:
+    print(automation.tap(options.x, options.y))
+    return 0
+
+
+def _cmd_swipe(automation: BlissSocialAutomation, options: argparse.Namespace) -> int:
+    print(automation.swipe(options.x1, options.y1, options.x2, options.y2, options.duration))
+    return 0
+
+
+#: Subcommand name → handler; O(1) dispatch instead of a chained if-ladder.
+_COMMAND_HANDLERS: Dict[str, Callable[[BlissSocialAutomation, argparse.Namespace], int]] = {
+    "devices": _cmd_devices,
+    "connect": _cmd_connect,
+    "disconnect": _cmd_disconnect,
+    "install": _cmd_install,
+    "uninstall": _cmd_uninstall,
+    "launch": _cmd_launch,
+    "generate": _cmd_generate,
+    "share": _cmd_share,
+    "push": _cmd_push,
+    "batch-share": _cmd_batch_share,
+    "input-text": _cmd_input_text,
+    "tap": _cmd_tap,
+    "swipe": _cmd_swipe,
+}
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
-    parser = build_arg_parser()
+    command = _peek_command(argv)
+    # Known command: build (or reuse) just its subparser. Anything else falls
+    # back to the full parser so argparse produces the usual help and errors.
+    parser = _get_parser(command)
     options = parser.parse_args(argv)
 
     log_level = getattr(logging, options.log_level.upper(), logging.INFO)
@@ -1514,99 +3023,17 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     )
     automation = BlissSocialAutomation(adb_client)
 
-    try:
-        if options.command == "devices":
-            devices = automation.adb.list_devices()
-            print(json.dumps(devices, indent=2))
-            return 0
-
-        if options.command == "connect":
-            output = automation.adb.connect(options.address)
-            print(output)
-            return 0
-
-        if options.command == "disconnect":
-            output = automation.adb.disconnect(options.address, all_devices=options.all)
-            print(output)
-            return 0
-
-        if options.command == "install":
-            output = automation.install_app(options.apk, reinstall=options.reinstall)
-            print(output)
-            return 0
-
-        if options.command == "uninstall":
-            output = automation.uninstall_app(options.package, keep_data=options.keep_data)
-            print(output)
-            return 0
-
-        if options.command == "launch":
-            app = SOCIAL_APPS[options.app]
-            output = automation.launch_app(app, activity=options.activity)
-            print(output)
-            return 0
-
-        if options.command == "generate":
-            generator_options = _generator_options_from_args(options)
-            text = automation.generate_post_text(
-                options.prompt,
-                generator_options=generator_options or None,
-                system_prompt=options.system_prompt,
-            )
-            print(text)
-            return 0
-
-        if options.command == "share":
-            extras = _extras_from_pairs(options.extra)
-            media_paths = [Path(p) for p in options.media]
-            generator_options = _generator_options_from_args(options)
-            output = automation.publish_post(
-                options.app,
-                text=options.text,
-                generation_prompt=options.generation_prompt,
-                system_prompt=options.system_prompt,
-                generator_options=generator_options or None,
-                subject=options.subject,
-                media=media_paths,
-                remote_directory=options.remote_dir,
-                share_activity=options.share_activity,
-                extras=extras,
-                launch_before_share=options.launch_before_share,
-                launch_activity=options.launch_activity,
-            )
-            print(output)
-            return 0
-
-        if options.command == "push":
-            uploads = automation.push_assets(options.files, remote_directory=options.remote_dir)
-            print(json.dumps(uploads, indent=2))
-            return 0
-
-        if options.command == "batch-share":
-            plans = _load_batch_plan(options.plan)
-            results = automation.publish_batch(plans, stop_on_error=options.stop_on_error)
-            print(json.dumps(results, indent=2))
-            return 0
-
-        if options.command == "input-text":
-            print(automation.input_text(options.text))
-            return 0
-
-        if options.command == "tap":
-            print(automation.tap(options.x, options.y))
-            return 0
-
-        if options.command == "swipe":
-            print(automation.swipe(options.x1, options.y1, options.x2, options.y2, options.duration))
-            return 0
+    handler = _COMMAND_HANDLERS.get(options.command)
+    if handler is None:
+        parser.print_help()
+        return 1
 
+    try:
+        return handler(automation, options)
     except (ADBCommandError, subprocess.SubprocessError, ValueError, RuntimeError) as exc:
         print(str(exc), file=sys.stderr)
         return 1
 
-    parser.print_help()
-    return 1
-
 
 if __name__ == "__main__":  # pragma: no cover - manual execution entry-point
     raise SystemExit(main())
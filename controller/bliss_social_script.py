@@ -18,6 +18,7 @@ not leak vendor specific exceptions.
 
 from __future__ import annotations
 
+import functools
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -102,18 +103,10 @@ class PostRequest:
     launch_activity: Optional[str] = None
 
 
-def ensure_automation(
-    device: Optional[BlissSocialAutomation | ADBClient | Any] = None,
-) -> BlissSocialAutomation:
-    """Return a :class:`BlissSocialAutomation` instance for the given input."""
-
-    if isinstance(device, BlissSocialAutomation):
-        return device
-    if isinstance(device, ADBClient):
-        return BlissSocialAutomation(device)
-    if device is None:
-        return BlissSocialAutomation(ADBClient())
-    # Allow duck-typed fakes in tests (must expose the required methods)
+@functools.singledispatch
+def _dispatch_automation(device: Any) -> BlissSocialAutomation:
+    # Fallback for unregistered types: accept duck-typed fakes in tests
+    # (must expose the required methods).
     if hasattr(device, "install_app") and hasattr(device, "launch_app"):
         return device  # type: ignore[return-value]
     raise TypeError(
@@ -121,7 +114,42 @@ def ensure_automation(
     )
 
 
+@_dispatch_automation.register
+def _(device: BlissSocialAutomation) -> BlissSocialAutomation:
+    return device
+
+
+@_dispatch_automation.register
+def _(device: ADBClient) -> BlissSocialAutomation:
+    return BlissSocialAutomation(device)
+
+
+@_dispatch_automation.register(type(None))
+def _(device: None) -> BlissSocialAutomation:
+    return BlissSocialAutomation(ADBClient())
+
+
+def ensure_automation(
+    device: Optional[BlissSocialAutomation | ADBClient | Any] = None,
+) -> BlissSocialAutomation:
+    """Return a :class:`BlissSocialAutomation` instance for the given input.
+
+    A plain wrapper keeps the ``ensure_automation()`` and keyword call forms
+    working; the internal singledispatch resolves the common types through a
+    single registry lookup instead of an ``isinstance`` cascade.
+    """
+
+    return _dispatch_automation(device)
+
+
+@functools.lru_cache(maxsize=32)
 def _get_config(network: str) -> SocialNetworkConfig:
+    # Registry keys are already lowercase, so well-formed names resolve with
+    # a single dict probe; ``lower()`` only runs for mixed-case input. The
+    # registry never changes after import, so memoizing per spelling is safe.
+    config = SOCIAL_NETWORKS.get(network)
+    if config is not None:
+        return config
     try:
         return SOCIAL_NETWORKS[network.lower()]
     except KeyError as exc:  # pragma: no cover - defensive branch
@@ -183,7 +211,9 @@ def upload_file(
     automation = ensure_automation(device)
     config = _get_config(network)
     destination = remote_directory or config.remote_directory
-    paths = [Path(item) for item in files]
+    # ``map`` runs the conversion in C; ``Path(item)`` is near-free for
+    # entries that are already ``Path`` objects.
+    paths = tuple(map(Path, files))
 
     try:
         return automation.push_assets(paths, remote_directory=destination)
@@ -203,7 +233,13 @@ def post_to_social(
     automation = ensure_automation(device)
     config = _get_config(network)
 
-    media_paths = [Path(item) for item in request.media]
+    # Callers frequently hand over Path objects already; only convert when
+    # at least one entry is a plain string.
+    media = request.media
+    if all(isinstance(item, Path) for item in media):
+        media_paths = list(media)
+    else:
+        media_paths = [Path(item) for item in media]
     remote_directory = request.remote_directory or config.remote_directory
 
     extras: Optional[MutableMapping[str, str]] = None
@@ -3,7 +3,106 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from typing import List
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:  # pragma: no cover - depends on runner
     sys.path.insert(0, str(PROJECT_ROOT))
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run tests marked slow"
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items) -> None:
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --runslow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(autouse=True)
+def clear_operation_log():
+    """Empty the in-memory operation log after every test.
+
+    Probes ``sys.modules`` instead of importing ``controller.app`` so test
+    runs that never touch the application keep their lazy import.
+    """
+
+    yield
+    app_module = sys.modules.get("controller.app")
+    if app_module is not None:
+        app_module._clear_operation_log()
+
+
+@pytest.fixture(scope="session")
+def bliss_app():
+    """Import the FastAPI application module once per session, on demand.
+
+    ``controller.app`` drags in FastAPI, pydantic and proxmoxer; importing it
+    lazily keeps collection and unrelated test modules free of that cost.
+    """
+
+    import controller.app
+
+    return controller.app
+
+
+@pytest.fixture(scope="session")
+def sample_media(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A real media file shared across the session.
+
+    Several tests need a path that survives the ``os.path.isfile`` check in
+    ``push_assets`` but nothing ever reads the content, so an empty touched
+    file created once per session is enough.
+    """
+
+    path = tmp_path_factory.mktemp("media") / "image.jpg"
+    path.touch()
+    return path
+
+
+@pytest.fixture(scope="session")
+def mp4_media(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A video counterpart to ``sample_media``; the suffix drives MIME choice."""
+
+    path = tmp_path_factory.mktemp("media") / "clip.mp4"
+    path.touch()
+    return path
+
+
+@pytest.fixture(scope="session")
+def txt_caption(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A text asset for push tests; written once instead of per test."""
+
+    path = tmp_path_factory.mktemp("assets") / "caption.txt"
+    path.touch()
+    return path
+
+
+@pytest.fixture(scope="session")
+def asset_files(tmp_path_factory: pytest.TempPathFactory) -> List[Path]:
+    """Three distinct files for the multi-file push path, shared per session."""
+
+    directory = tmp_path_factory.mktemp("assets")
+    files = []
+    for index in range(3):
+        path = directory / f"asset_{index}.txt"
+        path.touch()
+        files.append(path)
+    return files
+
+
+@pytest.fixture(scope="session")
+def apk_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A stand-in APK on disk for install paths that stat the file."""
+
+    path = tmp_path_factory.mktemp("apk") / "app.apk"
+    path.touch()
+    return path
@@ -1,120 +1,168 @@
-import sys
+import collections
 from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
 
-ROOT = Path(__file__).resolve().parents[2]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
 from controller.autonomous_social_poster import AutonomousSocialPoster, NETWORKS
 
 
-class FakeAutomation:
-    def __init__(self):
-        self.ensure_app_installed_calls = []
-        self.install_calls = []
-        self.uninstall_calls = []
-        self.launch_calls = []
-        self.force_stop_calls = []
-        self.push_assets_calls = []
-        self.generate_calls = []
-        self.publish_calls = []
-        self.batch_calls = []
-        self.adb = SimpleNamespace(list_devices=lambda: [{"serial": "FAKE", "status": "device"}])
+#: Network metadata resolved once at module load instead of re-walking the
+#: NETWORKS[...].app attribute chain inside each test: (app, package,
+#: remote_directory).
+NETWORK_META = {
+    name: (config.app, config.app.package, config.remote_directory)
+    for name, config in NETWORKS.items()
+}
+
+
+#: The fake ADB client is stateless, so one namespace serves the whole
+#: session; ``list_devices`` copies the constant tuple so tests that mutate
+#: the returned list cannot affect each other.
+_FAKE_DEVICES = ({"serial": "FAKE", "status": "device"},)
+_FAKE_ADB = SimpleNamespace(
+    list_devices=lambda: [dict(device) for device in _FAKE_DEVICES],
+    install=lambda apk, reinstall=False: f"installed {apk.name}",
+)
+
+
+#: Canned results keyed by recorded method name; callables receive the
+#: original arguments so results can depend on them.
+_RETURNS = {
+    "install_app": lambda *args, **kwargs: "installed",
+    "uninstall_app": lambda *args, **kwargs: "uninstalled",
+    "launch_app": lambda *args, **kwargs: "launched",
+    "push_assets": lambda files, remote_directory: {
+        str(path): f"{remote_directory}/{path.name}" for path in files
+    },
+    "generate_post_text": lambda prompt, **kwargs: f"generated: {prompt}",
+    "publish_post": lambda app_name, **kwargs: f"posted to {app_name}",
+    "publish_batch": lambda plan, stop_on_error=False: [
+        {"status": "ok", "app": entry["app"]} for entry in plan
+    ],
+}
 
-    def ensure_app_installed(self, app, apk_path=None):
-        self.ensure_app_installed_calls.append(app)
 
-    def install_app(self, apk_path, reinstall=False):
-        self.install_calls.append((apk_path, reinstall))
-        return "installed"
+class FakeAutomation:
+    """Argument-recording automation stand-in.
 
-    def uninstall_app(self, package, keep_data=False):
-        self.uninstall_calls.append((package, keep_data))
-        return "uninstalled"
+    Any method call lands in ``calls[name]`` as an ``(args, kwargs)`` pair
+    and returns whatever the ``_RETURNS`` table produces, so new automation
+    methods need no extra boilerplate here.
+    """
 
-    def launch_app(self, app, activity=None):
-        self.launch_calls.append((app, activity))
-        return "launched"
+    def __init__(self):
+        self.calls = collections.defaultdict(list)
+        self.adb = _FAKE_ADB
 
-    def force_stop(self, app):
-        self.force_stop_calls.append(app)
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
 
-    def push_assets(self, files, remote_directory):
-        self.push_assets_calls.append((tuple(files), remote_directory))
-        return {str(path): f"{remote_directory}/{path.name}" for path in files}
+        def record(*args, **kwargs):
+            self.calls[name].append((args, kwargs))
+            handler = _RETURNS.get(name)
+            return handler(*args, **kwargs) if handler is not None else None
 
-    def generate_post_text(self, prompt, **kwargs):
-        self.generate_calls.append((prompt, kwargs))
-        return f"generated: {prompt}"
+        return record
 
-    def publish_post(self, app_name, **kwargs):
-        self.publish_calls.append((app_name, kwargs))
-        return f"posted to {app_name}"
 
-    def publish_batch(self, plan, stop_on_error=False):
-        self.batch_calls.append((plan, stop_on_error))
-        return [{"status": "ok", "app": entry["app"]} for entry in plan]
+@pytest.fixture(scope="session")
+def _poster_template():
+    # AutonomousSocialPoster holds no per-test state beyond the automation
+    # reference, so one instance serves the whole session.
+    return AutonomousSocialPoster(automation=FakeAutomation())
 
 
 @pytest.fixture()
-def poster():
-    return AutonomousSocialPoster(automation=FakeAutomation())
+def poster(_poster_template):
+    # Swap in a fresh call log instead of rebuilding poster + fake per test.
+    _poster_template.automation.calls = collections.defaultdict(list)
+    return _poster_template
 
 
-def test_install_app_with_apk_delegates_to_automation(tmp_path, poster):
-    apk = tmp_path / "facebook.apk"
-    apk.write_bytes(b"binary")
+def test_install_app_with_apk_delegates_to_automation(poster):
+    # FakeAutomation only records the path, so no real file is needed.
+    apk = Path("/tmp/fake/facebook.apk")
 
     result = poster.install_app("facebook", apk_path=apk, reinstall=True)
 
     assert result == "installed"
-    assert poster.automation.install_calls == [(apk, True)]
-
-
-def test_install_app_without_apk_checks_existing(poster):
-    result = poster.install_app("twitter")
-
-    assert result == f"{NETWORKS['twitter'].app.package} already installed"
-    assert poster.automation.ensure_app_installed_calls == [NETWORKS["twitter"].app]
-
-
-def test_uninstall_app_invokes_underlying_controller(poster):
-    result = poster.uninstall_app("instagram", keep_data=True)
-
-    assert result == "uninstalled"
-    assert poster.automation.uninstall_calls == [
-        (NETWORKS["instagram"].app.package, True)
+    assert poster.automation.calls["install_app"] == [((apk,), {"reinstall": True})]
+
+
+@pytest.mark.parametrize(
+    ("network", "invoke", "recorded", "expected_calls", "expected_result"),
+    [
+        (
+            "twitter",
+            lambda poster: poster.install_app("twitter"),
+            "ensure_app_installed",
+            lambda app: [((app,), {})],
+            lambda app: f"{app.package} already installed",
+        ),
+        (
+            "instagram",
+            lambda poster: poster.uninstall_app("instagram", keep_data=True),
+            "uninstall_app",
+            lambda app: [((app.package,), {"keep_data": True})],
+            lambda app: "uninstalled",
+        ),
+        (
+            "reddit",
+            lambda poster: poster.launch_app("reddit", activity="CustomActivity"),
+            "launch_app",
+            lambda app: [((app,), {"activity": "CustomActivity"})],
+            lambda app: "launched",
+        ),
+        (
+            "tiktok",
+            lambda poster: poster.force_stop("tiktok"),
+            "force_stop",
+            lambda app: [((app,), {})],
+            lambda app: None,
+        ),
+    ],
+    ids=["install-existing", "uninstall", "launch", "force-stop"],
+)
+def test_network_operations_delegate_to_automation(
+    poster, network, invoke, recorded, expected_calls, expected_result
+):
+    app = NETWORK_META[network][0]
+
+    result = invoke(poster)
+
+    assert result == expected_result(app)
+    assert poster.automation.calls[recorded] == expected_calls(app)
+
+
+def test_install_apps_batches_installs_with_single_device_check(poster):
+    apks = [(name, Path(f"/tmp/fake/{name}.apk")) for name in ("facebook", "twitter")]
+
+    results = poster.install_apps(apks)
+
+    assert len(poster.automation.calls["ensure_device"]) == 1
+    assert results == [
+        {"network": "facebook", "status": "ok", "output": "installed facebook.apk"},
+        {"network": "twitter", "status": "ok", "output": "installed twitter.apk"},
     ]
 
 
-def test_launch_app_uses_network_metadata(poster):
-    result = poster.launch_app("reddit", activity="CustomActivity")
-
-    assert result == "launched"
-    assert poster.automation.launch_calls == [
-        (NETWORKS["reddit"].app, "CustomActivity")
-    ]
-
-
-def test_force_stop_delegates_to_automation(poster):
-    poster.force_stop("tiktok")
+def test_install_apps_validates_networks_before_device_work(poster):
+    with pytest.raises(KeyError):
+        poster.install_apps([("unknown", Path("missing.apk"))])
 
-    assert poster.automation.force_stop_calls == [NETWORKS["tiktok"].app]
+    assert poster.automation.calls["ensure_device"] == []
 
 
-def test_push_content_uses_default_remote_directory(tmp_path, poster):
-    media = [tmp_path / "image.jpg", tmp_path / "video.mp4"]
-    for item in media:
-        item.write_bytes(b"content")
+def test_push_content_uses_default_remote_directory(poster):
+    media = [Path("/tmp/fake/image.jpg"), Path("/tmp/fake/video.mp4")]
 
     uploads = poster.push_content("threads", media)
 
     assert list(uploads) == [str(path) for path in media]
-    assert poster.automation.push_assets_calls == [
-        (tuple(media), NETWORKS["threads"].remote_directory)
+    assert poster.automation.calls["push_assets"] == [
+        ((media,), {"remote_directory": NETWORK_META["threads"][2]})
     ]
 
 
@@ -122,12 +170,12 @@ def test_generate_content_invokes_llm(poster):
     text = poster.generate_content("linkedin", "Share updates")
 
     assert text == "generated: Share updates"
-    assert poster.automation.generate_calls[0][0] == "Share updates"
+    args, _kwargs = poster.automation.calls["generate_post_text"][0]
+    assert args[0] == "Share updates"
 
 
-def test_post_content_handles_media_and_generation(poster, tmp_path):
-    photo = tmp_path / "photo.jpg"
-    photo.write_bytes(b"binary")
+def test_post_content_handles_media_and_generation(poster):
+    photo = Path("/tmp/fake/photo.jpg")
 
     result = poster.post_content(
         "facebook",
@@ -139,8 +187,8 @@ def test_post_content_handles_media_and_generation(poster, tmp_path):
     )
 
     assert result == "posted to facebook"
-    app_name, kwargs = poster.automation.publish_calls[0]
-    assert app_name == "facebook"
+    args, kwargs = poster.automation.calls["publish_post"][0]
+    assert args == ("facebook",)
     assert kwargs["media"] == [photo]
     assert kwargs["extras"] == {"foo": "bar"}
     assert kwargs["share_activity"] == "CustomShare"
@@ -157,7 +205,7 @@ def test_post_content_requests_prelaunch(poster):
     )
 
     assert result == "posted to instagram"
-    _, kwargs = poster.automation.publish_calls[-1]
+    _args, kwargs = poster.automation.calls["publish_post"][-1]
     assert kwargs["launch_before_share"] is True
     assert kwargs["launch_activity"] == "com.instagram.android/.MainTabActivity"
 
@@ -167,7 +215,7 @@ def test_run_plan_validates_networks(poster):
     results = poster.run_plan(plan)
 
     assert results == [{"status": "ok", "app": "twitter"}]
-    assert poster.automation.batch_calls == [(plan, False)]
+    assert poster.automation.calls["publish_batch"] == [((plan,), {"stop_on_error": False})]
 
 
 def test_run_plan_rejects_missing_app_field(poster):
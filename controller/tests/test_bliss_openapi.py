@@ -2,46 +2,61 @@
 
 from __future__ import annotations
 
-import importlib
 import json
 from pathlib import Path
 
 import pytest
 
 
-def _fresh_app(monkeypatch: pytest.MonkeyPatch):
-    """Reload the controller.app module with a clean environment."""
+@pytest.fixture(autouse=True)
+def _reset_openapi_cache(bliss_app):
+    # Keep the memoized spec from leaking between tests (and into other
+    # modules' tests) without re-importing the whole application module.
+    bliss_app._load_bliss_openapi.cache_clear()
+    yield
+    bliss_app._load_bliss_openapi.cache_clear()
 
-    monkeypatch.delenv("BLISS_OPENAPI_PATH", raising=False)
-    import controller.app as app
 
-    return importlib.reload(app)
+@pytest.fixture()
+def openapi_env(bliss_app, monkeypatch: pytest.MonkeyPatch):
+    """Yield a helper that re-runs auto-discovery against given candidates.
+
+    Centralises the monkeypatching and the lru_cache clear so no test can
+    leave a stale spec (or stale module globals) behind for the next one.
+    """
+
+    def _setup(candidates) -> None:
+        monkeypatch.delenv("BLISS_OPENAPI_PATH", raising=False)
+        monkeypatch.setattr(bliss_app, "_BLISS_OPENAPI_CANDIDATES", tuple(candidates))
+        path, auto = bliss_app._resolve_bliss_openapi_path()
+        monkeypatch.setattr(bliss_app, "BLISS_OPENAPI_PATH", path)
+        monkeypatch.setattr(bliss_app, "BLISS_OPENAPI_AUTO", auto)
+        bliss_app._load_bliss_openapi.cache_clear()
+
+    return _setup
 
 
-def test_repo_root_candidate_is_detected(monkeypatch: pytest.MonkeyPatch):
-    app = _fresh_app(monkeypatch)
+def test_repo_root_candidate_is_detected(bliss_app, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("BLISS_OPENAPI_PATH", raising=False)
 
-    expected = Path(app.__file__).resolve().parent.parent / "openapi_bliss.json"
-    assert expected in app._BLISS_OPENAPI_CANDIDATES
+    expected = Path(bliss_app.__file__).resolve().parent.parent / "openapi_bliss.json"
+    assert expected in bliss_app._BLISS_OPENAPI_CANDIDATES
 
     if expected.exists():
-        assert app.BLISS_OPENAPI_PATH == str(expected)
-        assert app.BLISS_OPENAPI_AUTO is True
+        path, auto = bliss_app._resolve_bliss_openapi_path()
+        assert path == str(expected)
+        assert auto is True
     else:  # pragma: no cover - repository missing optional file
         pytest.skip("Repository root openapi_bliss.json is not present")
 
 
-def test_auto_discovers_openapi_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
-    app = _fresh_app(monkeypatch)
-
+def test_auto_discovers_openapi_file(bliss_app, openapi_env, tmp_path: Path):
     candidate = tmp_path / "openapi_bliss.json"
     candidate.write_text(json.dumps({"info": {"title": "Bliss"}}), encoding="utf-8")
 
-    monkeypatch.setattr(app, "_BLISS_OPENAPI_CANDIDATES", (candidate,))
-    app.BLISS_OPENAPI_PATH, app.BLISS_OPENAPI_AUTO = app._resolve_bliss_openapi_path()
-    app._load_bliss_openapi.cache_clear()
+    openapi_env((candidate,))
 
-    status = app.bliss_openapi_status()
+    status = bliss_app.bliss_openapi_status()
 
     assert status.configured is True
     assert status.auto_discovered is True
@@ -50,21 +65,16 @@ def test_auto_discovers_openapi_file(monkeypatch: pytest.MonkeyPatch, tmp_path:
     assert status.error is None
     assert status.path == str(candidate)
 
-    spec = app.bliss_openapi_spec()
+    spec = bliss_app.bliss_openapi_spec()
     assert spec["info"]["title"] == "Bliss"
 
 
-def test_status_reports_missing_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
-    app = _fresh_app(monkeypatch)
+def test_status_reports_missing_file(bliss_app, openapi_env, tmp_path: Path):
+    openapi_env((tmp_path / "missing.json",))
 
-    monkeypatch.setattr(app, "_BLISS_OPENAPI_CANDIDATES", (tmp_path / "missing.json",))
-    app.BLISS_OPENAPI_PATH, app.BLISS_OPENAPI_AUTO = app._resolve_bliss_openapi_path()
-    app._load_bliss_openapi.cache_clear()
-
-    status = app.bliss_openapi_status()
+    status = bliss_app.bliss_openapi_status()
 
     assert status.configured is False
     assert status.auto_discovered is False
     assert status.exists is False
     assert status.error.endswith("openapi_bliss.json was found.")
-
@@ -1,73 +1,44 @@
-import os
-import sys
-import unittest
-from pathlib import Path
+import pytest
 
 
-# Ensure the repository root is importable so that ``import controller``
-# resolves to the package in this project rather than relying on the test
-# directory being a package itself.
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
+@pytest.fixture(autouse=True)
+def _clean_adb_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in ("BLISS_ADB_SERIAL", "BLISS_ADB_ADDRESS", "BLISS_ADB_HOST", "BLISS_ADB_PORT"):
+        monkeypatch.delenv(name, raising=False)
 
-from controller import app
 
+def test_request_host_overrides_env_address(bliss_app, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("BLISS_ADB_ADDRESS", "192.168.1.220:5555")
+    spec = bliss_app.BlissADBConnectSpec(host="192.168.1.220")
 
-ENV_VARS = [
-    "BLISS_ADB_SERIAL",
-    "BLISS_ADB_ADDRESS",
-    "BLISS_ADB_HOST",
-    "BLISS_ADB_PORT",
-]
+    resolved = bliss_app._resolve_bliss_address(spec)
 
+    assert resolved == "192.168.1.220:5555"
 
-class BlissSerialResolutionTests(unittest.TestCase):
-    def setUp(self) -> None:
-        self._orig_env = {name: os.environ.get(name) for name in ENV_VARS}
-        for name in ENV_VARS:
-            os.environ.pop(name, None)
 
-    def tearDown(self) -> None:
-        for name, value in self._orig_env.items():
-            if value is None:
-                os.environ.pop(name, None)
-            else:
-                os.environ[name] = value
+def test_request_port_is_applied(bliss_app, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("BLISS_ADB_ADDRESS", "192.168.1.220:5555")
+    spec = bliss_app.BlissADBConnectSpec(host="192.168.1.220", port=5560)
 
-    def test_request_host_overrides_env_address(self) -> None:
-        os.environ["BLISS_ADB_ADDRESS"] = "192.168.1.220:5555"
-        spec = app.BlissADBConnectSpec(host="192.168.1.220")
+    resolved = bliss_app._resolve_bliss_address(spec)
 
-        resolved = app._resolve_bliss_address(spec)
+    assert resolved == "192.168.1.220:5560"
 
-        self.assertEqual(resolved, "192.168.1.220:5555")
 
-    def test_request_port_is_applied(self) -> None:
-        os.environ["BLISS_ADB_ADDRESS"] = "192.168.1.220:5555"
-        spec = app.BlissADBConnectSpec(host="192.168.1.220", port=5560)
+def test_env_address_used_when_no_overrides(bliss_app, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("BLISS_ADB_ADDRESS", "192.168.1.220:5555")
+    spec = bliss_app.BlissADBConnectSpec()
 
-        resolved = app._resolve_bliss_address(spec)
+    resolved = bliss_app._resolve_bliss_address(spec)
 
-        self.assertEqual(resolved, "192.168.1.220:5560")
+    assert resolved == "192.168.1.220:5555"
 
-    def test_env_address_used_when_no_overrides(self) -> None:
-        os.environ["BLISS_ADB_ADDRESS"] = "192.168.1.220:5555"
-        spec = app.BlissADBConnectSpec()
 
-        resolved = app._resolve_bliss_address(spec)
+def test_serial_without_host_uses_env_host(bliss_app, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("BLISS_ADB_SERIAL", "RQCT30W45KM")
+    monkeypatch.setenv("BLISS_ADB_HOST", "192.168.1.220")
+    spec = bliss_app.BlissADBConnectSpec()
 
-        self.assertEqual(resolved, "192.168.1.220:5555")
+    resolved = bliss_app._resolve_bliss_address(spec)
 
-    def test_serial_without_host_uses_env_host(self) -> None:
-        os.environ["BLISS_ADB_SERIAL"] = "RQCT30W45KM"
-        os.environ["BLISS_ADB_HOST"] = "192.168.1.220"
-        spec = app.BlissADBConnectSpec()
-
-        resolved = app._resolve_bliss_address(spec)
-
-        self.assertEqual(resolved, "192.168.1.220:5555")
-
-
-if __name__ == "__main__":
-    unittest.main()
+    assert resolved == "192.168.1.220:5555"
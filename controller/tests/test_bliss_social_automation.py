@@ -1,8 +1,10 @@
-import json
+import subprocess
 import sys
-from pathlib import Path
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path, PurePath
 from types import SimpleNamespace
-from typing import List, Sequence
+from typing import Sequence
 
 import pytest
 
@@ -11,28 +13,72 @@ from controller.bliss_social_automation import (
     BlissSocialAutomation,
     ContentGenerator,
     ContentGeneratorError,
+    PersistentAdbShell,
     PPADBClient,
     _load_batch_plan,
+    _parse_batch_plan,
 )
 
 
+@dataclass(frozen=True, slots=True)
+class _RunResult:
+    stdout: str = "OK\n"
+    returncode: int = 0
+
+
+#: Single immutable result shared by every FakeADB.run call; tests only
+#: ever read .stdout/.returncode.
+_OK_RESULT = _RunResult()
+
+
+def _as_path(source) -> Path:
+    """Skip Path re-parsing when the caller already handed us one."""
+
+    return source if isinstance(source, PurePath) else Path(source)
+
+
+def _make_openai_stub(chat_completion):
+    """Build the ``openai`` module shim; ``api_key=None`` mimics a fresh import."""
+
+    return SimpleNamespace(ChatCompletion=chat_completion, api_key=None)
+
+
+def _make_hf_stub(pipeline_fn, **attrs):
+    """Build the ``transformers`` module shim around a fake ``pipeline``."""
+
+    return SimpleNamespace(pipeline=pipeline_fn, **attrs)
+
+
 class FakeADB:
     def __init__(self):
+        self.reset_recorded_calls()
+
+    def reset_recorded_calls(self):
+        # Deques give O(1) appends/tail access and an O(1) clear in the
+        # autouse reset fixture; tests compare through list(...) where they
+        # need sequence equality.
         self.connect_address = None
         self.serial = None
-        self.push_calls = []
-        self.run_calls = []
-        self.mkdir_calls = []
-        self.launch_calls = []
-        self.monkey_calls = []
+        self.push_calls = deque()
+        self.push_many_calls = deque()
+        self.run_calls = deque()
+        self.mkdir_calls = deque()
+        self.launch_calls = deque()
+        self.monkey_calls = deque()
 
     def push(self, source: Path, destination: str) -> str:
-        self.push_calls.append((Path(source), destination))
+        self.push_calls.append((_as_path(source), destination))
         return "1 file pushed"
 
-    def run(self, args, timeout=None, check=True, capture_output=True):
-        self.run_calls.append((list(args), timeout))
-        return SimpleNamespace(stdout="OK\n", returncode=0)
+    def push_many(self, sources: Sequence[Path], destination_dir: str) -> str:
+        self.push_many_calls.append(([_as_path(source) for source in sources], destination_dir))
+        return f"{len(sources)} files pushed"
+
+    def run(self, args, timeout=None, **_):
+        # Tuples are cheaper to build than a defensive list copy and every
+        # consumer only indexes or iterates the recorded argv.
+        self.run_calls.append((tuple(args), timeout))
+        return _OK_RESULT
 
     def ensure_remote_directory(self, path: str) -> None:
         self.mkdir_calls.append(path)
@@ -49,116 +95,374 @@ class FakeADB:
         return "Monkey launched"
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def automation():
+    # One automation (and one FakeADB) for the whole module; the autouse
+    # reset below wipes recorded state between tests.
     return BlissSocialAutomation(adb=FakeADB())
 
 
-def test_publish_batch_executes_posts_and_collects_results(tmp_path, automation):
-    media_file = tmp_path / "image.jpg"
-    media_file.write_bytes(b"binary")
-
-    plans = [
-        {
-            "app": "twitter",
-            "text": "Hello",
-            "media": [str(media_file)],
-            "launch_before_share": True,
-        },
-        {"app": "facebook", "text": "World"},
-    ]
+@pytest.fixture(autouse=True)
+def _reset_recording(automation):
+    automation.adb.reset_recorded_calls()
+    # Several tests monkeypatch ContentGenerator and count constructions;
+    # drop the generator cached by a previous test so each starts clean.
+    automation._default_generator = None
 
-    results = automation.publish_batch(plans)
 
+def _verify_media_batch(automation, results):
     assert [entry[0].name for entry in automation.adb.push_calls] == ["image.jpg"]
-    assert automation.adb.mkdir_calls == ["/sdcard/Download"]
-    assert results[0]["status"] == "ok"
-    assert results[1]["status"] == "ok"
-    # Ensure adb run was invoked for both applications
-    assert len(automation.adb.run_calls) == 2
-    assert "com.twitter.android" in " ".join(automation.adb.run_calls[0][0])
-    assert "com.facebook.katana" in " ".join(automation.adb.run_calls[1][0])
+    assert list(automation.adb.mkdir_calls) == ["/sdcard/Download"]
+    assert any("com.twitter.android" in tok for tok in automation.adb.run_calls[0][0])
+    assert any("com.facebook.katana" in tok for tok in automation.adb.run_calls[1][0])
     assert automation.adb.launch_calls[0][0] == "com.twitter.android/com.twitter.app.main.MainActivity"
 
 
-def test_publish_batch_collects_errors(tmp_path, automation):
+def _verify_collected_error(automation, results):
+    assert "Unknown social app" in results[0]["error"]
+
+
+@pytest.mark.parametrize(
+    ("make_plans", "statuses", "stop_on_error", "expected_exc", "verify"),
+    [
+        (
+            lambda media: [
+                {
+                    "app": "twitter",
+                    "text": "Hello",
+                    "media": [str(media)],
+                    "launch_before_share": True,
+                },
+                {"app": "facebook", "text": "World"},
+            ],
+            ["ok", "ok"],
+            False,
+            None,
+            _verify_media_batch,
+        ),
+        (
+            lambda media: [{"app": "unknown"}, {"app": "facebook", "text": "Second"}],
+            ["error", "ok"],
+            False,
+            None,
+            _verify_collected_error,
+        ),
+        (
+            lambda media: [{"app": "unknown"}, {"app": "facebook"}],
+            None,
+            True,
+            KeyError,
+            None,
+        ),
+    ],
+    ids=["media-and-launch", "collects-errors", "stop-on-error"],
+)
+def test_publish_batch(
+    sample_media, automation, make_plans, statuses, stop_on_error, expected_exc, verify
+):
+    plans = make_plans(sample_media)
+
+    if expected_exc is not None:
+        with pytest.raises(expected_exc):
+            automation.publish_batch(plans, stop_on_error=stop_on_error)
+        return
+
+    results = automation.publish_batch(plans, stop_on_error=stop_on_error)
+
+    assert [entry["status"] for entry in results] == statuses
+    # One adb run per successfully shared plan entry.
+    assert len(automation.adb.run_calls) == statuses.count("ok")
+    if verify is not None:
+        verify(automation, results)
+
+
+@pytest.mark.parametrize("n", [1, 10, 50])
+def test_publish_batch_scales(n, automation, sample_media):
+    # Exercises the batch path end-to-end on growing plans; a Python-level
+    # O(n^2) regression in publish_batch would show up here first.
     plans = [
-        {"app": "unknown"},
-        {"app": "facebook", "text": "Second"},
+        {"app": "twitter", "text": f"t{i}", "media": [str(sample_media)]}
+        for i in range(n)
     ]
 
     results = automation.publish_batch(plans)
 
-    assert results[0]["status"] == "error"
-    assert "Unknown social app" in results[0]["error"]
-    assert results[1]["status"] == "ok"
-    assert len(automation.adb.run_calls) == 1
+    assert len(results) == n
+    assert all(entry["status"] == "ok" for entry in results)
+    assert len(automation.adb.run_calls) == n
 
 
-def test_publish_batch_stop_on_error(tmp_path, automation):
+def test_apublish_batch_preserves_plan_order(automation):
+    import asyncio
+
     plans = [
+        {"app": "twitter", "text": "Hello"},
         {"app": "unknown"},
-        {"app": "facebook"},
+        {"app": "facebook", "text": "World"},
     ]
 
-    with pytest.raises(KeyError):
-        automation.publish_batch(plans, stop_on_error=True)
+    results = asyncio.run(automation.apublish_batch(plans))
+
+    assert [entry["app"] for entry in results] == ["twitter", "unknown", "facebook"]
+    assert [entry["status"] for entry in results] == ["ok", "error", "ok"]
+
+
+def test_apublish_post_overlaps_generation_with_media_upload(sample_media, automation):
+    import asyncio
+
+    class DummyGenerator:
+        async def agenerate(self, prompt, system_prompt=None):
+            return f"generated {prompt}"
+
+    media_file = sample_media
+
+    result = asyncio.run(
+        automation.apublish_post(
+            "twitter",
+            generation_prompt="launch post",
+            media=[media_file],
+            generator=DummyGenerator(),
+        )
+    )
+
+    assert result == "OK"
+    assert [entry[0].name for entry in automation.adb.push_calls] == ["image.jpg"]
+    assert any("generated launch post" in tok for tok in automation.adb.run_calls[-1][0])
+
+
+def test_push_assets_transfers_files_and_returns_remote_paths(txt_caption, automation):
+    # Resolve once up front; Path.resolve stats every component.
+    resolved = str(txt_caption.resolve())
+
+    uploads = automation.push_assets([txt_caption], remote_directory="/sdcard/Target")
+
+    assert list(automation.adb.push_calls) == [(txt_caption, "/sdcard/Target/caption.txt")]
+    assert list(automation.adb.mkdir_calls) == ["/sdcard/Target"]
+    assert uploads[resolved] == "/sdcard/Target/caption.txt"
+
 
+def test_push_assets_uploads_multiple_files_in_one_push(asset_files, automation):
+    files = asset_files
 
-def test_push_assets_transfers_files_and_returns_remote_paths(tmp_path, automation):
-    file_path = tmp_path / "caption.txt"
-    file_path.write_text("hello world", encoding="utf-8")
+    uploads = automation.push_assets(files, remote_directory="/sdcard/Target")
 
-    uploads = automation.push_assets([file_path], remote_directory="/sdcard/Target")
+    assert not automation.adb.push_calls
+    assert list(automation.adb.push_many_calls) == [(files, "/sdcard/Target")]
+    assert list(automation.adb.mkdir_calls) == ["/sdcard/Target"]
+    assert uploads == {
+        str(path.resolve()): f"/sdcard/Target/{path.name}" for path in files
+    }
 
-    assert automation.adb.push_calls == [(file_path, "/sdcard/Target/caption.txt")]
-    assert automation.adb.mkdir_calls == ["/sdcard/Target"]
-    assert uploads[str(file_path.resolve())] == "/sdcard/Target/caption.txt"
 
+def test_run_streams_output_lines_to_callback():
+    client = ADBClient(adb_path="echo")
+    seen = []
 
-def _extract_am_extras(command: Sequence[str]) -> List[str]:
-    """Return the extras passed to ``am start`` from an adb command."""
+    result = client.run(["hello world"], on_output=seen.append)
 
-    try:
-        start_index = command.index("-a")
-    except ValueError:
-        return list(command)
-    return command[start_index:]
+    assert result.returncode == 0
+    assert result.stdout == "hello world\n"
+    assert seen == ["hello world"]
 
 
-def test_instagram_share_does_not_include_text(tmp_path, automation):
-    media = tmp_path / "photo.jpg"
-    media.write_bytes(b"binary")
+def test_shell_fast_speaks_adb_server_protocol(monkeypatch):
+    import socket
+    import threading
 
-    automation.publish_post("instagram", text="ignored", media=[media])
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    port = server.getsockname()[1]
+    requests = []
 
-    command, _timeout = automation.adb.run_calls[-1]
-    extras = " ".join(_extract_am_extras(command))
-    assert "android.intent.extra.TEXT" not in extras
-    assert "android.intent.extra.STREAM" in extras
+    def serve():
+        conn, _ = server.accept()
+        with conn:
+            for _ in range(2):
+                length = int(conn.recv(4), 16)
+                requests.append(conn.recv(length).decode("utf-8"))
+                conn.sendall(b"OKAY")
+            conn.sendall(b"done\n")
 
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    monkeypatch.setenv("ANDROID_ADB_SERVER_PORT", str(port))
+    client = ADBClient(adb_path="adb-not-installed", serial="FAKE")
 
-def test_other_networks_keep_text_extra(tmp_path, automation):
-    media = tmp_path / "clip.mp4"
-    media.write_bytes(b"binary")
+    output = client.shell_fast("input", "tap", "100", "200")
 
-    automation.publish_post("twitter", text="caption", media=[media])
+    thread.join(timeout=5)
+    server.close()
+    assert output == "done"
+    assert requests == ["host:transport:FAKE", "shell:input tap 100 200"]
 
-    command, _timeout = automation.adb.run_calls[-1]
-    extras = " ".join(_extract_am_extras(command))
-    assert "android.intent.extra.TEXT" in extras
-    assert "--grant-read-uri-permission" in command
 
+class DummySession:
+    """Recording stand-in for PersistentAdbShell."""
 
-def test_share_command_includes_default_category(tmp_path, automation):
-    media = tmp_path / "asset.jpg"
-    media.write_bytes(b"binary")
+    def __init__(self, output="routed\n"):
+        self.commands = []
+        self.output = output
 
-    automation.publish_post("facebook", text="hello", media=[media])
+    def run(self, command, *, timeout=None):
+        self.commands.append((command, timeout))
+        return 0, self.output
 
-    command, _timeout = automation.adb.run_calls[-1]
-    assert "-c" in command
-    assert "android.intent.category.DEFAULT" in command
+
+def test_run_routes_shell_commands_through_persistent_session():
+    client = ADBClient(adb_path="adb-not-installed", serial="FAKE")
+    client._persistent_shell = DummySession()
+
+    result = client.run(["shell", "input", "tap", "10", "20"], timeout=7)
+
+    assert client._persistent_shell.commands == [("input tap 10 20", 7)]
+    assert result.returncode == 0
+    assert result.stdout == "routed\n"
+
+
+def test_persistent_session_passes_compound_scripts_verbatim():
+    client = ADBClient(adb_path="adb-not-installed", serial="FAKE")
+    session = DummySession(output="__PKG__com.a:1\n__PKG__com.b:0\n")
+    client._persistent_shell = session
+
+    status = client.installed_packages(["com.a", "com.b"])
+
+    assert status == {"com.a": True, "com.b": False}
+    ((command, timeout),) = session.commands
+    # The script must arrive unquoted; shlex-joining it would make the
+    # session execute the whole script as one command name.
+    assert command.startswith("echo __PKG__com.a:$(pm path com.a")
+    assert "; echo __PKG__com.b:" in command
+    assert timeout == client.default_timeout
+
+    session.commands.clear()
+    client.shell_script(["echo a", "echo b"], timeout=5)
+    assert session.commands == [("echo a; echo b", 5)]
+
+
+def test_force_stop_stays_best_effort_with_persistent_session():
+    client = ADBClient(adb_path="adb-not-installed", serial="FAKE")
+
+    class FailingSession:
+        def run(self, command, *, timeout=None):
+            return 1, ""
+
+    client._persistent_shell = FailingSession()
+
+    # Nonzero exit codes must not raise; force-stop has always been
+    # fire-and-forget.
+    client.force_stop("com.example")
+
+
+def test_persistent_shell_run_enforces_timeout():
+    # ``exec`` keeps the hang in the process we kill, so the pipe closes
+    # with it instead of lingering in a forked child.
+    shell = PersistentAdbShell(SimpleNamespace(_adb_base=lambda: ["sh", "-c", "exec sleep 30"]))
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        shell.run("echo hi", timeout=0.2)
+
+
+def test_is_package_installed_caches_probe_results(monkeypatch):
+    client = ADBClient(adb_path="adb-not-installed", serial="FAKE")
+    calls = []
+
+    def fake_run(args, **kwargs):
+        calls.append(list(args))
+        return SimpleNamespace(stdout="package:/data/app/base.apk\n", returncode=0)
+
+    monkeypatch.setattr(client, "run", fake_run)
+
+    assert client.is_package_installed("com.example") is True
+    assert client.is_package_installed("com.example") is True
+    assert len(calls) == 1
+
+    client.invalidate_package_cache("com.example")
+    assert client.is_package_installed("com.example") is True
+    assert len(calls) == 2
+
+
+def test_installed_packages_probes_all_packages_in_one_call(monkeypatch):
+    client = ADBClient(adb_path="adb-not-installed", serial="FAKE")
+    calls = []
+
+    def fake_run(args, **kwargs):
+        calls.append(list(args))
+        return SimpleNamespace(stdout="__PKG__com.a:1\n__PKG__com.b:0\n", returncode=0)
+
+    monkeypatch.setattr(client, "run", fake_run)
+
+    status = client.installed_packages(["com.a", "com.b", "com.a"])
+
+    assert len(calls) == 1
+    assert calls[0][0] == "shell"
+    assert status == {"com.a": True, "com.b": False}
+
+
+def _last_intent(fake_adb: FakeADB) -> dict:
+    """Parse the last recorded ``am start`` command into structured fields.
+
+    One pass over the argument list replaces repeated ``" ".join`` scans in
+    the assertions below; extras become a proper mapping instead of a
+    substring search target.
+    """
+
+    command, _timeout = fake_adb.run_calls[-1]
+    parsed: dict = {
+        "action": None,
+        "mime": None,
+        "component": None,
+        "categories": [],
+        "extras": {},
+        "flags": [],
+    }
+    index = 0
+    while index < len(command):
+        token = command[index]
+        if token == "-a":
+            parsed["action"] = command[index + 1]
+            index += 2
+        elif token == "-t":
+            parsed["mime"] = command[index + 1]
+            index += 2
+        elif token == "-c":
+            parsed["categories"].append(command[index + 1])
+            index += 2
+        elif token == "-n":
+            parsed["component"] = command[index + 1]
+            index += 2
+        elif token in ("-e", "--es", "--eu"):
+            parsed["extras"][command[index + 1]] = command[index + 2]
+            index += 3
+        elif token.startswith("--"):
+            parsed["flags"].append(token)
+            index += 1
+        else:
+            index += 1
+    return parsed
+
+
+def test_instagram_share_does_not_include_text(sample_media, automation):
+    automation.publish_post("instagram", text="ignored", media=[sample_media])
+
+    intent = _last_intent(automation.adb)
+    assert "android.intent.extra.TEXT" not in intent["extras"]
+    assert "android.intent.extra.STREAM" in intent["extras"]
+
+
+def test_other_networks_keep_text_extra(mp4_media, automation):
+    automation.publish_post("twitter", text="caption", media=[mp4_media])
+
+    intent = _last_intent(automation.adb)
+    assert intent["extras"]["android.intent.extra.TEXT"] == "caption"
+    assert "--grant-read-uri-permission" in intent["flags"]
+
+
+def test_share_command_includes_default_category(sample_media, automation):
+    automation.publish_post("facebook", text="hello", media=[sample_media])
+
+    intent = _last_intent(automation.adb)
+    assert "android.intent.category.DEFAULT" in intent["categories"]
 
 
 def test_publish_post_launches_activity_when_requested(automation):
@@ -182,42 +486,47 @@ def test_publish_post_custom_launch_activity(automation):
     assert component == "com.facebook.katana/.ComposerActivity"
 
 
+#: Pre-encoded plan payload; skips a json.dumps + UTF-8 encode per run.
+_PLAN_LIST = b'[{"app": "twitter"}]'
+
+
 def test_load_batch_plan_accepts_list(tmp_path):
-    plan = [{"app": "twitter"}]
     path = tmp_path / "plan.json"
-    path.write_text(json.dumps(plan))
+    path.write_bytes(_PLAN_LIST)
 
     loaded = _load_batch_plan(path)
-    assert loaded == plan
+    assert loaded == [{"app": "twitter"}]
 
 
-def test_load_batch_plan_accepts_wrapped_object(tmp_path):
+def test_parse_batch_plan_accepts_wrapped_object():
     plan = {"posts": [{"app": "facebook"}]}
-    path = tmp_path / "plan.json"
-    path.write_text(json.dumps(plan))
-
-    loaded = _load_batch_plan(path)
-    assert loaded == plan["posts"]
 
+    assert _parse_batch_plan(plan) == plan["posts"]
 
-def test_load_batch_plan_invalid_structure(tmp_path):
-    path = tmp_path / "plan.json"
-    path.write_text(json.dumps({"wrong": []}))
 
+def test_parse_batch_plan_invalid_structure():
     with pytest.raises(ValueError):
-        _load_batch_plan(path)
+        _parse_batch_plan({"wrong": []})
+
+
+def _counting_chat_completion(calls):
+    """ChatCompletion stand-in whose replies number the calls it has seen."""
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        return {"choices": [{"message": {"content": f"text {len(calls)}"}}]}
+
+    return SimpleNamespace(create=create)
 
 
 def test_content_generator_openai(monkeypatch):
     calls = {}
 
-    class DummyChatCompletion:
-        @staticmethod
-        def create(**kwargs):
-            calls.update(kwargs)
-            return {"choices": [{"message": {"content": "Generated text  "}}]}
+    def _create(**kwargs):
+        calls.update(kwargs)
+        return {"choices": [{"message": {"content": "Generated text  "}}]}
 
-    dummy_module = SimpleNamespace(ChatCompletion=DummyChatCompletion, api_key=None)
+    dummy_module = _make_openai_stub(SimpleNamespace(create=_create))
     monkeypatch.setitem(sys.modules, "openai", dummy_module)
     monkeypatch.setenv("OPENAI_API_KEY", "secret")
 
@@ -233,6 +542,72 @@ def test_content_generator_openai(monkeypatch):
     assert dummy_module.api_key == "secret"
 
 
+def test_content_generator_memoizes_deterministic_generations(monkeypatch):
+    calls = []
+
+    monkeypatch.setitem(sys.modules, "openai", _make_openai_stub(_counting_chat_completion(calls)))
+    monkeypatch.setenv("OPENAI_API_KEY", "secret")
+    # Keep the test hermetic: exercise only the in-memory layer.
+    monkeypatch.setattr("controller.bliss_social_automation._llm_disk_cache_failed", True)
+
+    generator = ContentGenerator(provider="openai", model="test-model", temperature=0)
+
+    assert generator.generate("Write a post") == "text 1"
+    assert generator.generate("Write a post") == "text 1"
+    assert len(calls) == 1
+
+    generator.clear_cache()
+    assert generator.generate("Write a post") == "text 2"
+    assert len(calls) == 2
+
+
+def test_content_generator_does_not_cache_stochastic_generations(monkeypatch):
+    calls = []
+
+    monkeypatch.setitem(sys.modules, "openai", _make_openai_stub(_counting_chat_completion(calls)))
+    monkeypatch.setenv("OPENAI_API_KEY", "secret")
+
+    generator = ContentGenerator(provider="openai", model="test-model", temperature=0.7)
+
+    assert generator.generate("Write a post") == "text 1"
+    assert generator.generate("Write a post") == "text 2"
+    assert len(calls) == 2
+
+
+def test_content_generator_shares_disk_cache_across_instances(monkeypatch):
+    calls = []
+    store = {}
+
+    class DummyCache:
+        def __init__(self, path):
+            store["path"] = path
+
+        def get(self, key):
+            return store.get(key)
+
+        def set(self, key, value):
+            store[key] = value
+
+    monkeypatch.setitem(sys.modules, "openai", _make_openai_stub(_counting_chat_completion(calls)))
+    monkeypatch.setenv("OPENAI_API_KEY", "secret")
+    monkeypatch.setattr("controller.bliss_social_automation.diskcache", SimpleNamespace(Cache=DummyCache))
+    monkeypatch.setattr("controller.bliss_social_automation._llm_disk_cache_instance", None)
+    monkeypatch.setattr("controller.bliss_social_automation._llm_disk_cache_failed", False)
+
+    first = ContentGenerator(provider="openai", model="test-model", temperature=0)
+    assert first.generate("Write a post") == "text 1"
+
+    # A brand-new instance has an empty in-memory cache but finds the
+    # response on disk, so no second API call happens.
+    second = ContentGenerator(provider="openai", model="test-model", temperature=0)
+    assert second.generate("Write a post") == "text 1"
+    assert len(calls) == 1
+
+    # Opting out of caching always reaches the provider.
+    assert second.generate("Write a post", use_cache=False) == "text 2"
+    assert len(calls) == 2
+
+
 def test_content_generator_huggingface(monkeypatch):
     captured = {}
 
@@ -248,7 +623,7 @@ def test_content_generator_huggingface(monkeypatch):
 
         return runner
 
-    monkeypatch.setitem(sys.modules, "transformers", SimpleNamespace(pipeline=fake_pipeline))
+    monkeypatch.setitem(sys.modules, "transformers", _make_hf_stub(fake_pipeline))
 
     generator = ContentGenerator(provider="huggingface", model="distilgpt2", temperature=0.8, max_tokens=64)
     text = generator.generate("Compose", system_prompt="Guidelines")
@@ -261,109 +636,209 @@ def test_content_generator_huggingface(monkeypatch):
     assert captured["params"]["max_new_tokens"] == 64
 
 
-def test_content_generator_huggingface_auto_detects_gpu(monkeypatch):
-    captured = {}
-
-    def fake_pipeline(task, model=None, **kwargs):
-        captured.update({"task": task, "model": model, "kwargs": kwargs})
+def test_content_generator_generate_stream_uses_hf_streamer(monkeypatch):
+    events = []
 
-        def runner(prompt, **_params):
-            return [{"generated_text": "GPU"}]
+    class FakeStreamer:
+        def __init__(self, tokenizer, **kwargs):
+            events.append(("streamer", kwargs))
 
-        return runner
+        def __iter__(self):
+            return iter(["Hello ", "world"])
 
-    class FakeCuda:
+    class FakeModel:
         @staticmethod
-        def is_available():
-            return True
+        def generate(**kwargs):
+            events.append(("generate", kwargs))
 
-        @staticmethod
-        def device_count():
-            return 1
+    class FakeTokenizer:
+        def __call__(self, text, return_tensors=None):
+            events.append(("tokenize", text))
+            return {"input_ids": [1, 2]}
 
-    monkeypatch.setitem(sys.modules, "torch", SimpleNamespace(cuda=FakeCuda()))
-    monkeypatch.setitem(sys.modules, "transformers", SimpleNamespace(pipeline=fake_pipeline))
-    monkeypatch.delenv("BLISS_HF_DEVICE", raising=False)
+    class FakePipeline:
+        tokenizer = FakeTokenizer()
+        model = FakeModel()
 
-    generator = ContentGenerator(provider="huggingface", model="gpt2")
-    assert captured["kwargs"].get("device") == 0
-    assert generator.generate("Hi") == "GPU"
+    def fake_pipeline(task, model=None, **kwargs):
+        return FakePipeline()
+
+    monkeypatch.setitem(
+        sys.modules,
+        "transformers",
+        _make_hf_stub(fake_pipeline, TextIteratorStreamer=FakeStreamer),
+    )
+
+    generator = ContentGenerator(provider="huggingface", model="gpt2", max_tokens=16)
+    pieces = list(generator.generate_stream("Hi", system_prompt="Rules"))
+
+    assert pieces == ["Hello ", "world"]
+    assert ("tokenize", "Rules\nHi") in events
+    generate_kwargs = dict(events)["generate"]
+    assert generate_kwargs["max_new_tokens"] == 16
+    assert isinstance(generate_kwargs["streamer"], FakeStreamer)
 
 
-def test_content_generator_huggingface_respects_device_env(monkeypatch):
+def test_content_generator_generate_many_batches_huggingface_prompts(monkeypatch):
     captured = {}
 
     def fake_pipeline(task, model=None, **kwargs):
-        captured["kwargs"] = kwargs
-
-        def runner(prompt, **_params):
-            return [{"generated_text": "Manual"}]
+        def runner(prompts, **params):
+            captured["prompts"] = prompts
+            captured["params"] = params
+            return [[{"generated_text": f"out {prompt}"}] for prompt in prompts]
 
         return runner
 
-    class FakeCuda:
-        @staticmethod
-        def is_available():
-            return True
+    monkeypatch.setitem(sys.modules, "transformers", _make_hf_stub(fake_pipeline))
 
-        @staticmethod
-        def device_count():
-            return 2
+    generator = ContentGenerator(provider="huggingface", model="distilgpt2", max_tokens=32)
+    texts = generator.generate_many(["one", "two"], system_prompt="Rules")
 
-    monkeypatch.setitem(sys.modules, "torch", SimpleNamespace(cuda=FakeCuda()))
-    monkeypatch.setitem(sys.modules, "transformers", SimpleNamespace(pipeline=fake_pipeline))
-    monkeypatch.setenv("BLISS_HF_DEVICE", "cuda:1")
+    assert texts == ["out Rules\none", "out Rules\ntwo"]
+    assert captured["prompts"] == ["Rules\none", "Rules\ntwo"]
+    assert captured["params"]["batch_size"] == 2
+    assert captured["params"]["max_new_tokens"] == 32
 
-    generator = ContentGenerator(provider="huggingface", model="gpt2")
-    assert captured["kwargs"].get("device") == 1
-    assert generator.generate("Hi") == "Manual"
 
+def test_publish_batch_pregenerates_texts_in_one_pass(monkeypatch, automation):
+    calls = []
+
+    class DummyGenerator:
+        def generate_many(self, prompts, system_prompt=None):
+            calls.append((list(prompts), system_prompt))
+            return [f"generated {prompt}" for prompt in prompts]
+
+    monkeypatch.setattr(
+        "controller.bliss_social_automation.ContentGenerator", lambda: DummyGenerator()
+    )
+
+    plans = [
+        {"app": "twitter", "generation_prompt": "first", "system_prompt": "Rules"},
+        {"app": "facebook", "text": "explicit"},
+        {"app": "threads", "generation_prompt": "second", "system_prompt": "Rules"},
+    ]
+
+    results = automation.publish_batch(plans)
+
+    assert calls == [(["first", "second"], "Rules")]
+    assert [entry["status"] for entry in results] == ["ok", "ok", "ok"]
+
+
+def test_generate_post_text_batch_routes_through_generate_many(automation):
+    calls = []
+
+    class DummyGenerator:
+        def generate_many(self, prompts, system_prompt=None):
+            calls.append((list(prompts), system_prompt))
+            return [f"generated {prompt}" for prompt in prompts]
+
+    texts = automation.generate_post_text_batch(
+        ["first", "second"], generator=DummyGenerator(), system_prompt="Rules"
+    )
+
+    assert texts == ["generated first", "generated second"]
+    assert calls == [(["first", "second"], "Rules")]
+
+
+def test_publish_batch_reuses_one_generator_across_batches(monkeypatch, automation):
+    instances = []
+
+    class DummyGenerator:
+        def __init__(self):
+            instances.append(self)
+
+        def generate_many(self, prompts, system_prompt=None):
+            return [f"generated {prompt}" for prompt in prompts]
+
+    monkeypatch.setattr("controller.bliss_social_automation.ContentGenerator", DummyGenerator)
+
+    plans = [{"app": "twitter", "generation_prompt": "first"}]
+    automation.publish_batch(plans)
+    automation.publish_batch(plans)
+
+    assert len(instances) == 1
+
+
+def _fake_torch(available: bool, count: int, *, dtypes: bool = False) -> SimpleNamespace:
+    """Build a ``torch`` module shim with the given CUDA visibility."""
+
+    attrs = {
+        "cuda": SimpleNamespace(
+            is_available=lambda: available, device_count=lambda: count
+        )
+    }
+    if dtypes:
+        attrs.update(bfloat16="bf16", float16="fp16")
+    return SimpleNamespace(**attrs)
+
+
+def _install_hf_stubs(monkeypatch, *, cuda_available=True, device_count=1, dtypes=False):
+    """Install torch/transformers shims once and return the capture dict.
+
+    The five device-selection scenarios only differ in environment variables
+    and CUDA availability, so the stub wiring lives here instead of being
+    repeated per test.
+    """
 
-def test_content_generator_huggingface_device_auto_map(monkeypatch):
     captured = {}
 
     def fake_pipeline(task, model=None, **kwargs):
         captured["kwargs"] = kwargs
 
         def runner(prompt, **_params):
-            return [{"generated_text": "AutoMap"}]
+            return [{"generated_text": "HF"}]
 
         return runner
 
-    class FakeCuda:
-        @staticmethod
-        def is_available():
-            return True
-
-        @staticmethod
-        def device_count():
-            return 1
-
-    monkeypatch.setitem(sys.modules, "torch", SimpleNamespace(cuda=FakeCuda()))
-    monkeypatch.setitem(sys.modules, "transformers", SimpleNamespace(pipeline=fake_pipeline))
-    monkeypatch.setenv("BLISS_HF_DEVICE", "auto")
+    monkeypatch.setitem(
+        sys.modules, "torch", _fake_torch(cuda_available, device_count, dtypes=dtypes)
+    )
+    monkeypatch.setitem(sys.modules, "transformers", _make_hf_stub(fake_pipeline))
+    return captured
+
+
+@pytest.mark.parametrize(
+    ("env", "dtypes", "device_count", "expected", "absent"),
+    [
+        ({}, False, 1, {"device": 0}, ()),
+        ({}, True, 1, {"device": 0, "torch_dtype": "bf16"}, ()),
+        (
+            {"BLISS_HF_DTYPE": "float16", "BLISS_HF_LOAD_IN_8BIT": "1"},
+            True,
+            1,
+            {"torch_dtype": "fp16", "model_kwargs": {"load_in_8bit": True}},
+            ("device",),
+        ),
+        ({"BLISS_HF_DEVICE": "cuda:1"}, False, 2, {"device": 1}, ()),
+        ({"BLISS_HF_DEVICE": "auto"}, False, 1, {"device_map": "auto"}, ("device",)),
+    ],
+    ids=["auto-gpu", "bfloat16-default", "dtype-and-8bit-env", "device-env", "device-auto-map"],
+)
+def test_content_generator_huggingface_device_selection(
+    monkeypatch, env, dtypes, device_count, expected, absent
+):
+    captured = _install_hf_stubs(monkeypatch, device_count=device_count, dtypes=dtypes)
+    for name in ("BLISS_HF_DEVICE", "BLISS_HF_DTYPE", "BLISS_HF_LOAD_IN_8BIT"):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
 
     generator = ContentGenerator(provider="huggingface", model="gpt2")
-    assert captured["kwargs"].get("device_map") == "auto"
-    assert "device" not in captured["kwargs"]
-    assert generator.generate("Hi") == "AutoMap"
+
+    for key, value in expected.items():
+        assert captured["kwargs"].get(key) == value
+    for key in absent:
+        assert key not in captured["kwargs"]
+    assert generator.generate("Hi") == "HF"
 
 
 def test_content_generator_huggingface_cuda_without_gpu(monkeypatch):
     def fake_pipeline(*_args, **_kwargs):  # pragma: no cover - should not be invoked
         raise AssertionError("pipeline should not be called when CUDA is unavailable")
 
-    class FakeCuda:
-        @staticmethod
-        def is_available():
-            return False
-
-        @staticmethod
-        def device_count():
-            return 0
-
-    monkeypatch.setitem(sys.modules, "torch", SimpleNamespace(cuda=FakeCuda()))
-    monkeypatch.setitem(sys.modules, "transformers", SimpleNamespace(pipeline=fake_pipeline))
+    monkeypatch.setitem(sys.modules, "torch", _fake_torch(False, 0))
+    monkeypatch.setitem(sys.modules, "transformers", _make_hf_stub(fake_pipeline))
     monkeypatch.setenv("BLISS_HF_DEVICE", "cuda")
 
     with pytest.raises(ContentGeneratorError):
@@ -371,7 +846,7 @@ def test_content_generator_huggingface_cuda_without_gpu(monkeypatch):
 
 
 def test_content_generator_missing_key(monkeypatch):
-    monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(ChatCompletion=SimpleNamespace(create=lambda **_: None), api_key=None))
+    monkeypatch.setitem(sys.modules, "openai", _make_openai_stub(SimpleNamespace(create=lambda **_: None)))
     monkeypatch.delenv("OPENAI_API_KEY", raising=False)
 
     with pytest.raises(ContentGeneratorError):
@@ -403,14 +878,13 @@ def test_publish_post_generates_text(monkeypatch, automation):
 def test_generate_post_text_uses_options(monkeypatch):
     created = {}
 
-    class DummyGenerator:
-        def __init__(self, **kwargs):
-            created.update(kwargs)
-
-        def generate(self, prompt, system_prompt=None):
-            return f"text:{prompt}:{system_prompt}"
+    def _dummy_generator(**kwargs):
+        created.update(kwargs)
+        return SimpleNamespace(
+            generate=lambda prompt, system_prompt=None: f"text:{prompt}:{system_prompt}"
+        )
 
-    monkeypatch.setattr("controller.bliss_social_automation.ContentGenerator", DummyGenerator)
+    monkeypatch.setattr("controller.bliss_social_automation.ContentGenerator", _dummy_generator)
 
     automation = BlissSocialAutomation(adb=FakeADB())
     text = automation.generate_post_text(
@@ -444,7 +918,8 @@ def test_adb_client_resolves_host_port_env(monkeypatch):
     assert client.connect_address == "10.0.0.5:5555"
 
 
-def test_ppadb_client_mirrors_core_operations(monkeypatch, tmp_path):
+@pytest.mark.slow
+def test_ppadb_client_mirrors_core_operations(monkeypatch, apk_file, sample_media):
     commands = []
     installs = []
     uninstalls = []
@@ -464,7 +939,9 @@ def test_ppadb_client_mirrors_core_operations(monkeypatch, tmp_path):
 
         @staticmethod
         def install(path, reinstall=False):
-            installs.append((Path(path), reinstall))
+            # Stored verbatim; the client hands over plain strings and the
+            # assertions below compare on strings too.
+            installs.append((path, reinstall))
             return "Success"
 
         @staticmethod
@@ -474,22 +951,20 @@ def test_ppadb_client_mirrors_core_operations(monkeypatch, tmp_path):
 
         @staticmethod
         def push(source, destination):
-            pushes.append((Path(source), destination))
+            pushes.append((source, destination))
 
     class DummyClient:
         def __init__(self, host, port):
             self.host = host
             self.port = port
-            self._devices = [DummyDevice()]
+            # Keyed by serial; device() becomes an O(1) dict probe.
+            self._devices = {DummyDevice.serial: DummyDevice()}
 
         def devices(self):
-            return list(self._devices)
+            return list(self._devices.values())
 
         def device(self, serial):
-            for device in self._devices:
-                if device.serial == serial:
-                    return device
-            return None
+            return self._devices.get(serial)
 
         @staticmethod
         def remote_connect(host, port):
@@ -513,21 +988,17 @@ def test_ppadb_client_mirrors_core_operations(monkeypatch, tmp_path):
     assert shell_result.stdout.strip() == "OK"
     assert commands[-1][0] == "am start"
 
-    apk = tmp_path / "app.apk"
-    apk.write_bytes(b"binary")
-    install_result = client.run(["install", str(apk)])
+    install_result = client.run(["install", str(apk_file)])
     assert "Success" in install_result.stdout
-    assert installs == [(apk, False)]
+    assert installs == [(str(apk_file), False)]
 
     uninstall_result = client.run(["uninstall", "com.example.app"])
     assert "Success" in uninstall_result.stdout
     assert uninstalls == [("com.example.app", False)]
 
-    media = tmp_path / "photo.jpg"
-    media.write_bytes(b"data")
-    push_result = client.run(["push", str(media), "/sdcard/photo.jpg"])
+    push_result = client.run(["push", str(sample_media), "/sdcard/photo.jpg"])
     assert "photo.jpg" in push_result.stdout
-    assert pushes == [(media, "/sdcard/photo.jpg")]
+    assert pushes == [(str(sample_media), "/sdcard/photo.jpg")]
     client.ensure_remote_directory("/sdcard/Created")
     assert commands[-1][0] == "mkdir -p /sdcard/Created"
 
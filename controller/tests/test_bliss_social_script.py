@@ -2,10 +2,15 @@ from pathlib import Path
 
 import pytest
 
-from controller.bliss_social_automation import ADBCommandError, ContentGeneratorError
+from controller.bliss_social_automation import (
+    ADBCommandError,
+    BlissSocialAutomation,
+    ContentGeneratorError,
+)
 from controller.bliss_social_script import (
     SOCIAL_NETWORKS,
     PostRequest,
+    ensure_automation,
     generate_content,
     install_app,
     launch_app,
@@ -15,7 +20,21 @@ from controller.bliss_social_script import (
 
 
 class DummyAutomation:
+    # Slots skip the per-instance __dict__ and give attribute access a
+    # direct descriptor path.
+    __slots__ = (
+        "ensure_calls",
+        "install_calls",
+        "launch_calls",
+        "push_calls",
+        "publish_calls",
+        "generate_calls",
+    )
+
     def __init__(self):
+        self.reset_recorded_calls()
+
+    def reset_recorded_calls(self):
         self.ensure_calls = []
         self.install_calls = []
         self.launch_calls = []
@@ -47,11 +66,23 @@ class DummyAutomation:
         return f"generated:{prompt}"
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def automation():
+    # One dummy per module; the autouse reset below wipes the call lists
+    # between tests.
     return DummyAutomation()
 
 
+@pytest.fixture(autouse=True)
+def _reset_recording(automation):
+    automation.reset_recorded_calls()
+
+
+def test_ensure_automation_supports_no_arg_and_keyword_forms(automation):
+    assert ensure_automation(device=automation) is automation
+    assert isinstance(ensure_automation(), BlissSocialAutomation)
+
+
 def test_install_app_without_apk_checks_existing(automation):
     message = install_app("facebook", device=automation)
 
@@ -59,9 +90,9 @@ def test_install_app_without_apk_checks_existing(automation):
     assert automation.ensure_calls == [SOCIAL_NETWORKS["facebook"].app]
 
 
-def test_install_app_with_apk_invokes_underlying_controller(tmp_path, automation):
-    apk = tmp_path / "app.apk"
-    apk.write_bytes(b"binary")
+def test_install_app_with_apk_invokes_underlying_controller(automation):
+    # DummyAutomation only records the path, so no real file is needed.
+    apk = Path("/tmp/fake/app.apk")
 
     result = install_app("instagram", apk, device=automation, reinstall=True)
 
@@ -78,10 +109,8 @@ def test_launch_app_uses_network_configuration(automation):
     ]
 
 
-def test_upload_file_pushes_to_default_directory(tmp_path, automation):
-    files = [tmp_path / "photo.jpg", tmp_path / "video.mp4"]
-    for item in files:
-        item.write_bytes(b"data")
+def test_upload_file_pushes_to_default_directory(automation):
+    files = [Path("/tmp/fake/photo.jpg"), Path("/tmp/fake/video.mp4")]
 
     uploads = upload_file("threads", files, device=automation)
 
@@ -90,9 +119,8 @@ def test_upload_file_pushes_to_default_directory(tmp_path, automation):
     assert list(uploads) == [str(path) for path in files]
 
 
-def test_post_to_social_converts_request_data(tmp_path, automation):
-    media = tmp_path / "image.jpg"
-    media.write_bytes(b"image")
+def test_post_to_social_converts_request_data(automation):
+    media = Path("/tmp/fake/image.jpg")
     request = PostRequest(
         text="Hello",
         subject="Greetings",
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
+from types import SimpleNamespace
 from typing import List
 
 import pytest
@@ -8,18 +10,6 @@ import pytest
 from controller import app
 
 
-class DummyResult:
-    def __init__(self, returncode: int = 0, stdout: str = "", stderr: str = "") -> None:
-        self.returncode = returncode
-        self.stdout = stdout
-        self.stderr = stderr
-
-
-@pytest.fixture(autouse=True)
-def reset_bliss_openapi_cache() -> None:
-    app._load_bliss_openapi.cache_clear()
-
-
 def test_deploy_renders_placeholders_with_whitespace(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     calls: List[List[str]] = []
 
@@ -28,11 +18,11 @@ def test_deploy_renders_placeholders_with_whitespace(monkeypatch: pytest.MonkeyP
 
     monkeypatch.setattr(app, "_require_pve_ssh", lambda: ("host", "user", str(key_path)))
 
-    def fake_run(cmd, *, capture_output, text, timeout, **_kwargs):  # type: ignore[no-untyped-def]
+    def fake_run(cmd, *, timeout, **_kwargs):  # type: ignore[no-untyped-def]
         calls.append(cmd)
-        return DummyResult(returncode=0, stdout="ok", stderr="")
+        return SimpleNamespace(returncode=0, stdout="ok", stderr="")
 
-    monkeypatch.setattr(app.subprocess, "run", fake_run)
+    monkeypatch.setattr(app, "_run_capped", fake_run)
 
     spec = app.DeploySpec(
         target_vmid=101,
@@ -42,7 +32,7 @@ def test_deploy_renders_placeholders_with_whitespace(monkeypatch: pytest.MonkeyP
         commands=["echo {{ repo_url }} {{ workdir }}"],
     )
 
-    result = app.deploy(spec)
+    result = asyncio.run(app.deploy(spec))
 
     assert result["ok"] is True
     assert calls, "Expected deploy to invoke ssh command"
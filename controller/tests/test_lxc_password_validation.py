@@ -7,34 +7,42 @@ import pytest
 from controller.app import CreateLXCReq
 
 
-def _base_payload(**overrides):
-    payload = {
-        "vmid": 999,
-        "hostname": "ct-999",
-        "cores": 1,
-        "memory": 512,
-        "storage": "local-lvm",
-        "rootfs_gb": 8,
-        "bridge": "vmbr0",
-        "ip_cidr": "dhcp",
-        "ostemplate": "local:vztmpl/debian-12-standard_12.2-1_amd64.tar.zst",
-    }
-    payload.update(overrides)
-    return payload
-
-
-def test_password_uses_default_minimum_length(monkeypatch):
-    monkeypatch.delenv("LXC_PASSWORD_MIN_LENGTH", raising=False)
-
-    with pytest.raises(ValueError) as excinfo:
-        CreateLXCReq(**_base_payload(password="1234"))
+#: Built once; _base_payload only performs the C-level dict merge.
+_BASE_PAYLOAD = {
+    "vmid": 999,
+    "hostname": "ct-999",
+    "cores": 1,
+    "memory": 512,
+    "storage": "local-lvm",
+    "rootfs_gb": 8,
+    "bridge": "vmbr0",
+    "ip_cidr": "dhcp",
+    "ostemplate": "local:vztmpl/debian-12-standard_12.2-1_amd64.tar.zst",
+}
 
-    assert "at least 5 characters" in str(excinfo.value)
 
-
-def test_password_respects_environment_override(monkeypatch):
-    monkeypatch.setenv("LXC_PASSWORD_MIN_LENGTH", "4")
-
-    req = CreateLXCReq(**_base_payload(password="1023"))
-
-    assert req.password == "1023"
+def _base_payload(**overrides):
+    return {**_BASE_PAYLOAD, **overrides}
+
+
+@pytest.mark.parametrize(
+    ("min_length_env", "password", "expected_error"),
+    [
+        (None, "1234", "at least 5 characters"),
+        ("4", "1023", None),
+    ],
+    ids=["default-minimum", "env-override"],
+)
+def test_password_minimum_length(monkeypatch, min_length_env, password, expected_error):
+    if min_length_env is None:
+        monkeypatch.delenv("LXC_PASSWORD_MIN_LENGTH", raising=False)
+    else:
+        monkeypatch.setenv("LXC_PASSWORD_MIN_LENGTH", min_length_env)
+
+    if expected_error is not None:
+        with pytest.raises(ValueError) as excinfo:
+            CreateLXCReq(**_base_payload(password=password))
+        assert expected_error in str(excinfo.value)
+    else:
+        req = CreateLXCReq(**_base_payload(password=password))
+        assert req.password == password
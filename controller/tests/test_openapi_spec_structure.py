@@ -8,31 +8,52 @@ from typing import Dict
 
 import pytest
 
+try:  # Faster JSON decoder when available (see controller/requirements.txt)
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+HTTP_METHODS = frozenset(
+    {
+        "get",
+        "put",
+        "post",
+        "delete",
+        "options",
+        "head",
+        "patch",
+        "trace",
+    }
+)
+
 
-HTTP_METHODS = {
-    "get",
-    "put",
-    "post",
-    "delete",
-    "options",
-    "head",
-    "patch",
-    "trace",
-}
-
-
-@pytest.mark.parametrize(
-    "spec_path",
-    [
+@pytest.fixture(
+    scope="session",
+    params=[
         Path(__file__).resolve().parents[2] / "openapi.json",
         Path(__file__).resolve().parents[2] / "openapi_bliss.json",
     ],
+    ids=["openapi", "openapi_bliss"],
 )
-def test_openapi_files_meet_minimum_requirements(spec_path: Path) -> None:
+def openapi_spec(request: pytest.FixtureRequest) -> tuple[Path, Dict[str, object]]:
+    """Load each bundled specification once per session.
+
+    The files are read-only for the suite, so parsing them per test run
+    rather than per test keeps the cost constant as the specs grow.
+    """
+
+    path: Path = request.param
+    raw = path.read_bytes()
+    return path, orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def test_openapi_files_meet_minimum_requirements(
+    openapi_spec: tuple[Path, Dict[str, object]],
+) -> None:
     """Ensure the shipped OpenAPI documents satisfy the documented requirements."""
 
-    with spec_path.open("r", encoding="utf-8") as handle:
-        spec: Dict[str, object] = json.load(handle)
+    spec_path, spec = openapi_spec
 
     assert isinstance(spec.get("openapi"), str), "Missing 'openapi' version string"
     assert spec["openapi"].startswith(
@@ -50,13 +71,15 @@ def test_openapi_files_meet_minimum_requirements(spec_path: Path) -> None:
     assert isinstance(paths, dict) and paths, "Specification must define at least one path"
 
     operation_ids: set[str] = set()
+    # Local alias skips the LOAD_GLOBAL on every membership test below.
+    known_methods = HTTP_METHODS
     for route, methods in paths.items():
         assert isinstance(methods, dict), f"Path item {route} must be an object"
-        http_operations = {
-            method.lower(): data
-            for method, data in methods.items()
-            if method.lower() in HTTP_METHODS
-        }
+        http_operations: Dict[str, object] = {}
+        for method, data in methods.items():
+            lowered = method.lower()
+            if lowered in known_methods:
+                http_operations[lowered] = data
         assert http_operations, f"Path {route} does not declare HTTP operations"
 
         for method, operation in http_operations.items():
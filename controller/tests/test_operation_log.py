@@ -5,13 +5,6 @@ import pytest
 from controller import app
 
 
-@pytest.fixture(autouse=True)
-def clear_operation_log() -> None:
-    app._clear_operation_log()
-    yield
-    app._clear_operation_log()
-
-
 class DummyLXCResource:
     def __init__(self, recorder: Dict[str, object]) -> None:
         self._recorder = recorder
@@ -35,10 +28,21 @@ class DummyProxmox:
         return DummyNodeResource(self._recorder)
 
 
+#: Shared stand-in hierarchy; stateless apart from the recorder dict,
+#: which the autouse fixture below empties between tests.
+_RECORDER: Dict[str, object] = {}
+_DUMMY_PROXMOX = DummyProxmox(_RECORDER)
+
+
+@pytest.fixture(autouse=True)
+def _reset_recorder() -> None:
+    _RECORDER.clear()
+
+
 def test_create_lxc_records_operation(monkeypatch: pytest.MonkeyPatch) -> None:
-    recorder: Dict[str, object] = {}
+    recorder = _RECORDER
 
-    monkeypatch.setattr(app, "get_proxmox", lambda: DummyProxmox(recorder))
+    monkeypatch.setattr(app, "get_proxmox", lambda: _DUMMY_PROXMOX)
     monkeypatch.setenv("LXC_PASSWORD_MIN_LENGTH", "4")
 
     req = app.CreateLXCReq(
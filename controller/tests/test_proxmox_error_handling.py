@@ -8,13 +8,6 @@ from proxmoxer.core import ResourceException
 from controller import app
 
 
-@pytest.fixture(autouse=True)
-def clear_operation_log() -> None:
-    app._clear_operation_log()
-    yield
-    app._clear_operation_log()
-
-
 class FailingLXCResource:
     def post(self, **payload: object) -> None:
         raise ResourceException(
@@ -53,8 +46,13 @@ class DNSFailingProxmox:
         return DNSFailingNodeResource()
 
 
+#: Both stand-ins are stateless, so one of each serves every test.
+_FAILING_PROXMOX = FailingProxmox()
+_DNS_FAILING_PROXMOX = DNSFailingProxmox()
+
+
 def test_create_lxc_surfaces_proxmox_error(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(app, "get_proxmox", lambda: FailingProxmox())
+    monkeypatch.setattr(app, "get_proxmox", lambda: _FAILING_PROXMOX)
     monkeypatch.setattr(app, "_default_node", lambda prox, node: "pve")
 
     req = app.CreateLXCReq(
@@ -85,7 +83,7 @@ def test_create_lxc_surfaces_proxmox_error(monkeypatch: pytest.MonkeyPatch) -> N
 
 def test_create_lxc_dns_error(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("PROXMOX_HOST", "pve")
-    monkeypatch.setattr(app, "get_proxmox", lambda: DNSFailingProxmox())
+    monkeypatch.setattr(app, "get_proxmox", lambda: _DNS_FAILING_PROXMOX)
     monkeypatch.setattr(app, "_default_node", lambda prox, node: "pve")
 
     req = app.CreateLXCReq(
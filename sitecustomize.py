@@ -11,6 +11,22 @@ ROOT = Path(__file__).resolve().parent
 if str(ROOT) not in sys.path:  # pragma: no cover - depends on runner
     sys.path.insert(0, str(ROOT))
 
+def _dependency_available(name: str) -> bool:
+    """Cheaply probe for a real dependency without importing it.
+
+    A ``sys.modules`` hit or a successful ``find_spec`` is enough; the full
+    import (and its cost) is deferred to whoever actually uses the module,
+    which keeps interpreter start-up fast when the real packages exist.
+    """
+
+    if name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ModuleNotFoundError, ValueError):  # pragma: no cover - defensive
+        return False
+
+
 def _load_module(name: str, fallback_relative: str) -> object:
     fallback_path = ROOT.joinpath(fallback_relative)
     spec = importlib.util.spec_from_file_location(f"_{name}_fallback", fallback_path)
@@ -22,15 +38,11 @@ def _load_module(name: str, fallback_relative: str) -> object:
     return module
 
 
-try:  # pragma: no cover - prefer the real dependency when available
-    importlib.import_module("pydantic")
-except ModuleNotFoundError:  # pragma: no cover - exercised in tests
+if not _dependency_available("pydantic"):  # pragma: no cover - exercised in tests
     module = _load_module("pydantic", "controller/_pydantic_fallback.py")
     sys.modules.setdefault("pydantic", module)
 
-try:  # pragma: no cover - prefer the real dependency when available
-    importlib.import_module("fastapi")
-except ModuleNotFoundError:  # pragma: no cover - exercised in tests
+if not _dependency_available("fastapi"):  # pragma: no cover - exercised in tests
     fastapi_fallback = _load_module("fastapi", "controller/_fastapi_fallback.py")
     fastapi_module = types.ModuleType("fastapi")
     fastapi_module.FastAPI = fastapi_fallback.FastAPI
@@ -51,9 +63,7 @@ except ModuleNotFoundError:  # pragma: no cover - exercised in tests
     sys.modules.setdefault("fastapi.middleware", middleware_pkg)
     sys.modules.setdefault("fastapi.middleware.cors", cors_module)
 
-try:  # pragma: no cover - prefer the real dependency when available
-    importlib.import_module("proxmoxer")
-except ModuleNotFoundError:  # pragma: no cover - exercised in tests
+if not _dependency_available("proxmoxer"):  # pragma: no cover - exercised in tests
     proxmoxer_fallback = _load_module("proxmoxer", "controller/_proxmoxer_fallback.py")
     proxmoxer_pkg = types.ModuleType("proxmoxer")
     proxmoxer_pkg.ProxmoxAPI = proxmoxer_fallback.ProxmoxAPI